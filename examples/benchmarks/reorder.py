@@ -0,0 +1,38 @@
+"""Benchmark effect of `reorder()` on a randomly numbered hexa mesh. Reports
+bandwidth / profile and timing of gather heavy operations for each method.
+
+Call with number of hexas per dimension, for example:
+  $ python reorder.py 60
+"""
+
+import sys
+
+import numpy as np
+
+import gustaf as gus
+
+if __name__ == "__main__":
+    res = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+
+    volumes = gus.create.volumes.box(resolutions=[res + 1] * 3)
+    # random numbering, as often seen in loaded meshes
+    rng = np.random.default_rng(0)
+    volumes.update_vertices(rng.permutation(len(volumes.vertices)))
+    volumes.elements = volumes.elements[rng.permutation(len(volumes.volumes))]
+    print(f"{len(volumes.volumes)} hexas / {len(volumes.vertices)} vertices")
+
+    for method in ("random", "rcm", "hilbert", "morton"):
+        tic = gus.utils.Tic(method)
+        if method != "random":
+            volumes.reorder(method)
+            tic.toc("reorder")
+
+        for _ in range(10):
+            volumes.const_vertices[volumes.const_elements].mean(axis=1)
+        tic.toc("10 x element gather")
+        volumes.shrink()
+        tic.toc("shrink()")
+
+        bandwidth, profile = volumes.bandwidth()
+        print(f"[{method}] bandwidth: {bandwidth}, profile: {profile}")
+        tic.summary(log=False, print_=True)
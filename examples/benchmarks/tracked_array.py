@@ -0,0 +1,51 @@
+"""Benchmark bookkeeping overhead of TrackedArray against plain np.ndarray,
+for a smoothing-like loop that updates vertices in many small slices.
+Compares direct updates of `mesh.vertices`, updates within `mesh.edit()`
+and updates of a plain copy.
+
+Call with number of quads per dimension and number of iterations, for
+example:
+  $ python tracked_array.py 100 20
+"""
+
+import sys
+
+import numpy as np
+
+import gustaf as gus
+
+
+def smooth(vertices, n_iterations, chunk=64):
+    """moves vertices towards origin, chunk by chunk."""
+    for _ in range(n_iterations):
+        for i in range(0, len(vertices), chunk):
+            vertices[i : i + chunk] *= 0.99
+            vertices[i : i + chunk, 0] += 1e-3
+
+
+if __name__ == "__main__":
+    res = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    n_iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    faces = gus.create.faces.box(resolutions=[res + 1] * 2)
+    print(f"{len(faces.vertices)} vertices / {n_iterations} iterations")
+
+    tracked = faces.copy(deep=True)
+    edited = faces.copy(deep=True)
+    plain = np.array(faces.vertices)
+
+    tic = gus.utils.Tic("tracked array")
+    smooth(tracked.vertices, n_iterations)
+    tic.toc("TrackedArray")
+
+    with edited.edit() as arrays:
+        smooth(arrays.vertices, n_iterations)
+    tic.toc("edit()")
+
+    smooth(plain, n_iterations)
+    tic.toc("np.ndarray")
+
+    assert np.allclose(tracked.vertices, plain)
+    assert np.allclose(edited.vertices, plain)
+
+    tic.summary(log=False, print_=True)
@@ -0,0 +1,37 @@
+"""Benchmark `unique_edges()` using packed integer keys against the byte-row
+view of `gus.utils.arr.unique_rows()`.
+
+Call with number of edges, for example:
+  $ python unique_edges.py 10000000
+"""
+
+import sys
+
+import numpy as np
+
+import gustaf as gus
+
+if __name__ == "__main__":
+    n_edges = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    # quad faces have 4 edges each, where most of them appear twice
+    res = int((n_edges / 4) ** 0.5) + 1
+    faces = gus.create.faces.box(resolutions=[res, res])
+    sorted_edges = faces.sorted_edges()
+    print(f"{len(sorted_edges)} edges / {len(faces.vertices)} vertices")
+
+    tic = gus.utils.Tic("unique edges")
+    byte_view = gus.utils.arr.unique_rows(sorted_edges)
+    tic.toc("arr.unique_rows (byte view)")
+    packed = gus.utils.connec.sorted_unique(sorted_edges, sorted_=True)
+    tic.toc("connec.sorted_unique (packed keys)")
+    faces.unique_edges()
+    tic.toc("Faces.unique_edges()")
+
+    # same unique entries
+    assert len(byte_view[0]) == len(packed.values)
+    assert (np.sort(byte_view[3]) == np.sort(packed.counts)).all()
+
+    tic.summary(log=False, print_=True)
+    laps = np.diff(tic._laps)
+    print(f"speedup: {laps[0] / laps[1]:.2f}x")
@@ -5,14 +5,18 @@ from gustaf import (
     faces,
     helpers,
     io,
+    mixed,
     settings,
     show,
+    structured,
     utils,
     vertices,
     volumes,
 )
 from gustaf.edges import Edges
 from gustaf.faces import Faces
+from gustaf.mixed import Mixed
+from gustaf.structured import StructuredGrid
 from gustaf.vertices import Vertices
 from gustaf.volumes import Volumes
 
@@ -25,6 +29,8 @@ __all__ = [
     "edges",
     "faces",
     "volumes",
+    "mixed",
+    "structured",
     "show",
     "utils",
     "create",
@@ -34,4 +40,6 @@ __all__ = [
     "Edges",
     "Faces",
     "Volumes",
+    "Mixed",
+    "StructuredGrid",
 ]
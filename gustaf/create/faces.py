@@ -261,6 +261,8 @@ def vertex_normals(
     that are adjacent to a vertex are added with equal contributions, but it is
     also possible to use weightings by area of the adjacent element
     (`area_weighting`) or by the angle between edges at the corner vertex.
+    See `Faces.vertex_normals()`, which computes the same without modifying
+    faces.
 
     Parameters
     ----------
@@ -278,71 +280,20 @@ def vertex_normals(
     faces: Faces
       faces with vertex_data["normals"] computed.
     """
-    if not faces.whatami.startswith("tri"):
-        raise ValueError("Vertex normals only supports triangle faces")
+    if not faces.whatami.startswith(("tri", "quad")):
+        raise ValueError("Vertex normals only supports tri and quad faces")
 
     if faces.vertices.shape[1] != 3:
-        raise ValueError("Vertex normals only support 3d triangles")
+        raise ValueError("Vertex normals only support 3d faces")
 
     if return_original_ids:
         original_ids = np.where(faces.referenced_vertices())[0]
 
     faces.remove_unreferenced_vertices()
 
-    triangles = faces.vertices[faces.faces]
-
-    # compute (1 - 0) and (2 - 0)
-    edge_ab = triangles[:, 1] - triangles[:, 0]
-    edge_bc = triangles[:, 2] - triangles[:, 1]
-
-    # get normal of each faces and normalize
-    crossed = utils.arr.cross3d(edge_ab, edge_bc)
-    crossed_length = np.linalg.norm(crossed, axis=1).reshape(-1, 1)
-
-    weights = np.ones_like(crossed, dtype=settings.FLOAT_DTYPE)
-
-    # get area based weights
-    if area_weighting:
-        weights *= crossed_length
-    #     crossed /= crossed_length
-    # else:
-    crossed /= crossed_length
-
-    # get triangle corner angles (same as faces.faces)
-    if angle_weighting:
-        angles = np.empty_like(crossed, dtype=settings.FLOAT_DTYPE)
-        norm_ab = np.linalg.norm(edge_ab, axis=1)
-        norm_bc = np.linalg.norm(edge_bc, axis=1)
-        edge_ca = edge_ab + edge_bc
-        norm_ca = np.linalg.norm(edge_ca, axis=1)
-        np.arcsin(
-            crossed_length.ravel() / (norm_ab * norm_bc).ravel(),
-            out=angles[:, 0],
-        )
-        np.arccos(
-            np.einsum("ij,ij->i", edge_bc, edge_ca) / (norm_bc * norm_ca),
-            out=angles[:, 1],
-        )
-        angles[:, 2] = np.pi - angles[:, 0] - angles[:, 1]
-
-        weights *= angles
-
-    # initialize
-    normals = np.zeros_like(faces.vertices, dtype=settings.FLOAT_DTYPE)
-
-    # sum normals and weights
-    np.add.at(
-        normals, faces.faces[:, 0], crossed * weights[:, 0].reshape(-1, 1)
-    )
-    np.add.at(
-        normals, faces.faces[:, 1], crossed * weights[:, 1].reshape(-1, 1)
+    normals = faces.vertex_normals(
+        area_weighting=area_weighting, angle_weighting=angle_weighting
     )
-    np.add.at(
-        normals, faces.faces[:, 2], crossed * weights[:, 2].reshape(-1, 1)
-    )
-
-    # normalize
-    normals /= np.linalg.norm(normals, axis=1).reshape(-1, 1)
 
     faces.vertex_data["normals"] = normals
     if return_original_ids:
@@ -4,7 +4,7 @@ Routines to create volumes.
 
 import numpy as np
 
-from gustaf import create, utils
+from gustaf import create, helpers, settings, utils
 from gustaf.volumes import Volumes
 
 
@@ -39,3 +39,73 @@ def box(bounds=None, resolutions=None):
     volume_mesh = Volumes(vertex_mesh.vertices, connectivity)
 
     return volume_mesh
+
+
+def to_simplex(hexa, scheme="6tet", alternate=False):
+    """Given hexa volumes, splits them into tets. All hexas are split with a
+    single gather, see `utils.connec.hexa_to_tet()`. Boundary quads become
+    two triangles and `BC` face ids are mapped to them.
+
+    "6tet" cuts each quad face along the diagonal through its smallest
+    vertex id, which is conforming for any hexa mesh. Most hexas become six
+    tets, some of them five.
+
+    "5tet" always creates five tets per hexa. It is conforming only if
+    neighboring hexas are mirrored, which is what `alternate` does.
+
+    Parameters
+    ----------
+    hexa: Volumes
+    scheme: str
+      "6tet" or "5tet".
+    alternate: bool
+      Only for "5tet". Mirrors every other hexa, based on breadth first
+      search levels of element neighbors. Raises if this is not possible.
+
+    Returns
+    --------
+    tet: Volumes
+      Simplexifyed mesh.
+    """
+    if not isinstance(hexa, Volumes):
+        raise ValueError(
+            "Input to to_simplex needs to be of type Volumes, but it's "
+            f"{type(hexa)}"
+        )
+
+    if not hexa.whatami.startswith("hexa"):
+        utils.log.debug("Non hexahedral mesh provided, return original mesh.")
+        return hexa
+
+    mirror = None
+    if scheme == "5tet" and alternate:
+        neighbors = hexa.element_neighbors()
+        is_neighbor = neighbors >= 0
+        offsets = np.zeros(len(neighbors) + 1, dtype=settings.INT_DTYPE)
+        np.cumsum(is_neighbor.sum(axis=1), out=offsets[1:])
+        mirror = utils.connec.two_coloring(
+            helpers.data.Adjacency(offsets, neighbors[is_neighbor])
+        )
+        if (
+            mirror[np.nonzero(is_neighbor)[0]]
+            == mirror[neighbors[is_neighbor]]
+        ).any():
+            raise ValueError(
+                "Can't alternate 5tet split for this mesh. Try 6tet."
+            )
+
+    tets, parents, tet_faces = utils.connec.hexa_to_tet(
+        hexa.volumes, scheme=scheme, mirror=mirror
+    )
+
+    tet = Volumes(vertices=hexa.vertices.copy(), volumes=tets)
+
+    # hexa face id -> ids of tet faces on it
+    n_hexa_faces = hexa.volumes.shape[1] - 2
+    hexa_face_ids = np.where(
+        tet_faces >= 0, parents.reshape(-1, 1) * n_hexa_faces + tet_faces, -1
+    ).ravel()
+    for name, face_ids in hexa.BC.items():
+        tet.BC[name] = np.flatnonzero(np.isin(hexa_face_ids, face_ids))
+
+    return tet
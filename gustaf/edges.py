@@ -137,7 +137,7 @@ class Edges(Vertices):
         self._logd("setting edges")
 
         self._edges = helpers.data.make_tracked_array(
-            es, settings.INT_DTYPE, copy=False
+            es, settings.INT_DTYPE, copy=False, owner=(self, "_edges")
         )
 
         # shape check
@@ -176,7 +176,7 @@ class Edges(Vertices):
         """
         return "edges"
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], evict_first=True)
     def sorted_edges(self):
         """Sort edges along axis=1.
 
@@ -192,7 +192,7 @@ class Edges(Vertices):
 
         return np.sort(edges, axis=1)
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
     def unique_edges(self):
         """Returns a named tuple of unique edge info. Info includes unique
         values, ids of unique edges, inverse ids, count of each unique values.
@@ -217,7 +217,7 @@ class Edges(Vertices):
 
         return unique_info
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
     def single_edges(self):
         """Returns indices of very unique edges: edges that appear only once.
         For well constructed faces, this can be considered as outlines.
@@ -234,6 +234,124 @@ class Edges(Vertices):
 
         return unique_info.ids[unique_info.counts == 1]
 
+    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    def vertex_element_adjacency(self):
+        """Returns vertex to element adjacency in CSR format. Elements that
+        touch i-th vertex are `indices[offsets[i]:offsets[i + 1]]`. Offsets
+        are given up to the largest referenced vertex id.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        adjacency: Adjacency
+          namedtuple with `offsets` and `indices`.
+        """
+        self._logd("computing vertex_element_adjacency")
+
+        return utils.connec.vertex_to_element(self.const_elements)
+
+    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    def vertex_vertex_adjacency(self):
+        """Returns vertex to vertex adjacency in CSR format, based on unique
+        edges. Neighbors of i-th vertex are
+        `indices[offsets[i]:offsets[i + 1]]`. Offsets are given up to the
+        largest referenced vertex id.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        adjacency: Adjacency
+          namedtuple with `offsets` and `indices`.
+        """
+        self._logd("computing vertex_vertex_adjacency")
+
+        return utils.connec.vertex_to_vertex(self.unique_edges().values)
+
+    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    def bandwidth(self):
+        """Returns bandwidth and profile of a matrix assembled on elements,
+        i.e., every vertex pair within an element is non-zero. Useful to
+        see the effect of `reorder()`.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        bandwidth_and_profile: tuple
+          (bandwidth, profile)
+        """
+        self._logd("computing bandwidth")
+        pairs = utils.connec.element_vertex_pairs(self.const_elements)
+
+        return utils.connec.bandwidth(pairs, len(self.vertices))
+
+    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    def connected_components(self, via="vertices"):
+        """Labels each element with the id of its connected component.
+        Components are numbered in order of their first element.
+
+        Parameters
+        -----------
+        via: str
+          "vertices" or "subelements". Default is "vertices". With
+          "subelements", elements are connected only if they share a
+          sub-element, i.e., an edge for faces and a face for volumes.
+
+        Returns
+        --------
+        labels: (n_elements,) np.ndarray
+        """
+        self._logd("computing connected_components")
+        elements = np.asarray(self.const_elements)
+        n_elements = len(elements)
+
+        if via == "subelements" and self.kind != "edge":
+            boundary = self.__boundary_class__.__qualname__.lower()
+            inverse = getattr(self, f"unique_{boundary}")().inverse
+            # bipartite graph of elements and their sub-elements
+            graph = np.column_stack(
+                (
+                    np.repeat(
+                        np.arange(n_elements), len(inverse) // n_elements
+                    ),
+                    inverse + n_elements,
+                )
+            )
+            labels = utils.connec.connected_components(graph)[:n_elements]
+
+        elif via in ("vertices", "subelements"):
+            # star graph per element
+            graph = np.column_stack(
+                (
+                    np.repeat(elements[:, 0], elements.shape[1] - 1),
+                    elements[:, 1:].ravel(),
+                )
+            )
+            labels = utils.connec.connected_components(graph)[elements[:, 0]]
+
+        else:
+            raise ValueError(
+                f"Invalid via option `{via}`. Valid options are "
+                "{'vertices', 'subelements'}."
+            )
+
+        # number components by their first element
+        _, first, inverse = np.unique(
+            labels, return_index=True, return_inverse=True
+        )
+        ranks = np.empty(len(first), dtype=settings.INT_DTYPE)
+        ranks[np.argsort(first)] = np.arange(len(first))
+
+        return ranks[inverse.ravel()]
+
     @property
     def elements(self):
         """Returns current connectivity. A short cut in FE friendly term.
@@ -288,7 +406,9 @@ class Edges(Vertices):
         self._logd("returning const_elements")
         return getattr(self, "const_" + type(self).__qualname__.lower())
 
-    @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
+    @helpers.data.ComputedMeshData.depends_on(
+        ["vertices", "elements"], evict_first=True
+    )
     def centers(self):
         """Center of elements.
 
@@ -304,7 +424,9 @@ class Edges(Vertices):
 
         return self.const_vertices[self.const_elements].mean(axis=1)
 
-    @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
+    @helpers.data.ComputedMeshData.depends_on(
+        ["vertices", "elements"], evict_first=True
+    )
     def referenced_vertices(
         self,
     ):
@@ -335,18 +457,11 @@ class Edges(Vertices):
         --------
         new_self: type(self)
         """
-        referenced = self.referenced_vertices()
-
-        inverse = np.zeros(len(self.vertices), dtype=settings.INT_DTYPE)
-        inverse[referenced] = np.arange(referenced.sum())
-
-        return self.update_vertices(
-            mask=referenced,
-            inverse=inverse,
-        )
+        return self.update_vertices(mask=self.referenced_vertices())
 
     def update_elements(self, mask):
-        """Similar to update_vertices, but for elements.
+        """Similar to update_vertices, but for elements. Computed data is
+        remapped, where possible. See `_remap_computed()`.
 
         Parameters
         -----------
@@ -356,15 +471,183 @@ class Edges(Vertices):
         --------
         new_self: type(self)
         """
-        self.elements = self.elements[mask]
+        computed = self._computed.valid_items()
+        n_vertices = len(self.const_vertices)
+        n_elements = len(self.const_elements)
+        element_ids = np.arange(n_elements)[mask]
+
+        self.elements = self.const_elements[element_ids]
+        referenced = np.zeros(n_vertices, dtype=bool)
+        referenced[self.const_elements] = True
+
+        # given inverse skips remapping. computed data is remapped once below
+        inverse = np.full(n_vertices, -1, dtype=settings.INT_DTYPE)
+        inverse[referenced] = np.arange(referenced.sum())
+        self.update_vertices(referenced, inverse=inverse)
+
+        self._remap_computed(
+            computed,
+            element_ids,
+            n_elements,
+            np.flatnonzero(referenced),
+            n_vertices,
+        )
 
-        return self.remove_unreferenced_vertices()
+        return self
+
+    def _remap_computed(
+        self, computed, element_ids, n_elements, vertex_ids, n_vertices
+    ):
+        """Restores computed data of an updated mesh from data computed
+        before the update, instead of recomputing. Element-wise data, i.e.
+        `centers`, `face_normals` and sub-elements of each element, is
+        selected and renumbered. If vertex order is kept, sorted and unique
+        sub-elements are remapped too, as their order doesn't change. Others
+        are computed again on request.
+
+        Parameters
+        -----------
+        computed: dict
+          Valid computed data before the update.
+        element_ids: (m,) np.ndarray
+          Previous id of each element.
+        n_elements: int
+          Previous number of elements.
+        vertex_ids: (k,) np.ndarray
+          Previous id of each vertex.
+        n_vertices: int
+          Previous number of vertices.
+
+        Returns
+        --------
+        None
+        """
+        self._computed.clear()
+        if len(computed) == 0 or n_elements == 0:
+            return None
+
+        self._logd("remapping computed data")
+        inverse = np.full(n_vertices, -1, dtype=settings.INT_DTYPE)
+        inverse[vertex_ids] = np.arange(len(vertex_ids))
+        keeps_order = bool((np.diff(vertex_ids) > 0).all())
+
+        def select(values):
+            """select blocks of sub-entities of remaining elements."""
+            values = np.asarray(values)
+            blocks = values.reshape(n_elements, -1, *values.shape[1:])
+            return blocks[element_ids].reshape(-1, *values.shape[1:])
+
+        remapped = {}
+        for key in ("centers", "face_normals"):
+            if key in computed:
+                remapped[key] = select(computed[key])
+
+        sub_keys = ["edges", "faces"]
+        if keeps_order:
+            sub_keys.extend(("sorted_edges", "sorted_faces", "sorted_volumes"))
+        for key in sub_keys:
+            if key in computed:
+                remapped[key] = inverse[select(computed[key])]
+
+        # all fresh
+        self.vertices._modified = False
+        self.elements._modified = False
+        for key, value in remapped.items():
+            value.flags.writeable = False
+            self._computed._saved[key] = value
+
+        if not keeps_order:
+            return None
+
+        # unique sub-elements keep their order. Counts shrink and first
+        # occurrences may move.
+        for key in ("unique_edges", "unique_faces", "unique_volumes"):
+            unique_info = computed.get(key, None)
+            if unique_info is None:
+                continue
+
+            n_sub = len(unique_info.inverse) // n_elements
+            new_inverse = unique_info.inverse.reshape(n_elements, n_sub)[
+                element_ids
+            ].ravel()
+            counts = np.bincount(new_inverse, minlength=len(unique_info.ids))
+            remains = counts > 0
+            new_inverse = (np.cumsum(remains) - 1)[new_inverse]
+
+            # reversed assignment - first occurrence is written last
+            ids = np.empty(remains.sum(), dtype=unique_info.ids.dtype)
+            ids[new_inverse[::-1]] = np.arange(len(new_inverse))[::-1]
+
+            self._computed._saved[key] = helpers.data.Unique2DIntegers(
+                self._get_attr(key.replace("unique_", ""))[ids],
+                ids,
+                new_inverse,
+                counts[remains],
+            )
+
+        return None
 
     def update_edges(self, *args, **kwargs):
         """Alias to update_elements."""
         return self.update_elements(*args, **kwargs)
 
-    def dashed(self, spacing=None):
+    def split(self, via="vertices"):
+        """Splits into connected components. Each component only keeps
+        vertices it references, so the full vertex array isn't copied for
+        each of them. Vertex data is split accordingly.
+
+        Parameters
+        -----------
+        via: str
+          "vertices" or "subelements". See `connected_components()`.
+
+        Returns
+        --------
+        components: list
+          list of type(self), in order of `connected_components()`.
+        """
+        labels = self.connected_components(via=via)
+        elements = np.asarray(self.const_elements)
+        n_nodes = elements.shape[1]
+
+        # group elements by component, keeping their order
+        order = np.argsort(labels, kind="stable")
+        element_offsets = np.searchsorted(
+            labels[order], np.arange(labels.max() + 2 if len(labels) else 1)
+        )
+        elements = elements[order]
+
+        # unique (component, vertex) pairs are sorted by component, then by
+        # vertex. Local vertex ids are positions within each component.
+        unique_pairs = utils.connec.sorted_unique(
+            np.column_stack(
+                (np.repeat(labels[order], n_nodes), elements.ravel())
+            ),
+            sorted_=True,
+        )
+        vertex_offsets = np.searchsorted(
+            unique_pairs.values[:, 0], np.arange(len(element_offsets))
+        )
+        local_elements = unique_pairs.inverse.reshape(-1, n_nodes)
+
+        components = []
+        for i in range(len(element_offsets) - 1):
+            v_start, v_end = vertex_offsets[i], vertex_offsets[i + 1]
+            e_start, e_end = element_offsets[i], element_offsets[i + 1]
+            vertex_ids = unique_pairs.values[v_start:v_end, 1]
+
+            component = type(self)(
+                vertices=self.const_vertices[vertex_ids],
+                elements=local_elements[e_start:e_end] - v_start,
+            )
+            for key, value in self.vertex_data.items():
+                component.vertex_data[key] = value[vertex_ids]
+
+            components.append(component)
+
+        return components
+
+    def dashed(self, spacing=None, merge=False):
         """Turn edges into dashed edges(=lines). Given spacing, it will try to
         chop edges as close to it as possible. Pattern should look:
 
@@ -376,10 +659,15 @@ class Edges(Vertices):
              |<------>|             |<-->|
                 (chop length)         (chop length / 2)
 
+        All dashes are computed at once and written into a single array.
+
         Parameters
         -----------
         spacing: float
           Default is None and it will use self.bounds_diagonal_norm() / 50
+        merge: bool
+          Default is False. If True, dashes that start or end at a vertex
+          share it. Otherwise, each dash has its own vertices.
 
         Returns
         --------
@@ -392,31 +680,105 @@ class Edges(Vertices):
             # apply "automatic" spacing
             spacing = self.bounds_diagonal_norm() / 50
 
-        v0s = self.vertices[self.edges[:, 0]]
-        v1s = self.vertices[self.edges[:, 1]]
+        edges = self.edges
+        v0s = self.vertices[edges[:, 0]]
+        v1s = self.vertices[edges[:, 1]]
 
+        # each dash takes two thirds of its chop length
         distances = np.linalg.norm(v0s - v1s, axis=1)
-        linspaces = (((distances // (spacing * 1.5)) + 1) * 3).astype(np.int32)
-
-        # chop vertices!
-        new_vs = []
-        for v0, v1, lins in zip(v0s, v1s, linspaces):
-            new_vs.append(np.linspace(v0, v1, lins))
-
-        # we need all chopped vertices.
-        # there might be duplicating vertices. you can use merge_vertices
-        new_vs = np.vstack(new_vs)
-        # all mid points are explicitly defined, but they aren't required
-        # so, rm.
-        mask = np.ones(len(new_vs), dtype=bool)
-        mask[1::3] = False
-        new_vs = new_vs[mask]
-
-        # prepare edges
-        tmp_es = utils.connec.range_to_edges((0, len(new_vs)), closed=False)
-        new_es = tmp_es[::2]
-
-        return Edges(vertices=new_vs, edges=new_es)
+        n_dashes = (distances // (spacing * 1.5)).astype(
+            settings.INT_DTYPE
+        ) + 1
+        n_total = int(n_dashes.sum())
+        starts = np.cumsum(n_dashes) - n_dashes
+
+        parents = np.repeat(np.arange(len(edges)), n_dashes)
+        local_ids = np.arange(n_total) - starts[parents]
+        denominators = 3 * n_dashes[parents] - 1
+
+        # (start, end) parameter of each dash along its edge
+        parameters = np.empty((n_total, 2, 1), dtype=settings.FLOAT_DTYPE)
+        parameters[:, 0, 0] = 3 * local_ids / denominators
+        parameters[:, 1, 0] = (3 * local_ids + 2) / denominators
+
+        new_vs = np.empty(
+            (n_total, 2, self.vertices.shape[1]), dtype=settings.FLOAT_DTYPE
+        )
+        np.multiply(parameters, (v1s - v0s)[parents, np.newaxis], out=new_vs)
+        new_vs += v0s[parents, np.newaxis]
+        new_vs = new_vs.reshape(-1, self.vertices.shape[1])
+
+        if not merge:
+            new_es = np.arange(len(new_vs), dtype=settings.INT_DTYPE)
+            return Edges(vertices=new_vs, edges=new_es.reshape(-1, 2))
+
+        # weld first and last point of each edge to its vertices
+        referenced, inverse = np.unique(edges, return_inverse=True)
+        first = 2 * starts
+        last = 2 * (starts + n_dashes) - 1
+        is_end = np.zeros(len(new_vs), dtype=bool)
+        is_end[first] = True
+        is_end[last] = True
+
+        new_es = np.empty(len(new_vs), dtype=settings.INT_DTYPE)
+        new_es[first] = inverse.reshape(-1, 2)[:, 0]
+        new_es[last] = inverse.reshape(-1, 2)[:, 1]
+        new_es[~is_end] = np.arange(
+            len(referenced), len(new_vs) - is_end.sum() + len(referenced)
+        )
+
+        return Edges(
+            vertices=np.vstack((self.vertices[referenced], new_vs[~is_end])),
+            edges=new_es.reshape(-1, 2),
+        )
+
+    def subdivide(self, levels=1, map_vertex_data=True):
+        """Returns uniformly subdivided elements. Each level splits edges in
+        two, so triangles and quads become 4 and tets and hexas become 8
+        elements. New vertices are means of their parent vertices, which
+        applies to vertex_data as well.
+
+        Parameters
+        -----------
+        levels: int
+          Default is 1. Number of subdivisions.
+        map_vertex_data: bool
+          Default is True. Interpolates all vertex_data.
+
+        Returns
+        --------
+        subdivided: type(self)
+        """
+        if int(levels) < 0:
+            raise ValueError("levels should be a non-negative int.")
+
+        vertices = self.const_vertices
+        elements = self.const_elements
+        vertex_data = {}
+        if map_vertex_data:
+            for key, value in self.vertex_data.items():
+                # norms will be computed on request
+                if not key.endswith("__norm"):
+                    vertex_data[key] = np.asarray(value)
+
+        whatami = self.whatami
+        for _ in range(int(levels)):
+            parents, elements = utils.connec.subdivide(
+                elements, whatami, len(vertices)
+            )
+            vertices = np.vstack(
+                [vertices, *[vertices[p].mean(axis=1) for p in parents]]
+            )
+            for key, value in vertex_data.items():
+                vertex_data[key] = np.vstack(
+                    [value, *[value[p].mean(axis=1) for p in parents]]
+                )
+
+        subdivided = type(self)(vertices=vertices, elements=elements)
+        for key, value in vertex_data.items():
+            subdivided.vertex_data[key] = value
+
+        return subdivided
 
     def shrink(self, ratio=0.8, map_vertex_data=True):
         """Returns shrunk elements.
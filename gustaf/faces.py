@@ -116,7 +116,7 @@ class Faces(Edges):
 
         self.BC = {}
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], evict_first=True)
     def edges(self):
         """Edges from here aren't main property. So this needs to be computed.
 
@@ -208,6 +208,7 @@ class Faces(Edges):
             fs,
             settings.INT_DTYPE,
             copy=False,
+            owner=(self, "_faces"),
         )
         # shape check
         if fs is not None:
@@ -235,7 +236,7 @@ class Faces(Edges):
         """
         return self._const_faces
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], evict_first=True)
     def sorted_faces(self):
         """Similar to edges_sorted but for faces.
 
@@ -251,7 +252,7 @@ class Faces(Edges):
 
         return np.sort(faces, axis=1)
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
     def unique_faces(self):
         """Returns a namedtuple of unique faces info. Similar to unique_edges.
 
@@ -274,7 +275,7 @@ class Faces(Edges):
 
         return unique_info
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
     def single_faces(self):
         """Returns indices of very unique faces: faces that appear only once.
         For well constructed volumes, this can be considered as surfaces.
@@ -291,6 +292,136 @@ class Faces(Edges):
 
         return unique_info.ids[unique_info.counts == 1]
 
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
+    def element_neighbors(self):
+        """Returns neighbor faces of each face, based on shared edges.
+        Column order follows edge order of `edges()`. Edges that aren't
+        shared by exactly two faces, e.g. outlines, are marked with -1.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        neighbors: (n_faces, n_edges_per_face) np.ndarray
+        """
+        self._logd("computing element_neighbors")
+        unique_info = self.unique_edges()
+
+        return utils.connec.element_neighbors(
+            unique_info.inverse,
+            unique_info.counts,
+            self.faces.shape[1],
+        )
+
+    def _area_vectors(self):
+        """Normal vectors of faces, scaled by twice their area. Quads use
+        their diagonals, which is exact for planar quads.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        area_vectors: (n_faces, 3) np.ndarray
+        """
+        vertices = self.const_vertices
+        if vertices.shape[1] != 3:
+            raise ValueError("Normals are only supported for 3D faces.")
+
+        faces = self._get_attr("faces")
+        if faces.shape[1] == 3:
+            a = vertices[faces[:, 1]] - vertices[faces[:, 0]]
+            b = vertices[faces[:, 2]] - vertices[faces[:, 0]]
+        else:
+            a = vertices[faces[:, 2]] - vertices[faces[:, 0]]
+            b = vertices[faces[:, 3]] - vertices[faces[:, 1]]
+
+        return utils.arr.cross3d(a, b)
+
+    @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
+    def face_normals(self):
+        """Unit normals of faces. Orientation follows the right-hand rule.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        face_normals: (n_faces, 3) np.ndarray
+        """
+        self._logd("computing face_normals")
+        area_vectors = self._area_vectors()
+
+        return area_vectors / np.linalg.norm(
+            area_vectors, axis=1, keepdims=True
+        )
+
+    @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
+    def vertex_normals(self, area_weighting=False, angle_weighting=False):
+        """Unit normals of vertices, as weighted sum of normals of adjacent
+        faces. Sums are computed with `np.bincount`. Unreferenced vertices
+        get zero vectors. Faces are not modified.
+
+        Parameters
+        -----------
+        area_weighting: bool
+          Default is False. Weights normals with face area.
+        angle_weighting: bool
+          Default is False. Weights normals with corner angle of the face
+          at the vertex.
+
+        Returns
+        --------
+        vertex_normals: (n_vertices, 3) np.ndarray
+        """
+        self._logd("computing vertex_normals")
+        vertices = self.const_vertices
+        faces = self._get_attr("faces")
+
+        normals = (
+            self._area_vectors() if area_weighting else self.face_normals()
+        )
+        # (n_faces, n_corners, 3)
+        contributions = np.repeat(
+            normals[:, np.newaxis], faces.shape[1], axis=1
+        )
+
+        if angle_weighting:
+            corners = vertices[faces]
+            to_next = (np.roll(corners, -1, axis=1) - corners).reshape(-1, 3)
+            to_previous = (np.roll(corners, 1, axis=1) - corners).reshape(
+                -1, 3
+            )
+            angles = np.arctan2(
+                np.linalg.norm(
+                    utils.arr.cross3d(to_next, to_previous), axis=1
+                ),
+                np.einsum("ij,ij->i", to_next, to_previous),
+            )
+            contributions *= angles.reshape(*faces.shape, 1)
+
+        ids = faces.ravel()
+        contributions = contributions.reshape(-1, 3)
+        vertex_normals = np.column_stack(
+            [
+                np.bincount(
+                    ids, weights=contributions[:, i], minlength=len(vertices)
+                )
+                for i in range(3)
+            ]
+        )
+
+        lengths = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+        np.divide(
+            vertex_normals, lengths, out=vertex_normals, where=lengths > 0
+        )
+
+        return vertex_normals
+
     def update_faces(self, *args, **kwargs):
         """Alias to update_elements."""
         self.update_elements(*args, **kwargs)
@@ -1,7 +1,8 @@
-from gustaf.helpers import _base, data, options, raise_if
+from gustaf.helpers import _base, data, disk_cache, options, raise_if
 
 __all__ = [
     "data",
+    "disk_cache",
     "options",
     "raise_if",
     "_base",
@@ -3,22 +3,36 @@
 Helps helpee to manage data. Some useful data structures.
 """
 
-from collections import namedtuple
+import inspect
+from collections import OrderedDict, namedtuple
 from functools import wraps
+from time import perf_counter
+from weakref import ref
 
 import numpy as np
 
+from gustaf import _version, settings
+from gustaf.helpers import disk_cache
 from gustaf.helpers._base import HelperBase
 
 
 class TrackedArray(np.ndarray):
     """numpy array object that keeps mirroring inplace changes to the source.
     Meant to help control_points.
+
+    Tracked arrays with an owner can be shared with copies, see
+    `share_tracked_array`. The original keeps its buffer: before its first
+    inplace change, copies get a private copy of the buffer. A copy that is
+    changed inplace makes a private copy of its own, which replaces the
+    array in its owner.
     """
 
     __slots__ = (
         "_super_arr",
         "_modified",
+        "_owner",
+        "_copies",
+        "_shared",
     )
 
     def __array_finalize__(self, obj):
@@ -27,6 +41,9 @@ class TrackedArray(np.ndarray):
         see https://numpy.org/doc/stable/user/basics.subclassing.html"""
         self._super_arr = None
         self._modified = True
+        self._owner = None
+        self._copies = None
+        self._shared = None
 
         # for arrays created based on this subclass
         if isinstance(obj, type(self)):
@@ -34,6 +51,10 @@ class TrackedArray(np.ndarray):
             if self.base is None:
                 return None
 
+            # views know the copies that share their buffer
+            self._copies = obj._copies
+            self._shared = obj._shared
+
             # first child array
             if self.base is obj:
                 # make sure this is not a recursively born child
@@ -79,84 +100,118 @@ class TrackedArray(np.ndarray):
         v.flags.writeable = False
         return v
 
-    def __iadd__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__iadd__(*args, **kwargs)
-        self.modified = True
+    def _copy_on_write(self):
+        """Returns the array that an inplace change should be applied to.
+        For arrays that share their buffer with copies, copies are given a
+        private buffer first and self is returned. A shared copy is
+        replaced in its owner by a private copy, which is returned. Views
+        of shared copies return None, as they can't be replaced.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        target: TrackedArray or None
+        """
+        if self._shared is not None:
+            if self._owner is None:
+                return None
+
+            return _unshare(self)
+
+        # non-writeable arrays will raise in numpy. keep copies shared
+        if self._copies and self.flags.writeable:
+            _detach(self._copies)
+
+        return self
+
+    def _inplace(self, name, *args, **kwargs):
+        """Applies inplace operator on copy-on-write target and sets
+        modified flag. Children of shared arrays return the result
+        out-of-place, so that `shared[key] += value` still assigns through
+        `shared.__setitem__`.
+
+        Parameters
+        -----------
+        name: str
+          Name of inplace operator, for example "__iadd__".
+        *args: args
+        **kwargs: kwargs
+
+        Returns
+        --------
+        result: TrackedArray
+        """
+        target = self._copy_on_write()
+        if target is None:
+            return getattr(np.ndarray, name.replace("__i", "__", 1))(
+                self, *args, **kwargs
+            )
+
+        sr = getattr(super(TrackedArray, target), name)(*args, **kwargs)
+        target.modified = True
         return sr
 
+    def __iadd__(self, *args, **kwargs):
+        return self._inplace("__iadd__", *args, **kwargs)
+
     def __isub__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__isub__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__isub__", *args, **kwargs)
 
     def __imul__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__imul__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__imul__", *args, **kwargs)
 
     def __idiv__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__idiv__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__idiv__", *args, **kwargs)
 
     def __itruediv__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__itruediv__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__itruediv__", *args, **kwargs)
 
     def __imatmul__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__imatmul__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__imatmul__", *args, **kwargs)
 
     def __ipow__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__ipow__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__ipow__", *args, **kwargs)
 
     def __imod__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__imod__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__imod__", *args, **kwargs)
 
     def __ifloordiv__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__ifloordiv__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__ifloordiv__", *args, **kwargs)
 
     def __ilshift__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__ilshift__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__ilshift__", *args, **kwargs)
 
     def __irshift__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__irshift__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__irshift__", *args, **kwargs)
 
     def __iand__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__iand__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__iand__", *args, **kwargs)
 
     def __ixor__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__ixor__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__ixor__", *args, **kwargs)
 
     def __ior__(self, *args, **kwargs):
-        sr = super(self.__class__, self).__ior__(*args, **kwargs)
-        self.modified = True
-        return sr
+        return self._inplace("__ior__", *args, **kwargs)
 
     def __setitem__(self, key, value):
+        target = self._copy_on_write()
+        if target is None:
+            raise ValueError(
+                "Can't write to a view of an array, that is shared with "
+                "its original. Please write through the array itself or "
+                "make a copy without sharing."
+            )
+
         # set first. invalid setting will cause error
-        sr = super(self.__class__, self).__setitem__(key, value)
-        self.modified = True
+        sr = super(TrackedArray, target).__setitem__(key, value)
+        target.modified = True
         return sr
 
 
-def make_tracked_array(array, dtype=None, copy=True):
+def make_tracked_array(array, dtype=None, copy=True, owner=None):
     """Motivated by nice implementations of `trimesh` (see LICENSE.txt).
     `https://github.com/mikedh/trimesh/blob/main/trimesh/caching.py`.
 
@@ -171,6 +226,9 @@ def make_tracked_array(array, dtype=None, copy=True):
       Which dtype to use for the array
     copy: bool
       Default is True. copy if True.
+    owner: tuple
+      (Optional) (object, attribute name). Needed for sharing with copies.
+      A `DataHolder` owner is referred to by key.
 
     Returns
     ------------
@@ -191,9 +249,152 @@ def make_tracked_array(array, dtype=None, copy=True):
     # this marks original array
     tracked._super_arr = True
 
+    if owner is not None:
+        tracked._owner = (ref(owner[0]), owner[1])
+
+        # views of tracked arrays keep sharing bookkeeping of their buffer
+        if tracked._shared is not None:
+            _add_copy(tracked._shared, tracked)
+        elif tracked._copies is None:
+            tracked._copies = []
+
     return tracked
 
 
+def share_tracked_array(array, owner):
+    """Shares a tracked array with a copy, without copying its buffer. The
+    returned array is not writeable and is replaced by a private copy in
+    its owner on its first inplace change. Before the first inplace change
+    of the given array, shared arrays are given private copies. Arrays
+    without an owner are copied.
+
+    Parameters
+    -----------
+    array: TrackedArray
+    owner: tuple
+      (object, attribute name) of the returned array.
+
+    Returns
+    --------
+    shared: TrackedArray
+    """
+    copies = array._copies if array._shared is None else array._shared
+    if copies is None:
+        shared = make_tracked_array(array, array.dtype, copy=True, owner=owner)
+        shared._modified = array.modified
+        return shared
+
+    shared = make_tracked_array(array, array.dtype, copy=False)
+    shared.flags.writeable = False
+    shared._owner = (ref(owner[0]), owner[1])
+    shared._copies = None
+    shared._shared = copies
+    shared._modified = array.modified
+    _add_copy(copies, shared)
+
+    return shared
+
+
+def _add_copy(copies, array):
+    """Adds a shared array to copies of its buffer. Copies that are already
+    garbage collected are removed, so that the list doesn't grow as long as
+    the original isn't written.
+
+    Parameters
+    -----------
+    copies: list
+      weakrefs of shared arrays.
+    array: TrackedArray
+
+    Returns
+    --------
+    None
+    """
+    copies[:] = [c for c in copies if c() is not None]
+    copies.append(ref(array))
+
+
+def _holder(array):
+    """Returns owner of a tracked array, if the array is still in use by its
+    owner.
+
+    Parameters
+    -----------
+    array: TrackedArray
+
+    Returns
+    --------
+    owner: object or None
+    """
+    owner_ref, key = array._owner
+    owner = owner_ref()
+    if isinstance(owner, DataHolder):
+        current = owner._saved.get(key, None)
+    else:
+        current = getattr(owner, key, None)
+
+    return owner if current is array else None
+
+
+def _unshare(array):
+    """Replaces a shared array in its owner with a private copy.
+
+    Parameters
+    -----------
+    array: TrackedArray
+
+    Returns
+    --------
+    private: TrackedArray
+    """
+    owner = _holder(array)
+    if owner is None:
+        raise ValueError(
+            "Can't write to a shared array, that is not in use anymore. "
+            "Please write through its owner, for example `mesh.vertices`."
+        )
+
+    key = array._owner[1]
+    private = make_tracked_array(
+        array, array.dtype, copy=True, owner=(owner, key)
+    )
+    private._modified = array.modified
+
+    if isinstance(owner, DataHolder):
+        owner._saved[key] = private
+    else:
+        setattr(owner, key, private)
+        # keep non-writeable view in sync
+        const_key = "_const" + key
+        if hasattr(owner, const_key):
+            setattr(owner, const_key, private.view())
+
+    # doesn't need to be detached anymore
+    array._shared[:] = [c for c in array._shared if c() is not array]
+
+    return private
+
+
+def _detach(copies):
+    """Replaces shared arrays that are still in use by private copies.
+
+    Parameters
+    -----------
+    copies: list
+      weakrefs of shared arrays.
+
+    Returns
+    --------
+    None
+    """
+    for copy_ref in tuple(copies):
+        shared = copy_ref()
+        if shared is not None and _holder(shared) is not None:
+            _unshare(shared)
+
+    copies.clear()
+
+
 class DataHolder(HelperBase):
     __slots__ = ("_saved",)
 
@@ -347,41 +548,562 @@ class DataHolder(HelperBase):
         self._saved.update(**kwargs)
 
 
+# marks calls, that can't be memoized
+_UNHASHABLE = object()
+
+# computed data that depends only on elements, shared among objects with
+# the same elements. Keys are content keys. See
+# `settings.COMPUTED_SHARED_TOPOLOGY`.
+SHARED_TOPOLOGY = OrderedDict()
+
+# counters of computed data, accumulated over all objects. Keys are
+# `<class name>.<function name>`. See `gustaf.utils.stats`.
+COMPUTED_STATS = {}
+
+
+def _share_topology(content_key, value):
+    """Adds value to shared topology, as least recently used one is dropped
+    once `settings.COMPUTED_SHARED_TOPOLOGY_SIZE` is exceeded. Arrays of
+    value are set non-writeable, as they are shared.
+
+    Parameters
+    -----------
+    content_key: str
+    value: object
+
+    Returns
+    --------
+    None
+    """
+    fields = value if isinstance(value, tuple) else (value,)
+    for field in fields:
+        if isinstance(field, np.ndarray):
+            field.flags.writeable = False
+
+    SHARED_TOPOLOGY[content_key] = value
+    SHARED_TOPOLOGY.move_to_end(content_key)
+    while len(SHARED_TOPOLOGY) > settings.COMPUTED_SHARED_TOPOLOGY_SIZE:
+        SHARED_TOPOLOGY.popitem(last=False)
+
+
+def _new_stats():
+    """Returns zeroed counters of a computed function.
+
+    Parameters
+    -----------
+    None
+
+    Returns
+    --------
+    stats: dict
+      hits, misses, invalidations, invalidated_by, loads, time and nbytes.
+    """
+    return {
+        "hits": 0,
+        "misses": 0,
+        "invalidations": 0,
+        "invalidated_by": {},
+        "loads": 0,
+        "time": 0.0,
+        "nbytes": 0,
+    }
+
+
+def _freeze(value):
+    """Converts call arguments into a hashable key. Arrays are keyed by
+    their content.
+
+    Parameters
+    -----------
+    value: object
+
+    Returns
+    --------
+    frozen: hashable
+    """
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+
+    # raises TypeError for unhashables
+    hash(value)
+
+    return value
+
+
+def _nbytes(value):
+    """Approximated memory usage of computed values in bytes. Counts arrays,
+    also within tuples, lists and dicts.
+
+    Parameters
+    -----------
+    value: object
+
+    Returns
+    --------
+    nbytes: int
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+
+    return 0
+
+
 class ComputedData(DataHolder):
+    # registries are keyed by (class, function name), with class as
+    # `<module>.<qualname>`. See `_resolve()`
     _depends = None
-    _inv_depends = None
+    _evict_first = None
+    _persistent = None
+    _resolved = None
 
-    __slots__ = ()
+    __slots__ = (
+        "_memo",
+        "_lru",
+        "_bytes_limit",
+        "_pinned",
+        "_cheap",
+        "_stats",
+        "_digests",
+    )
 
     def __init__(self, helpee, **_kwargs):
         """Stores last computed values.
 
         Keys are expected to be the same as helpee's function that computes the
-         value.
+         value. Values computed with default arguments are saved as they are.
+         Values computed with other arguments are saved in a per-function
+         LRU, keyed by normalized arguments. See `settings.COMPUTED_LRU_SIZE`.
+
+        If a memory budget is set, least recently used values are evicted
+        once saved values exceed it. Pinned keys are never evicted, while
+        evict-first keys go before all others. See `bytes_limit`.
+
+        If `settings.COMPUTED_CACHE_DIR` is set, persistent values are also
+        saved on disk, keyed by content of their dependees and arguments.
+        If `settings.COMPUTED_SHARED_TOPOLOGY` is True, values that depend
+        only on elements are shared among objects with the same elements.
 
         Parameters
         -----------
         helpee: GustafBase
         """
         super().__init__(helpee)
+        self._memo = {}
+        self._lru = OrderedDict()
+        self._bytes_limit = None
+        self._pinned = set()
+        self._cheap = set()
+        self._stats = {}
+        self._digests = {}
+
+    @property
+    def bytes_limit(self):
+        """Memory budget of saved values in bytes. Unless set, returns
+        `settings.COMPUTED_BYTES_LIMIT`. None means no limit. Setting a limit
+        evicts right away.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        bytes_limit: int or None
+        """
+        if self._bytes_limit is None:
+            return settings.COMPUTED_BYTES_LIMIT
+
+        return self._bytes_limit
+
+    @bytes_limit.setter
+    def bytes_limit(self, limit):
+        """Sets per-object memory budget. Set float("inf") to ignore global
+        budget and None to follow it again.
+
+        Parameters
+        -----------
+        limit: int or float or None
+
+        Returns
+        --------
+        None
+        """
+        self._bytes_limit = limit
+        self._evict()
+
+    def nbytes(self):
+        """Approximated memory usage of saved values in bytes.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        nbytes: int
+        """
+        return sum(_nbytes(value) for _, value in self._entries())
+
+    def pin(self, *keys):
+        """Excludes keys from eviction.
+
+        Parameters
+        -----------
+        *keys: str
+
+        Returns
+        --------
+        None
+        """
+        self._pinned.update(keys)
+
+    def unpin(self, *keys):
+        """Allows eviction of keys again.
+
+        Parameters
+        -----------
+        *keys: str
+
+        Returns
+        --------
+        None
+        """
+        self._pinned.difference_update(keys)
+
+    def evict_first(self, *keys):
+        """Marks keys to be evicted before others, for example cheap to
+        recompute values. Values marked with `depends_on(evict_first=True)`
+        are always evicted first.
+
+        Parameters
+        -----------
+        *keys: str
+
+        Returns
+        --------
+        None
+        """
+        self._cheap.update(keys)
+
+    def clear(self):
+        """
+        Clears saved data, including memoized values of any arguments.
+        """
+        super().clear()
+        self._memo = {}
+        self._lru = OrderedDict()
+        self._digests = {}
+
+    def _entries(self):
+        """Yields saved values with their entry keys. Entry key is the
+        function name for default arguments and (name, arguments key) for
+        memoized values.
+
+        Parameters
+        -----------
+        None
+
+        Yields
+        -------
+        entry: tuple
+          (entry key, value)
+        """
+        for name, value in self._saved.items():
+            if value is not None:
+                yield name, value
+        for name, memo in self._memo.items():
+            for key, value in memo.items():
+                yield (name, key), value
+
+    def _touch(self, entry_key):
+        """Marks entry as most recently used.
+
+        Parameters
+        -----------
+        entry_key: str or tuple
+
+        Returns
+        --------
+        None
+        """
+        self._lru[entry_key] = None
+        self._lru.move_to_end(entry_key)
+
+    def _drop(self, entry_key):
+        """Removes an entry.
+
+        Parameters
+        -----------
+        entry_key: str or tuple
+
+        Returns
+        --------
+        None
+        """
+        self._lru.pop(entry_key, None)
+        if isinstance(entry_key, str):
+            self._saved.pop(entry_key, None)
+            return None
+
+        name, key = entry_key
+        memo = self._memo.get(name, None)
+        if memo is not None:
+            memo.pop(key, None)
+            if len(memo) == 0:
+                self._memo.pop(name)
+
+        return None
+
+    def _evict(self, keep=None):
+        """Evicts entries until saved values fit into bytes_limit. Order is
+        evict-first entries, others and keep, each from least recently
+        used. Entries without usage record, e.g. remapped ones, count as the
+        oldest. Pinned keys are skipped.
+
+        Parameters
+        -----------
+        keep: str or tuple
+          (Optional) Entry key to evict last, e.g. value that was just
+          computed.
+
+        Returns
+        --------
+        None
+        """
+        limit = self.bytes_limit
+        if limit is None:
+            return None
+
+        sizes = {key: _nbytes(value) for key, value in self._entries()}
+        total = sum(sizes.values())
+        if total <= limit:
+            return None
+
+        cheap = self._cheap.union(
+            self._resolve(type(self._helpee)).evict_first
+        )
+        order = {key: i for i, key in enumerate(self._lru)}
+
+        def name(entry_key):
+            return entry_key if isinstance(entry_key, str) else entry_key[0]
+
+        candidates = sorted(
+            (key for key in sizes if name(key) not in self._pinned),
+            key=lambda k: (k == keep, name(k) not in cheap, order.get(k, -1)),
+        )
+        for key in candidates:
+            if total <= limit:
+                break
+            self._logd(f"evicting computed `{name(key)}`")
+            self._drop(key)
+            total -= sizes[key]
+
+        return None
+
+    @classmethod
+    def _resolve(cls, helpee_type):
+        """Returns dependency info of functions of a helpee class, keyed by
+        function name. Functions of a subclass take precedence over functions
+        of its bases with the same name.
+
+        Parameters
+        -----------
+        helpee_type: type
+
+        Returns
+        --------
+        resolved: DependencyInfo
+        """
+        resolved = cls._resolved.get(helpee_type, None)
+        if resolved is not None:
+            return resolved
+
+        classes = [
+            f"{c.__module__}.{c.__qualname__}" for c in helpee_type.__mro__
+        ]
+        depends = {}
+        evict_first = set()
+        persistent = set()
+        for (owner, name), var_names in cls._depends.items():
+            if owner not in classes:
+                continue
+            rank = classes.index(owner)
+            if name in depends and depends[name][0] < rank:
+                continue
+            depends[name] = (rank, var_names)
+            evict_first.discard(name)
+            persistent.discard(name)
+            if (owner, name) in cls._evict_first:
+                evict_first.add(name)
+            if (owner, name) in cls._persistent:
+                persistent.add(name)
+
+        depends = {name: var_names for name, (_, var_names) in depends.items()}
+        inv_depends = {}
+        for name, var_names in depends.items():
+            for var_name in dict.fromkeys(var_names):
+                inv_depends.setdefault(var_name, []).append(name)
+
+        resolved = DependencyInfo(
+            depends, inv_depends, frozenset(evict_first), frozenset(persistent)
+        )
+        cls._resolved[helpee_type] = resolved
+
+        return resolved
+
+    def pop(self, key, default=None):
+        """
+        Applied pop() to saved data. Memoized values of any arguments are
+        removed too.
+
+        Parameters
+        ----------
+        key: str
+        default: object
+
+        Returns
+        -------
+        value: object
+        """
+        for memo_key in self._memo.pop(key, ()):
+            self._lru.pop((key, memo_key), None)
+        self._lru.pop(key, None)
+        return super().pop(key, default)
+
+    def _record(self, key, invalidated_by=None, **counts):
+        """Adds counts to statistics of this object and to global
+        statistics. Only if `settings.COMPUTED_STATS` is True.
+
+        Parameters
+        -----------
+        key: str
+        invalidated_by: str
+          (Optional) Name of modified dependee.
+        **counts: kwargs
+          Increments of hits, misses, invalidations, time or nbytes.
+
+        Returns
+        --------
+        None
+        """
+        if not settings.COMPUTED_STATS:
+            return None
+
+        global_key = f"{type(self._helpee).__qualname__}.{key}"
+        for stats in (
+            self._stats.setdefault(key, _new_stats()),
+            COMPUTED_STATS.setdefault(global_key, _new_stats()),
+        ):
+            for name, count in counts.items():
+                stats[name] += count
+            if invalidated_by is not None:
+                by = stats["invalidated_by"]
+                by[invalidated_by] = by.get(invalidated_by, 0) + 1
+
+        return None
+
+    def _content_key(self, key, args_key):
+        """Content-addressed key of a value, for disk cache and shared
+        topology. Hashes of dependees are kept until they are modified.
+
+        Parameters
+        -----------
+        key: str
+        args_key: tuple or None
+          Normalized arguments. None for default arguments.
+
+        Returns
+        --------
+        content_key: str
+        """
+        helpee = self._helpee
+        digests = []
+        depends = self._resolve(type(helpee)).depends[key]
+        for name in dict.fromkeys(depends):
+            digest = self._digests.get(name, None)
+            if digest is None:
+                digest = disk_cache.content_hash(
+                    np.asarray(getattr(helpee, name))
+                )
+                self._digests[name] = digest
+            digests.append(digest)
+
+        return disk_cache.content_hash(
+            _version.version,
+            type(helpee).__qualname__,
+            key,
+            repr(args_key),
+            settings.TOLERANCE,
+            settings.INT_DTYPE,
+            settings.FLOAT_DTYPE,
+            *digests,
+        )
+
+    def _invalidate(self, key, invalidated_by=None):
+        """Marks key to be recomputed, for all arguments.
+
+        Parameters
+        -----------
+        key: str
+        invalidated_by: str
+          (Optional) Name of modified dependee, for statistics.
+
+        Returns
+        --------
+        None
+        """
+        if settings.COMPUTED_STATS and (
+            self._saved.get(key, None) is not None or key in self._memo
+        ):
+            self._record(key, invalidated_by, invalidations=1)
+
+        self._saved[key] = None
+        self._lru.pop(key, None)
+        for memo_key in self._memo.pop(key, ()):
+            self._lru.pop((key, memo_key), None)
 
     @classmethod
-    def depends_on(cls, var_names, make_property=False):
+    def depends_on(
+        cls,
+        var_names,
+        make_property=False,
+        evict_first=False,
+        persistent=False,
+    ):
         """Decorator as classmethod.
 
-        checks if the key should be computed. Two cases, where the answer is
+        checks if the key should be computed. Three cases, where the answer is
         yes:
 
         1. there's modification on arrays that the key depend on.
             ->erases all other
         2. is corresponding value None?
+        3. is it called with arguments, that aren't memoized?
 
-        Supports multi-dependency
+        Supports multi-dependency. Calls are keyed by their arguments, after
+        filling in defaults. `recompute=True` forces computation.
 
         Parameters
         -----------
         var_name: list
         make_property:
+        evict_first: bool
+          Default is False. If True, value is evicted before others, once
+          memory budget is exceeded. For values that are cheap to recompute.
+        persistent: bool
+          Default is False. If True, value is saved on disk and loaded
+          instead of computed, given `settings.COMPUTED_CACHE_DIR`. For
+          arrays or namedtuples of arrays that are expensive to compute.
         """
 
         def inner(func):
@@ -389,63 +1111,158 @@ class ComputedData(DataHolder):
             # just subclass this class to make a special helper
             # for each helpee class.
             assert isinstance(var_names, list), "var_names should be a list"
-            # initialize property
-            # _depends is dict(str: list)
+            # initialize registries
             if cls._depends is None:
                 cls._depends = {}
-            if cls._depends.get(func.__name__, None) is None:
-                cls._depends[func.__name__] = []
-            # add dependency info
-            cls._depends[func.__name__].extend(var_names)
+                cls._evict_first = set()
+                cls._persistent = set()
+                cls._resolved = {}
 
-            # _inv_depends is dict(str: list)
-            if cls._inv_depends is None:
-                cls._inv_depends = {}
-            # add inverse dependency
-            for vn in var_names:
-                if cls._inv_depends.get(vn, None) is None:
-                    cls._inv_depends[vn] = []
+            # functions of different classes may share names
+            owner = func.__qualname__.rpartition(".")[0]
+            registry_key = (f"{func.__module__}.{owner}", func.__name__)
 
-                cls._inv_depends[vn].append(func.__name__)
+            # add dependency info
+            depends = cls._depends.setdefault(registry_key, [])
+            depends.extend(var_names)
+            if evict_first:
+                cls._evict_first.add(registry_key)
+            if persistent:
+                cls._persistent.add(registry_key)
+            cls._resolved.clear()
+
+            # to normalize arguments
+            signature = inspect.signature(func)
+            default_key = None
+
+            def args_key(args, kwargs):
+                """hashable key of call arguments with filled defaults."""
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return _freeze(tuple(bound.arguments.items())[1:])
 
             @wraps(func)
             def compute_or_return_saved(*args, **kwargs):
                 """Check if the key should be computed,"""
+                nonlocal default_key
+
                 # extract some related info
                 self = args[0]  # the helpee itself
+                computed_data = self._computed
 
-                # explicitly settable kwargs.
-                # unless recompute flag is set False,
-                # it will always recompute and save them
-                # if you call the same function without kwargs
-                # the last one with kwargs will be returned
-                recompute = False
-                if kwargs:
-                    recompute = kwargs.get("recompute", True)
+                # explicitly settable flag - always computes and saves
+                recompute = kwargs.pop("recompute", False)
 
                 # computed arrays are called _computed.
                 # loop over dependencies and check if they are modified
-                for dependee_str in cls._depends[func.__name__]:
+                inv_depends = None
+                for dependee_str in depends:
                     dependee = getattr(self, dependee_str)
                     # is modified?
                     if dependee._modified:
-                        for inv in cls._inv_depends[dependee_str]:
-                            self._computed._saved[inv] = None
+                        if inv_depends is None:
+                            inv_depends = cls._resolve(type(self)).inv_depends
+                        computed_data._digests.pop(dependee_str, None)
+                        for inv in inv_depends.get(dependee_str, ()):
+                            computed_data._invalidate(inv, dependee_str)
+
+                # values of default arguments are saved as they are.
+                # others go to memo
+                key = None
+                if len(args) > 1 or kwargs:
+                    if default_key is None:
+                        default_key = args_key(args[:1], {})
+                    try:
+                        key = args_key(args, kwargs)
+                    except TypeError:
+                        # unhashable arguments - compute, but don't save
+                        key = _UNHASHABLE
+                    if key == default_key:
+                        key = None
 
                 # is saved / want to recompute?
-                # recompute is added for computed values that accepts params.
-                saved = self._computed._saved.get(func.__name__, None)
+                if key is None:
+                    saved = computed_data._saved.get(func.__name__, None)
+                elif key is _UNHASHABLE:
+                    saved = None
+                else:
+                    memo = computed_data._memo.get(func.__name__, None)
+                    saved = None if memo is None else memo.get(key, None)
+                    if saved is not None:
+                        memo.move_to_end(key)
+
+                entry_key = (
+                    func.__name__ if key is None else (func.__name__, key)
+                )
                 if saved is not None and not recompute:
+                    computed_data._touch(entry_key)
+                    computed_data._record(func.__name__, hits=1)
                     return saved
 
-                # we've reached this point because we have to compute this
-                computed = func(*args, **kwargs)
-                if isinstance(computed, np.ndarray):
-                    computed.flags.writeable = False  # configurable?
-                self._computed._saved[func.__name__] = computed
+                # we've reached this point because we have to compute this,
+                # take it from shared topology or load it from disk
+                start = perf_counter()
+                computed = None
+                content_key = None
+                shared = (
+                    settings.COMPUTED_SHARED_TOPOLOGY
+                    and getattr(type(self), "__shared_topology__", True)
+                    and set(depends) == {"elements"}
+                )
+                cache_dir = settings.COMPUTED_CACHE_DIR
+                on_disk = cache_dir is not None and persistent
+                if (shared or on_disk) and key is not _UNHASHABLE:
+                    content_key = computed_data._content_key(
+                        func.__name__, key
+                    )
+                    if shared and not recompute:
+                        computed = SHARED_TOPOLOGY.get(content_key, None)
+                        if computed is not None:
+                            SHARED_TOPOLOGY.move_to_end(content_key)
+                    if computed is None and on_disk and not recompute:
+                        computed = disk_cache.load(
+                            cache_dir, content_key, _PERSISTENT_TYPES
+                        )
+                loaded = computed is not None
+
+                if not loaded:
+                    computed = func(*args, **kwargs)
+                    if isinstance(computed, np.ndarray):
+                        computed.flags.writeable = False  # configurable?
+                    if on_disk and content_key is not None:
+                        disk_cache.save(cache_dir, content_key, computed)
+
+                if shared and content_key is not None:
+                    _share_topology(content_key, computed)
+
+                if settings.COMPUTED_STATS:
+                    computed_data._record(
+                        func.__name__,
+                        misses=int(not loaded),
+                        loads=int(loaded),
+                        time=perf_counter() - start,
+                        nbytes=_nbytes(computed),
+                    )
+
+                if key is None:
+                    computed_data._saved[func.__name__] = computed
+                elif key is not _UNHASHABLE:
+                    memo = computed_data._memo.setdefault(
+                        func.__name__, OrderedDict()
+                    )
+                    memo[key] = computed
+                    memo.move_to_end(key)
+                    while len(memo) > settings.COMPUTED_LRU_SIZE:
+                        computed_data._lru.pop(
+                            (func.__name__, memo.popitem(last=False)[0]), None
+                        )
+
+                if key is not _UNHASHABLE:
+                    computed_data._touch(entry_key)
+                    computed_data._evict(keep=entry_key)
 
                 # so, all fresh. we can press NOT-modified  button
-                for dependee_str in cls._depends[func.__name__]:
+                for dependee_str in depends:
                     dependee = getattr(self, dependee_str)
                     dependee._modified = False
 
@@ -458,6 +1275,35 @@ class ComputedData(DataHolder):
 
         return inner
 
+    def valid_items(self):
+        """Returns saved values, whose dependencies are not modified since
+        they were computed.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        valid: dict
+        """
+        depends = self._resolve(type(self._helpee)).depends
+        modified = {}
+        valid = {}
+        for key, value in self._saved.items():
+            if value is None:
+                continue
+
+            for name in depends[key]:
+                if name not in modified:
+                    modified[name] = getattr(self._helpee, name)._modified
+                if modified[name]:
+                    break
+            else:
+                valid[key] = value
+
+        return valid
+
 
 class VertexData(DataHolder):
     """
@@ -561,8 +1407,10 @@ class VertexData(DataHolder):
         self._validate_len(value, raise_=True)
 
         # we are here because this is valid
-        self._saved[key] = make_tracked_array(value, copy=False).reshape(
-            len(self._helpee.vertices), -1
+        self._saved[key] = make_tracked_array(
+            np.reshape(value, (len(self._helpee.vertices), -1)),
+            copy=False,
+            owner=(self, key),
         )
 
         # if "data" or "arrow_data" is empty in show_options, we want to
@@ -707,6 +1555,51 @@ Unique2DIntegers.inverse.__doc__ = """`(m) np.ndarray`
 Unique2DIntegers.counts.__doc__ = """`(n) np.ndarray`
     Field number 3"""
 
+Adjacency = namedtuple("Adjacency", ["offsets", "indices"])
+Adjacency.__doc__ = """
+namedtuple to hold adjacency information in compressed sparse row (CSR)
+format. Entries adjacent to i-th item are
+`indices[offsets[i]:offsets[i + 1]]`.
+"""
+
+Adjacency.offsets.__doc__ = """`(n + 1) np.ndarray`
+    Field number 0"""
+Adjacency.indices.__doc__ = """`(m) np.ndarray`
+    Field number 1"""
+
+EditArrays = namedtuple("EditArrays", ["vertices", "elements"])
+EditArrays.__doc__ = """
+namedtuple to hold untracked, writeable views of mesh arrays. See
+`Vertices.edit()`.
+"""
+
+EditArrays.vertices.__doc__ = """`(n, d) np.ndarray`
+    Field number 0"""
+EditArrays.elements.__doc__ = """`(m, k) np.ndarray` or None
+    Field number 1"""
+
+DependencyInfo = namedtuple(
+    "DependencyInfo", ["depends", "inv_depends", "evict_first", "persistent"]
+)
+DependencyInfo.__doc__ = """
+namedtuple to hold dependency info of computed data of a helpee class. See
+`ComputedData._resolve()`.
+"""
+
+DependencyInfo.depends.__doc__ = """`dict`
+    Dependees per function name. Field number 0"""
+DependencyInfo.inv_depends.__doc__ = """`dict`
+    Function names per dependee. Field number 1"""
+DependencyInfo.evict_first.__doc__ = """`frozenset`
+    Function names, that are evicted first. Field number 2"""
+DependencyInfo.persistent.__doc__ = """`frozenset`
+    Function names, that are saved on disk. Field number 3"""
+
+# namedtuples that can be loaded from disk cache
+_PERSISTENT_TYPES = {
+    t.__name__: t for t in (Unique2DFloats, Unique2DIntegers, Adjacency)
+}
+
 
 class ComputedMeshData(ComputedData):
     """A class to hold computed-mesh-data.
@@ -0,0 +1,160 @@
+"""gustaf/gustaf/helpers/disk_cache.py.
+
+Content-addressed on-disk cache for computed data. Each entry is a
+directory of raw `.npy` files, which are memory-mapped on load. See
+`settings.COMPUTED_CACHE_DIR`.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+_META = "meta.json"
+
+
+def content_hash(*items):
+    """Returns a hex digest of arrays and strings. Arrays are hashed with
+    dtype, shape and their raw bytes.
+
+    Parameters
+    -----------
+    *items: np.ndarray or str
+
+    Returns
+    --------
+    digest: str
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    for item in items:
+        if isinstance(item, np.ndarray):
+            hasher.update(f"{item.dtype.str}{item.shape}".encode())
+            hasher.update(np.ascontiguousarray(item).data)
+        else:
+            hasher.update(str(item).encode())
+        # separator
+        hasher.update(b"\0")
+
+    return hasher.hexdigest()
+
+
+def _fields(value):
+    """Splits value into arrays and meta info. Supports arrays and
+    namedtuples of arrays, None and empty sequences.
+
+    Parameters
+    -----------
+    value: object
+
+    Returns
+    --------
+    meta_and_arrays: tuple or None
+      None, if value can't be saved.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return None
+        return {"type": "ndarray", "fields": ["array"]}, [value]
+
+    if not (isinstance(value, tuple) and hasattr(value, "_fields")):
+        return None
+
+    kinds = []
+    arrays = []
+    for field in value:
+        if isinstance(field, np.ndarray) and not field.dtype.hasobject:
+            kinds.append("array")
+            arrays.append(field)
+        elif field is None:
+            kinds.append("none")
+        elif isinstance(field, (list, tuple)) and len(field) == 0:
+            kinds.append("empty")
+        else:
+            return None
+
+    return {"type": type(value).__name__, "fields": kinds}, arrays
+
+
+def save(directory, key, value):
+    """Saves value, if it is supported and not saved yet. Entry is written
+    to a temporary directory first and renamed, so that concurrent jobs
+    never read partial entries.
+
+    Parameters
+    -----------
+    directory: str
+    key: str
+    value: np.ndarray or namedtuple
+
+    Returns
+    --------
+    saved: bool
+    """
+    split = _fields(value)
+    if split is None:
+        return False
+
+    meta, arrays = split
+    entry = os.path.join(directory, key)
+    if os.path.isdir(entry):
+        return True
+
+    os.makedirs(directory, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=f".{key}-", dir=directory)
+    try:
+        for i, array in enumerate(arrays):
+            np.save(os.path.join(tmp, f"{i}.npy"), np.asarray(array))
+        with open(os.path.join(tmp, _META), "w") as f:
+            json.dump(meta, f)
+        os.rename(tmp, entry)
+    except OSError:
+        # most likely, another job was faster
+        shutil.rmtree(tmp, ignore_errors=True)
+        return os.path.isdir(entry)
+
+    return True
+
+
+def load(directory, key, types):
+    """Loads memory-mapped value. Returns None on miss or broken entry.
+
+    Parameters
+    -----------
+    directory: str
+    key: str
+    types: dict
+      namedtuple types by name.
+
+    Returns
+    --------
+    value: np.ndarray or namedtuple or None
+    """
+    entry = os.path.join(directory, key)
+    try:
+        with open(os.path.join(entry, _META)) as f:
+            meta = json.load(f)
+
+        fields = []
+        i = 0
+        for kind in meta["fields"]:
+            if kind == "array":
+                fields.append(
+                    np.load(os.path.join(entry, f"{i}.npy"), mmap_mode="r")
+                )
+                i += 1
+            else:
+                fields.append(None if kind == "none" else [])
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if meta["type"] == "ndarray":
+        return fields[0]
+
+    value_type = types.get(meta["type"], None)
+    if value_type is None:
+        return None
+
+    return value_type(*fields)
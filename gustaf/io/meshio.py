@@ -11,6 +11,7 @@ import numpy as np
 from gustaf.edges import Edges
 from gustaf.faces import Faces
 from gustaf.helpers.raise_if import ModuleImportRaiser
+from gustaf.mixed import Mixed
 from gustaf.utils import log
 from gustaf.vertices import Vertices
 from gustaf.volumes import Volumes
@@ -29,10 +30,23 @@ _meshio2gus = {
     "vertex": Vertices,
 }
 
+# meshio cell types that can be loaded as Mixed
+_meshio2mixed = {
+    "line": "edges",
+    "triangle": "tri",
+    "quad": "quad",
+    "tetra": "tet",
+    "pyramid": "pyramid",
+    "wedge": "prism",
+    "hexahedron": "hexa",
+}
+
 
-def load(fname):
+def load(fname, mixed=False):
     """Load mesh in meshio format. Loads vertices and their connectivity.
-    Currently cannot process boundary.
+    Currently cannot process boundary. If `mixed` is True, all cells are
+    loaded into one Mixed object, which shares one vertex array. This also
+    supports `pyramid` and `wedge` cells.
 
     Note
     -----
@@ -43,10 +57,12 @@ def load(fname):
     Parameters
     ------------
     fname: str | pathlib.Path
+    mixed: bool
+      Default is False. If True, returns Mixed.
 
     Returns
     --------
-    MESH_TYPES | List[MESH_TYPES]
+    MESH_TYPES | List[MESH_TYPES] | Mixed
     """
     # fname sanity check
     fname = pathlib.Path(fname)
@@ -66,12 +82,29 @@ def load(fname):
     if len(meshio_mesh.cells_dict) == 0:
         return Vertices(vertices)
 
+    if mixed:
+        blocks = {}
+        for element_type, elements in meshio_mesh.cells_dict.items():
+            if element_type not in _meshio2mixed:
+                log.warning(
+                    f"`{element_type}`-elements are not supported in gustaf"
+                )
+                continue
+            blocks[_meshio2mixed[element_type]] = elements
+
+        return Mixed.from_blocks(vertices, blocks)
+
     meshes = []
     for element_type, elements in meshio_mesh.cells_dict.items():
         # skip unsupported
         if element_type not in _meshio2gus:
             log.warning(
                 f"`{element_type}`-elements are not supported in gustaf"
+                + (
+                    ". Try loading with `mixed=True`."
+                    if element_type in _meshio2mixed
+                    else ""
+                )
             )
             continue
         if element_type.startswith("vertex"):
@@ -134,7 +167,7 @@ def export(fname, mesh, submeshes=None, **kwargs):
     ------------
     fname: Union[str, pathlib.Path]
       File to save the mesh in.
-    mesh: Edges, Faces or Volumes
+    mesh: Edges, Faces, Volumes or Mixed
       Input mesh
     submeshes: Iterable
       Submeshes where the vertices are identical to the main mesh. The element
@@ -159,6 +192,8 @@ def export(fname, mesh, submeshes=None, **kwargs):
         "tri": "triangle",
         "quad": "quad",
         "tet": "tetra",
+        "pyramid": "pyramid",
+        "prism": "wedge",
         "hexa": "hexahedron",
     }
 
@@ -172,7 +207,14 @@ def export(fname, mesh, submeshes=None, **kwargs):
     # Iterate the meshes and extract the element information in meshio format
     for m in meshes:
         whatami = m.whatami
-        if whatami not in meshio_dict:
+        if whatami == "mixed":
+            if np.any(m.connectivity > len(m.vertices) - 1):
+                raise ValueError("Invalid vertex IDs in submesh connectivity.")
+            cells.extend(
+                (meshio_dict[cell_type], elements)
+                for cell_type, (_, elements) in m.blocks().items()
+            )
+        elif whatami not in meshio_dict:
             raise NotImplementedError(
                 f"{whatami}-type meshes not supported (yet)."
             )
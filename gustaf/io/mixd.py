@@ -120,6 +120,7 @@ def export(
     mesh,
     space_time=False,
     dual=False,
+    conforming=True,
 ):
     """Export in mixd format. Supports triangle, quadrilateral, tetrahedron,
     and hexahedron semi-discrete and (flat) space-time mesh output.
@@ -132,6 +133,10 @@ def export(
       Export Mesh as Space-Time Slab for discontinuous space-time
     dual: bool
       Includes dual-subelement information.
+    conforming: bool
+      Default is True. Dual is computed from connectivity. If False, dual is
+      found by matching sub-element centers within
+      `gustaf.settings.TOLERANCE`. Useful for meshes with unmerged vertices.
 
     Returns
     --------
@@ -203,46 +208,10 @@ def export(
 
     # if dual is True, we fill dual infos.
     if dual:
-        sub_elements = mesh.to_subelements(False)
-        # this should be always dividable without remnants
-        n_subelem_per_elem, rem = divmod(
-            len(sub_elements.elements), len(mesh.elements)
-        )
-        if rem != 0:
-            raise ValueError(
-                "something went wrong with subelement creation."
-                "Please report this issue, thank you!"
-            )
-
-        # get intersection - can use this info to determine duals
-        _, _, _, intersections = close_rows(
-            sub_elements.centers(), settings.TOLERANCE, True
-        )
-
-        # loop intersections and look for 2 intersections
-        for i, intersection in enumerate(intersections):
-            n_inter = len(intersection)
-
-            # we modify interface only if there're 2 intersections.
-            if n_inter == 2:
-                # intersection is always sorted.
-                # we don't want dual to point to itself
-                dual_id = 0 if i != intersection[0] else 1
-
-                # get element number and apply fortran's offset, 1
-                sub_interface[i] = -int(
-                    intersection[dual_id] // n_subelem_per_elem + 1
-                )
-                continue
-
-            # intersection should be at most 2. Otherwise, it either means
-            # that you have a bad mesh or to big tolerance
-            if n_inter > 2:
-                raise ValueError(
-                    f"{i}-th subelement overlaps more than once. "
-                    "Please check your elements or decrease "
-                    "gustaf.settings.TOLERANCE."
-                )
+        if conforming:
+            sub_interface = _topological_dual(mesh, sub_interface)
+        else:
+            sub_interface = _geometric_dual(mesh, sub_interface)
 
         # write dual
         with open(dual_file, "wb") as df:
@@ -308,3 +277,95 @@ def make_mrng(mesh):
         boundaries[belem_ids] = i + 1  # bid starts at 1
 
     return boundaries
+
+
+def _topological_dual(mesh, sub_interface):
+    """
+    Fills dual information to the given subelement interface array, using
+    element neighbors. Elements are neighbors if they share a sub-element.
+
+    Parameters
+    -----------
+    mesh: Faces or Volumes
+    sub_interface: (n,) np.ndarray
+      mrng-array. Will be modified inplace.
+
+    Returns
+    --------
+    sub_interface: (n,) np.ndarray
+    """
+    unique_subelements = getattr(
+        mesh, f"unique_{mesh.__boundary_class__.__qualname__.lower()}"
+    )()
+    if (unique_subelements.counts > 2).any():
+        raise ValueError(
+            "Some subelements are shared by more than two elements. "
+            "Please check your elements."
+        )
+
+    neighbors = mesh.element_neighbors().ravel()
+    has_dual = neighbors > -1
+
+    # apply fortran's offset, 1
+    sub_interface[has_dual] = -(neighbors[has_dual] + 1)
+
+    return sub_interface
+
+
+def _geometric_dual(mesh, sub_interface):
+    """
+    Fills dual information to the given subelement interface array, by
+    matching sub-element centers.
+
+    Parameters
+    -----------
+    mesh: Faces or Volumes
+    sub_interface: (n,) np.ndarray
+      mrng-array. Will be modified inplace.
+
+    Returns
+    --------
+    sub_interface: (n,) np.ndarray
+    """
+    sub_elements = mesh.to_subelements(False)
+    # this should be always dividable without remnants
+    n_subelem_per_elem, rem = divmod(
+        len(sub_elements.elements), len(mesh.elements)
+    )
+    if rem != 0:
+        raise ValueError(
+            "something went wrong with subelement creation."
+            "Please report this issue, thank you!"
+        )
+
+    # get intersection - can use this info to determine duals
+    _, _, _, intersections = close_rows(
+        sub_elements.centers(), settings.TOLERANCE, True
+    )
+
+    # loop intersections and look for 2 intersections
+    for i, intersection in enumerate(intersections):
+        n_inter = len(intersection)
+
+        # we modify interface only if there're 2 intersections.
+        if n_inter == 2:
+            # intersection is always sorted.
+            # we don't want dual to point to itself
+            dual_id = 0 if i != intersection[0] else 1
+
+            # get element number and apply fortran's offset, 1
+            sub_interface[i] = -int(
+                intersection[dual_id] // n_subelem_per_elem + 1
+            )
+            continue
+
+        # intersection should be at most 2. Otherwise, it either means
+        # that you have a bad mesh or to big tolerance
+        if n_inter > 2:
+            raise ValueError(
+                f"{i}-th subelement overlaps more than once. "
+                "Please check your elements or decrease "
+                "gustaf.settings.TOLERANCE."
+            )
+
+    return sub_interface
@@ -0,0 +1,835 @@
+"""gustaf/gustaf/mixed.py.
+
+Mixed. Mixed-element mesh, where elements of different types share one
+vertex array. Connectivity is saved in a flat, CSR-like format.
+"""
+
+import numpy as np
+
+from gustaf import helpers, settings, show, utils
+from gustaf.edges import Edges
+from gustaf.faces import Faces
+from gustaf.helpers.options import Option
+from gustaf.vertices import Vertices
+from gustaf.volumes import Volumes
+
+# vtk cell types are needed to show mixed meshes
+has_vtk = False
+try:
+    import vtk
+
+    has_vtk = True
+except ImportError as err:
+    vtk = helpers.raise_if.ModuleImportRaiser("vtk", err)
+
+# cell type codes are indices of this tuple
+CELL_TYPES = ("edges", "tri", "quad", "tet", "pyramid", "prism", "hexa")
+
+# gustaf classes that can hold a single cell type
+_CELL_TYPE_CLASSES = {
+    "edges": Edges,
+    "tri": Faces,
+    "quad": Faces,
+    "tet": Volumes,
+    "hexa": Volumes,
+}
+
+_VOLUME_CELL_TYPES = ("tet", "pyramid", "prism", "hexa")
+
+# cells are given by connectivity, offsets and cell types. Computed data
+# depends on all of them
+_CELLS = ["elements", "offsets", "cell_types"]
+
+_N_NODES = np.array(
+    [utils.connec.reference_n_nodes(ct) for ct in CELL_TYPES],
+    dtype=settings.INT_DTYPE,
+)
+
+
+class MixedShowOption(helpers.options.ShowOption):
+    """
+    Show options for mixed.
+    """
+
+    _valid_options = helpers.options.make_valid_options(
+        *helpers.options.vedo_common_options,
+        Option("vedo", "lw", "Width of edges (lines) in pixel units.", (int,)),
+        Option(
+            "vedo", "lc", "Color of edges (lines).", (int, str, tuple, list)
+        ),
+    )
+
+    _helps = "Mixed"
+
+    def _initialize_showable(self):
+        """
+        Initialize mixed as vedo.UGrid.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        mixed: vedo.UGrid
+        """
+        if not has_vtk:
+            raise ImportError(
+                "Showing Mixed requires vtk, which is installed with vedo. "
+                "Please install vedo, for example `pip install vedo`."
+            )
+
+        to_vtktype = {
+            "edges": vtk.VTK_LINE,
+            "tri": vtk.VTK_TRIANGLE,
+            "quad": vtk.VTK_QUAD,
+            "tet": vtk.VTK_TETRA,
+            "pyramid": vtk.VTK_PYRAMID,
+            "prism": vtk.VTK_WEDGE,
+            "hexa": vtk.VTK_HEXAHEDRON,
+        }
+        offsets = np.asarray(self._helpee.offsets)
+        cells = np.split(np.asarray(self._helpee.connectivity), offsets[1:-1])
+        u_grid = show.vedoUGrid(
+            [
+                self._helpee.const_vertices,
+                cells,
+                [
+                    to_vtktype[CELL_TYPES[ct]]
+                    for ct in np.asarray(self._helpee.cell_types)
+                ],
+            ]
+        )
+
+        for option in ["lw", "lc"]:
+            val = self.get(option, False)
+            if val:
+                getattr(u_grid, option)(val)
+
+        return u_grid.c("hotpink")
+
+
+class Mixed(Vertices):
+    kind = "mixed"
+
+    # elements don't include offsets and cell_types. Can't be shared by
+    # content of elements.
+    __shared_topology__ = False
+
+    __slots__ = (
+        "_connectivity",
+        "_offsets",
+        "_cell_types",
+    )
+
+    __show_option__ = MixedShowOption
+
+    def __init__(
+        self,
+        vertices=None,
+        connectivity=None,
+        offsets=None,
+        cell_types=None,
+    ):
+        """Mixed. It has vertices and cells of mixed types. Connectivity
+        of i-th cell is `connectivity[offsets[i]:offsets[i + 1]]` and its
+        type is `CELL_TYPES[cell_types[i]]`.
+
+        Parameters
+        -----------
+        vertices: (n, d) np.ndarray
+        connectivity: (m,) np.ndarray
+        offsets: (n_cells + 1,) np.ndarray
+          (Optional) If None, computed from cell_types.
+        cell_types: (n_cells,) np.ndarray
+          Cell type codes. See `CELL_TYPES`.
+        """
+        super().__init__(vertices=vertices)
+
+        self.cell_types = cell_types
+        self.connectivity = connectivity
+        if offsets is None:
+            offsets = np.zeros(
+                len(self.cell_types) + 1, dtype=settings.INT_DTYPE
+            )
+            np.cumsum(_N_NODES[self.cell_types], out=offsets[1:])
+        self.offsets = offsets
+
+    @classmethod
+    def from_blocks(cls, vertices, blocks):
+        """Creates Mixed from a dict of element arrays, one per cell type.
+        Cells are ordered block by block.
+
+        Parameters
+        -----------
+        vertices: (n, d) np.ndarray
+        blocks: dict
+          cell type as key and (m, k) np.ndarray as value.
+
+        Returns
+        --------
+        mixed: Mixed
+        """
+        connectivity = []
+        cell_types = []
+        for cell_type, block in blocks.items():
+            if cell_type not in CELL_TYPES:
+                raise ValueError(
+                    f"Unknown cell type `{cell_type}`. Supported types are "
+                    f"{CELL_TYPES}."
+                )
+            elements = np.asarray(block, dtype=settings.INT_DTYPE)
+            utils.arr.is_shape(
+                elements,
+                (-1, _N_NODES[CELL_TYPES.index(cell_type)]),
+                strict=True,
+            )
+            connectivity.append(elements.ravel())
+            cell_types.append(
+                np.full(len(elements), CELL_TYPES.index(cell_type))
+            )
+
+        return cls(
+            vertices=vertices,
+            connectivity=(
+                np.concatenate(connectivity) if connectivity else None
+            ),
+            cell_types=np.concatenate(cell_types) if cell_types else None,
+        )
+
+    @classmethod
+    def from_meshes(cls, *meshes):
+        """Creates Mixed from meshes that share the same vertices, for
+        example, a list returned by `io.meshio.load`. Vertices of the first
+        mesh are used.
+
+        Parameters
+        -----------
+        *meshes: Edges, Faces or Volumes
+
+        Returns
+        --------
+        mixed: Mixed
+        """
+        if len(meshes) == 1 and isinstance(meshes[0], (list, tuple)):
+            meshes = meshes[0]
+
+        blocks = {}
+        for m in meshes:
+            if m.whatami in blocks:
+                blocks[m.whatami] = np.vstack(
+                    (blocks[m.whatami], m.const_elements)
+                )
+            else:
+                blocks[m.whatami] = m.const_elements
+
+        return cls.from_blocks(meshes[0].vertices, blocks)
+
+    @property
+    def connectivity(self):
+        """Returns flat connectivity of all cells.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        connectivity: (m,) np.ndarray
+        """
+        self._logd("returning connectivity")
+        return self._connectivity
+
+    @connectivity.setter
+    def connectivity(self, connectivity):
+        """Connectivity setter. Similar to vertices, this will be a tracked
+        array.
+
+        Parameters
+        -----------
+        connectivity: (m,) np.ndarray
+
+        Returns
+        --------
+        None
+        """
+        self._logd("setting connectivity")
+        if connectivity is None:
+            connectivity = []
+        self._connectivity = helpers.data.make_tracked_array(
+            np.ravel(connectivity),
+            settings.INT_DTYPE,
+            copy=False,
+            owner=(self, "_connectivity"),
+        )
+
+    @property
+    def offsets(self):
+        """Returns offsets of each cell in connectivity.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        offsets: (n_cells + 1,) np.ndarray
+        """
+        self._logd("returning offsets")
+        return self._offsets
+
+    @offsets.setter
+    def offsets(self, offsets):
+        """Offsets setter. Similar to vertices, this will be a tracked array.
+
+        Parameters
+        -----------
+        offsets: (n_cells + 1,) np.ndarray
+
+        Returns
+        --------
+        None
+        """
+        self._logd("setting offsets")
+        if offsets is None:
+            offsets = []
+        self._offsets = helpers.data.make_tracked_array(
+            np.ravel(offsets),
+            settings.INT_DTYPE,
+            copy=False,
+            owner=(self, "_offsets"),
+        )
+
+    @property
+    def cell_types(self):
+        """Returns cell type codes. Names can be looked up in `CELL_TYPES`.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        cell_types: (n_cells,) np.ndarray
+        """
+        self._logd("returning cell_types")
+        return self._cell_types
+
+    @cell_types.setter
+    def cell_types(self, cell_types):
+        """Cell types setter. Similar to vertices, this will be a tracked
+        array.
+
+        Parameters
+        -----------
+        cell_types: (n_cells,) np.ndarray
+
+        Returns
+        --------
+        None
+        """
+        self._logd("setting cell_types")
+        if cell_types is None:
+            cell_types = []
+        self._cell_types = helpers.data.make_tracked_array(
+            np.ravel(cell_types),
+            np.int8,
+            copy=False,
+            owner=(self, "_cell_types"),
+        )
+
+    @property
+    def elements(self):
+        """Returns connectivity.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        elements: (m,) np.ndarray
+        """
+        return self._connectivity
+
+    @property
+    def whatami(self):
+        """Mixed. Types of each cell is given by `cell_types`.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        whatami: str
+        """
+        return "mixed"
+
+    @helpers.data.ComputedMeshData.depends_on(_CELLS)
+    def blocks(self):
+        """Returns cells grouped by type as dense arrays. Each block is
+        gathered at once, so topology related operations can be vectorized
+        per cell type.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        blocks: dict
+          cell type as key and tuple of (cell_ids, elements) as value.
+        """
+        self._logd("computing blocks")
+        offsets = np.asarray(self.offsets)
+        cell_types = np.asarray(self.cell_types)
+        connectivity = np.asarray(self.connectivity)
+
+        if len(offsets) != len(cell_types) + 1:
+            raise ValueError(
+                "Number of offsets should be number of cells + 1."
+            )
+        if not np.array_equal(np.diff(offsets), _N_NODES[cell_types]):
+            raise ValueError("Offsets and cell types do not match.")
+
+        blocks = {}
+        for code in np.unique(cell_types):
+            ids = np.flatnonzero(cell_types == code)
+            n_nodes = _N_NODES[code]
+            elements = connectivity[
+                offsets[ids].reshape(-1, 1) + np.arange(n_nodes)
+            ]
+            blocks[CELL_TYPES[code]] = (ids, elements)
+
+        return blocks
+
+    @helpers.data.ComputedMeshData.depends_on(
+        ["vertices", *_CELLS], evict_first=True
+    )
+    def centers(self):
+        """Center of cells.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        centers: (n_cells, d) np.ndarray
+        """
+        self._logd("computing centers")
+        centers = np.empty(
+            (len(self.cell_types), self.const_vertices.shape[1]),
+            dtype=settings.FLOAT_DTYPE,
+        )
+        for ids, elements in self.blocks().values():
+            centers[ids] = self.const_vertices[elements].mean(axis=1)
+
+        return centers
+
+    @helpers.data.ComputedMeshData.depends_on(_CELLS, evict_first=True)
+    def edges(self):
+        """Edges of all cells, extracted directly from each cell. Edges of
+        each block are placed consecutively.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        edges: (n, 2) np.ndarray
+        """
+        self._logd("computing edges")
+        edges = [
+            utils.connec.to_subelements(elements, cell_type, "edges")
+            for cell_type, (_, elements) in self.blocks().items()
+        ]
+
+        if len(edges) == 0:
+            return np.empty((0, 2), dtype=settings.INT_DTYPE)
+
+        return np.vstack(edges)
+
+    @helpers.data.ComputedMeshData.depends_on(_CELLS)
+    def unique_edges(self):
+        """Returns a namedtuple of unique edges info.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        unique_info: Unique2DIntegers
+          valid attributes are {values, ids, inverse, counts}
+        """
+        self._logd("computing unique_edges")
+        edges = self.edges()
+        unique_info = utils.connec.sorted_unique(np.sort(edges, axis=1))
+        unique_info.values[:] = edges[unique_info.ids]
+
+        return unique_info
+
+    @helpers.data.ComputedMeshData.depends_on(_CELLS, evict_first=True)
+    def faces(self):
+        """Faces of volumetric cells, grouped by face type. Each face appears
+        once per cell and faces point outwards.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        faces: dict
+          face type as key and (n, 3) or (n, 4) np.ndarray as value.
+        """
+        self._logd("computing faces")
+        faces = {}
+        for cell_type, (_, elements) in self.blocks().items():
+            if cell_type not in _VOLUME_CELL_TYPES:
+                continue
+            for face_type in utils.connec.reference_subelements(cell_type):
+                if face_type == "edges":
+                    continue
+                faces.setdefault(face_type, []).append(
+                    utils.connec.to_subelements(elements, cell_type, face_type)
+                )
+
+        return {ft: np.vstack(fs) for ft, fs in faces.items()}
+
+    @helpers.data.ComputedMeshData.depends_on(_CELLS)
+    def unique_faces(self):
+        """Returns namedtuples of unique faces info, per face type.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        unique_info: dict
+          face type as key and Unique2DIntegers as value.
+        """
+        self._logd("computing unique_faces")
+        unique_faces = {}
+        for face_type, faces in self.faces().items():
+            unique_info = utils.connec.sorted_unique(np.sort(faces, axis=1))
+            unique_info.values[:] = faces[unique_info.ids]
+            unique_faces[face_type] = unique_info
+
+        return unique_faces
+
+    @helpers.data.ComputedMeshData.depends_on(_CELLS)
+    def single_faces(self):
+        """Returns indices of faces that appear only once, per face type.
+        For well constructed volumes, this can be considered as surfaces.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        single_faces: dict
+          face type as key and (m,) np.ndarray as value.
+        """
+        return {
+            face_type: unique_info.ids[unique_info.counts == 1]
+            for face_type, unique_info in self.unique_faces().items()
+        }
+
+    @helpers.data.ComputedMeshData.depends_on(
+        ["vertices", "elements"], evict_first=True
+    )
+    def referenced_vertices(self):
+        """Returns mask of referenced vertices.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        referenced: (n,) np.ndarray
+        """
+        referenced = np.zeros(len(self.const_vertices), dtype=bool)
+        referenced[self.connectivity] = True
+
+        return referenced
+
+    def update_vertices(self, mask, inverse=None):
+        """Keeps only masked vertices. Cells that reference removed vertices
+        are removed.
+
+        Parameters
+        -----------
+        mask: (n,) bool or int
+        inverse: (len(self.vertices),) int
+
+        Returns
+        --------
+        updated_self: Mixed
+        """
+        mask = np.asarray(mask)
+        if (mask.dtype.kind == "b" and mask.all()) or len(mask) == 0:
+            return self
+
+        cell_mask = None
+        if inverse is None:
+            inverse = np.full(len(self.vertices), -1, dtype=settings.INT_DTYPE)
+            if mask.dtype.kind == "b":
+                inverse[mask] = np.arange(mask.sum())
+            else:
+                inverse[mask] = np.arange(len(mask))
+
+            # remove cells with removed vertices
+            removed = inverse[self.connectivity] < 0
+            if removed.any():
+                cell_mask = ~np.logical_or.reduceat(removed, self.offsets[:-1])
+
+        connectivity = inverse[self.connectivity]
+        vertex_data = self.vertex_data._saved.copy()
+
+        self.vertices = self.const_vertices[mask]
+        self.connectivity = connectivity
+        for key, values in vertex_data.items():
+            self.vertex_data[key] = values[mask]
+
+        if cell_mask is not None:
+            self._select_cells(cell_mask)
+
+        return self
+
+    def _select_cells(self, mask):
+        """Keeps selected cells, without touching vertices.
+
+        Parameters
+        -----------
+        mask: (n_cells,) bool or int
+
+        Returns
+        --------
+        None
+        """
+        mask = np.asarray(mask)
+        ids = np.arange(len(self.cell_types))[mask]
+        offsets = np.asarray(self.offsets)
+        n_nodes = offsets[ids + 1] - offsets[ids]
+
+        new_offsets = np.zeros(len(ids) + 1, dtype=settings.INT_DTYPE)
+        np.cumsum(n_nodes, out=new_offsets[1:])
+        gather = np.repeat(offsets[ids] - new_offsets[:-1], n_nodes)
+        gather += np.arange(new_offsets[-1])
+
+        self.connectivity = np.asarray(self.connectivity)[gather]
+        self.cell_types = np.asarray(self.cell_types)[ids]
+        self.offsets = new_offsets
+
+    def remove_unreferenced_vertices(self):
+        """Remove unreferenced vertices.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        new_self: Mixed
+        """
+        referenced = self.referenced_vertices()
+
+        inverse = np.zeros(len(self.vertices), dtype=settings.INT_DTYPE)
+        inverse[referenced] = np.arange(referenced.sum())
+
+        return self.update_vertices(mask=referenced, inverse=inverse)
+
+    def update_elements(self, mask):
+        """Keeps only masked cells and removes unreferenced vertices.
+
+        Parameters
+        -----------
+        mask: (n_cells,) bool or int
+
+        Returns
+        --------
+        new_self: Mixed
+        """
+        self._select_cells(mask)
+
+        return self.remove_unreferenced_vertices()
+
+    def reorder(self, method="rcm"):
+        """Renumbers vertices and cells to improve cache locality. Vertex
+        data is permuted accordingly. See `Vertices.reorder()`.
+
+        Parameters
+        -----------
+        method: str
+          "rcm", "hilbert" or "morton". Default is "rcm".
+
+        Returns
+        --------
+        vertex_order: (n,) np.ndarray
+          new_vertices = old_vertices[vertex_order]
+        cell_order: (n_cells,) np.ndarray
+          new cells are renumbered old cells in this order.
+        """
+        if method == "rcm":
+            pairs = [
+                utils.connec.element_vertex_pairs(elements)
+                for _, elements in self.blocks().values()
+            ]
+            pairs = (
+                np.vstack(pairs)
+                if pairs
+                else np.empty((0, 2), dtype=settings.INT_DTYPE)
+            )
+            unique_pairs = utils.connec.sorted_unique(np.sort(pairs, axis=1))
+            vertex_order = utils.connec.reverse_cuthill_mckee(
+                utils.connec.vertex_to_vertex(
+                    unique_pairs.values, len(self.vertices)
+                )
+            )
+        else:
+            vertex_order = utils.arr.space_filling_order(
+                self.const_vertices, curve=method
+            )
+
+        inverse = np.empty_like(vertex_order)
+        inverse[vertex_order] = np.arange(len(vertex_order))
+        connectivity = inverse[self.connectivity]
+
+        # cells are sorted by their smallest new vertex id
+        offsets = np.asarray(self.offsets)
+        cell_order = np.empty(0, dtype=settings.INT_DTYPE)
+        if len(offsets) > 1:
+            cell_order = np.argsort(
+                np.minimum.reduceat(connectivity, offsets[:-1]), kind="stable"
+            ).astype(settings.INT_DTYPE)
+
+        vertex_data = self.vertex_data._saved.copy()
+
+        self.connectivity = connectivity
+        self._select_cells(cell_order)
+        self.vertices = self.const_vertices[vertex_order]
+        for key, values in vertex_data.items():
+            self.vertex_data[key] = values[vertex_order]
+
+        return vertex_order, cell_order
+
+    def to_edges(self, unique=True):
+        """Returns Edges obj.
+
+        Parameters
+        -----------
+        unique: bool
+          Default is True. If True, only takes unique edges.
+
+        Returns
+        --------
+        edges: Edges
+        """
+        return Edges(
+            self.vertices,
+            edges=self.unique_edges().values if unique else self.edges(),
+        )
+
+    def to_faces(self, unique=True):
+        """Returns faces of volumetric cells as Mixed obj.
+
+        Parameters
+        -----------
+        unique: bool
+          Default is True. If True, only takes unique faces.
+
+        Returns
+        --------
+        faces: Mixed
+        """
+        if unique:
+            faces = {
+                ft: unique_info.values
+                for ft, unique_info in self.unique_faces().items()
+            }
+        else:
+            faces = self.faces()
+
+        return Mixed.from_blocks(self.vertices, faces)
+
+    def to_meshes(self):
+        """Returns one mesh per cell type. All of them share vertices of
+        this object. Types without a matching gustaf class, i.e., `pyramid`
+        and `prism`, are not supported.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        meshes: list
+        """
+        meshes = []
+        for cell_type, (_, elements) in self.blocks().items():
+            if cell_type not in _CELL_TYPE_CLASSES:
+                raise NotImplementedError(
+                    f"`{cell_type}` can only be represented as Mixed."
+                )
+            meshes.append(
+                _CELL_TYPE_CLASSES[cell_type](self.vertices, elements=elements)
+            )
+
+        return meshes
+
+    @classmethod
+    def concat(cls, *instances):
+        """Sequentially put them together to make one object. vertex_data
+        is concatenated for keys that all instances have.
+
+        Parameters
+        -----------
+        *instances: List[Mixed]
+          Allows one iterable object also.
+
+        Returns
+        --------
+        one_instance: Mixed
+        """
+        if len(instances) == 1 and hasattr(instances[0], "__iter__"):
+            instances = instances[0]
+        instances = list(instances)
+
+        vertices = []
+        connectivity = []
+        cell_types = []
+        v_offset = 0
+        for ins in instances:
+            if not isinstance(ins, cls):
+                raise TypeError(
+                    "Can't concat. One of the instances is not "
+                    f"`{cls.__name__}`."
+                )
+            vertices.append(ins.const_vertices)
+            connectivity.append(np.asarray(ins.connectivity) + v_offset)
+            cell_types.append(np.asarray(ins.cell_types))
+            v_offset += len(ins.vertices)
+
+        # only keys that every instance has
+        data_keys = set(instances[0].vertex_data.keys())
+        for ins in instances[1:]:
+            data_keys &= set(ins.vertex_data.keys())
+
+        one_instance = cls(
+            vertices=np.vstack(vertices),
+            connectivity=np.concatenate(connectivity),
+            cell_types=np.concatenate(cell_types),
+        )
+        for key in data_keys:
+            one_instance.vertex_data[key] = np.concatenate(
+                [ins.vertex_data[key] for ins in instances]
+            )
+
+        return one_instance
@@ -5,6 +5,27 @@ Global variables/constants that's used throughout `gustaf`.
 
 TOLERANCE = 1e-10
 
+# Number of computed values kept per function for non-default arguments.
+COMPUTED_LRU_SIZE = 8
+
+# Memory budget of computed data per mesh in bytes. None means no limit.
+# Can be set per mesh with `mesh.computed_data.bytes_limit`.
+COMPUTED_BYTES_LIMIT = None
+
+# Records hits, misses, invalidations and compute time of computed data.
+# See `gustaf.utils.stats`.
+COMPUTED_STATS = False
+
+# Directory of on-disk cache for expensive computed data, e.g. unique and
+# single sub-elements. None disables it.
+COMPUTED_CACHE_DIR = None
+
+# Shares computed data that depends only on elements, e.g. unique and single
+# sub-elements, among meshes with the same elements. Number of shared values
+# is limited to COMPUTED_SHARED_TOPOLOGY_SIZE.
+COMPUTED_SHARED_TOPOLOGY = False
+COMPUTED_SHARED_TOPOLOGY_SIZE = 64
+
 FLOAT_DTYPE = "float64"
 INT_DTYPE = "int32"
 
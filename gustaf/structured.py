@@ -0,0 +1,402 @@
+"""gustaf/gustaf/structured.py.
+
+Structured grids. Defined by per-axis coordinates only. Vertices and
+elements are computed on request.
+"""
+
+import numpy as np
+
+from gustaf import settings, utils
+from gustaf._base import GustafBase
+from gustaf.faces import Faces
+from gustaf.volumes import Volumes
+
+# (axis, is_max_side, local sub-element id) of each boundary side.
+# local ids follow `Faces.edges()` and `Volumes.faces()`.
+_BOUNDARY_SIDES = {
+    2: ((1, False, 0), (0, True, 1), (1, True, 2), (0, False, 3)),
+    3: (
+        (2, False, 0),
+        (1, False, 1),
+        (0, True, 2),
+        (1, True, 3),
+        (0, False, 4),
+        (2, True, 5),
+    ),
+}
+
+
+class StructuredGrid(GustafBase):
+    __slots__ = (
+        "_coordinates",
+        "_vertices",
+        "_elements",
+    )
+
+    def __init__(self, bounds=None, resolutions=None, coordinates=None):
+        """StructuredGrid. Quad faces in 2D and hexa volumes in 3D, with the
+        same numbering as `create.faces.box` and `create.volumes.box`.
+        Only per-axis coordinates are saved. `vertices` and `elements` are
+        materialized on first access, while `vertices_of()`,
+        `elements_of()`, `centers()`, `single_faces()` and `locate()` are
+        computed analytically.
+
+        Parameters
+        -----------
+        bounds: (2, d) array-like
+          Minimum and maximum coordinates.
+        resolutions: (d,) array-like
+          Vertex count in each dimension.
+        coordinates: list
+          (Optional) list of (n,) array-like. Increasing coordinates of
+          each axis. If given, bounds and resolutions are ignored.
+        """
+        if coordinates is None:
+            if bounds is None or resolutions is None:
+                raise ValueError(
+                    "Please give either bounds and resolutions or "
+                    "coordinates."
+                )
+            bounds = np.asarray(bounds, dtype=settings.FLOAT_DTYPE)
+            if bounds.ndim != 2 or len(bounds) != 2:
+                raise ValueError("Bounds must have a dimension of (2, d).")
+            if len(resolutions) != bounds.shape[1]:
+                raise ValueError(
+                    "Length of resolutions and bounds should match."
+                )
+            coordinates = [
+                np.linspace(b0, b1, int(r))
+                for b0, b1, r in zip(bounds[0], bounds[1], resolutions)
+            ]
+
+        self._coordinates = [
+            np.asarray(c, dtype=settings.FLOAT_DTYPE).ravel()
+            for c in coordinates
+        ]
+        if len(self._coordinates) not in _BOUNDARY_SIDES:
+            raise ValueError("Only 2D and 3D grids are supported.")
+        for c in self._coordinates:
+            if len(c) < 2 or (np.diff(c) <= 0).any():
+                raise ValueError(
+                    "Each axis needs at least two increasing coordinates."
+                )
+
+        self._vertices = None
+        self._elements = None
+
+    @property
+    def coordinates(self):
+        """Returns per-axis coordinates.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        coordinates: list
+        """
+        return self._coordinates
+
+    @property
+    def resolutions(self):
+        """Returns vertex count in each dimension.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        resolutions: (d,) np.ndarray
+        """
+        return np.array([len(c) for c in self._coordinates])
+
+    @property
+    def kind(self):
+        """face in 2D, volume in 3D.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        kind: str
+        """
+        return "face" if len(self._coordinates) == 2 else "volume"
+
+    @property
+    def whatami(self):
+        """quad in 2D, hexa in 3D.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        whatami: str
+        """
+        return "quad" if len(self._coordinates) == 2 else "hexa"
+
+    @property
+    def n_vertices(self):
+        """Number of vertices.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        n_vertices: int
+        """
+        return int(np.prod(self.resolutions))
+
+    @property
+    def n_elements(self):
+        """Number of elements.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        n_elements: int
+        """
+        return int(np.prod(self.resolutions - 1))
+
+    def bounds(self):
+        """Returns bounds of the grid.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        bounds: (2, d) np.ndarray
+        """
+        return np.array(
+            [
+                [c[0] for c in self._coordinates],
+                [c[-1] for c in self._coordinates],
+            ]
+        )
+
+    def vertices_of(self, ids):
+        """Computes vertices of given ids. The first axis runs fastest.
+
+        Parameters
+        -----------
+        ids: (n,) array-like
+
+        Returns
+        --------
+        vertices: (n, d) np.ndarray
+        """
+        multi_ids = np.unravel_index(
+            np.asarray(ids, dtype=np.int64), self.resolutions[::-1]
+        )[::-1]
+
+        return np.column_stack(
+            [c[i] for c, i in zip(self._coordinates, multi_ids)]
+        )
+
+    def elements_of(self, ids):
+        """Computes connectivity of given element ids.
+
+        Parameters
+        -----------
+        ids: (n,) array-like
+
+        Returns
+        --------
+        elements: (n, 4) or (n, 8) np.ndarray
+        """
+        resolutions = self.resolutions
+        multi_ids = np.unravel_index(
+            np.asarray(ids, dtype=np.int64), (resolutions - 1)[::-1]
+        )
+        base = np.ravel_multi_index(multi_ids, resolutions[::-1])
+
+        n_x = resolutions[0]
+        local = np.array([0, 1, 1 + n_x, n_x])
+        if len(resolutions) == 3:
+            local = np.concatenate((local, local + n_x * resolutions[1]))
+
+        return (base.reshape(-1, 1) + local).astype(settings.INT_DTYPE)
+
+    @property
+    def vertices(self):
+        """Returns vertices. Materialized on first access.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        vertices: (n, d) np.ndarray
+        """
+        if self._vertices is None:
+            self._logd("materializing vertices")
+            self._vertices = self.vertices_of(np.arange(self.n_vertices))
+
+        return self._vertices
+
+    @property
+    def elements(self):
+        """Returns elements. Materialized on first access.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        elements: (n, 4) or (n, 8) np.ndarray
+        """
+        if self._elements is None:
+            self._logd("materializing elements")
+            self._elements = self.elements_of(np.arange(self.n_elements))
+
+        return self._elements
+
+    def centers(self, ids=None):
+        """Center of elements, computed from per-axis mid points.
+
+        Parameters
+        -----------
+        ids: (n,) array-like
+          (Optional) Default is all elements.
+
+        Returns
+        --------
+        centers: (n, d) np.ndarray
+        """
+        if ids is None:
+            ids = np.arange(self.n_elements)
+
+        multi_ids = np.unravel_index(
+            np.asarray(ids, dtype=np.int64), (self.resolutions - 1)[::-1]
+        )[::-1]
+
+        return np.column_stack(
+            [
+                (c[:-1] + c[1:])[i] * 0.5
+                for c, i in zip(self._coordinates, multi_ids)
+            ]
+        )
+
+    def _single_subelements(self):
+        """Sub-element ids on the boundary, i.e.,
+        `element_id * n_sub + local_id`, in ascending order.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        ids: (m,) np.ndarray
+        """
+        n_elements_per_axis = self.resolutions - 1
+        sides = _BOUNDARY_SIDES[len(n_elements_per_axis)]
+        n_sub = len(sides)
+
+        ids = []
+        for axis, is_max, local_id in sides:
+            ranges = [np.arange(n) for n in n_elements_per_axis]
+            ranges[axis] = ranges[axis][-1:] if is_max else ranges[axis][:1]
+            multi_ids = np.meshgrid(*ranges[::-1], indexing="ij")
+            element_ids = np.ravel_multi_index(
+                [m.ravel() for m in multi_ids], n_elements_per_axis[::-1]
+            )
+            ids.append(element_ids * n_sub + local_id)
+
+        return np.sort(np.concatenate(ids)).astype(settings.INT_DTYPE)
+
+    def single_faces(self):
+        """Returns boundary faces as ids of `Volumes.faces()`, in ascending
+        order. Only for 3D grids.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        single_faces: (m,) np.ndarray
+        """
+        if self.kind != "volume":
+            raise ValueError("single_faces() is for 3D grids.")
+
+        return self._single_subelements()
+
+    def single_edges(self):
+        """Returns boundary edges as ids of `Faces.edges()`, in ascending
+        order. Only for 2D grids.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        single_edges: (m,) np.ndarray
+        """
+        if self.kind != "face":
+            raise ValueError("single_edges() is for 2D grids.")
+
+        return self._single_subelements()
+
+    def locate(self, points):
+        """Finds elements that contain given points, using binary search on
+        each axis. Points on shared sides are assigned to the element with
+        the larger index.
+
+        Parameters
+        -----------
+        points: (n, d) array-like
+
+        Returns
+        --------
+        element_ids: (n,) np.ndarray
+          -1 for points outside the grid.
+        """
+        points = np.asarray(points, dtype=settings.FLOAT_DTYPE)
+        utils.arr.is_shape(points, (-1, len(self._coordinates)), strict=True)
+
+        outside = np.zeros(len(points), dtype=bool)
+        multi_ids = []
+        for c, p in zip(self._coordinates, points.T):
+            outside |= (p < c[0]) | (p > c[-1])
+            multi_ids.append(
+                np.clip(np.searchsorted(c, p, side="right") - 1, 0, len(c) - 2)
+            )
+
+        element_ids = np.ravel_multi_index(
+            multi_ids[::-1], (self.resolutions - 1)[::-1]
+        ).astype(settings.INT_DTYPE)
+        element_ids[outside] = -1
+
+        return element_ids
+
+    def to_mesh(self):
+        """Returns Faces in 2D and Volumes in 3D. Materializes vertices and
+        elements.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        mesh: Faces or Volumes
+        """
+        mesh_type = Faces if self.kind == "face" else Volumes
+
+        return mesh_type(self.vertices, elements=self.elements)
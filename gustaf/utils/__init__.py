@@ -1,4 +1,4 @@
-from gustaf.utils import arr, connec, log, tictoc
+from gustaf.utils import arr, connec, log, stats, tictoc
 from gustaf.utils.tictoc import Tic
 
 # Alias
@@ -9,6 +9,7 @@ __all__ = [
     "connec",
     "connectivity",
     "log",
+    "stats",
     "tictoc",
     "Tic",
 ]
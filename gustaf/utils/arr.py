@@ -4,12 +4,14 @@ Useful functions for array / point operations. Named `arr`, since
 `array` is python library and it sounds funny.
 """
 
+import itertools
+
 import numpy as np
 
 from gustaf import settings
 from gustaf.helpers.raise_if import ModuleImportRaiser
 
-has_funi = has_napf = has_scipy = False
+has_funi = has_napf = False
 try:
     import funi
 
@@ -22,12 +24,6 @@ try:
     has_napf = True
 except ImportError:
     napf = ModuleImportRaiser("napf")
-try:
-    import scipy
-
-    has_scipy = True
-except ImportError:
-    scipy = ModuleImportRaiser("scipy")
 
 
 def make_c_contiguous(array, dtype=None):
@@ -148,8 +144,8 @@ def close_rows(
     arr, tolerance=None, return_intersection=False, nthreads=None, **_kwargs
 ):
     """Similar to unique_rows, but if data type is floats, use this one.
-    Performs radius search using KDTree. Currently uses
-    `scipy.spatial.cKDTree`.
+    Uses `funi` or radius search of `napf` k-d trees, if available.
+    Otherwise, uses spatial hashing with NumPy.
 
     Parameters
     -----------
@@ -191,42 +187,179 @@ def close_rows(
             tolerance, True, return_intersection, nthread=nthreads
         )
 
-    if has_scipy:
-        from scipy.spatial import cKDTree as scipy_KDTree
+    # numpy only. Same results as radius search of k-d trees
+    return _close_rows_spatial_hash(arr, tolerance, return_intersection)
 
-        # Build kd tree
-        kdt = scipy_KDTree(arr)
 
-        # Ball point query, taking tolerance as radius
-        neighbors = kdt.query_ball_point(
-            arr,
-            tolerance,
-            return_sorted=True,
-        )
+def _spatial_hash_keys(cells, seed):
+    """Sortable keys of integer cell coordinates. Cells are hashed into
+    uint64 with random odd multipliers. Without seed, returns a structured
+    view that sorts lexicographically and never collides.
 
-        # inverse based on original vertices.
-        o_inverse = np.array(
-            [n[0] for n in neighbors],
-            dtype=settings.INT_DTYPE,
-        )
+    Parameters
+    -----------
+    cells: (n, d) np.ndarray
+      int64 cell coordinates.
+    seed: int or None
 
-        # unique of o_inverse, and inverse based on that
-        (_, uniq_id, inv) = np.unique(
-            o_inverse,
-            return_index=True,
-            return_inverse=True,
-        )
+    Returns
+    --------
+    keys: (n,) np.ndarray
+    """
+    if seed is None:
+        fields = [(f"f{i}", np.int64) for i in range(cells.shape[1])]
+        return np.ascontiguousarray(cells).view(fields).ravel()
+
+    multipliers = np.random.default_rng(seed).integers(
+        1, 2**63, size=cells.shape[1], dtype=np.uint64
+    ) * np.uint64(2) + np.uint64(1)
+    keys = np.zeros(len(cells), dtype=np.uint64)
+    for column, multiplier in zip(cells.T, multipliers):
+        keys ^= column.astype(np.uint64) * multiplier
+        keys ^= keys >> np.uint64(29)
+
+    return keys
+
+
+def _close_rows_spatial_hash(arr, tolerance, return_intersection=False):
+    """NumPy-only implementation of `close_rows()`. Points are quantized
+    into cells, that are much larger than tolerance and much smaller than
+    expected point spacing, and grouped by sorting hashed cell keys. Points
+    in the same cell are candidates. Only points within tolerance of a cell
+    face look up the neighbor cell, using binary search. Candidates are
+    checked by distance. Returns the same values as radius search with
+    k-d trees, i.e., unique ids are the first ids of points, whose smallest
+    neighbor id is the same.
 
-        if not return_intersection:
-            neighbors = []
+    Parameters
+    -----------
+    arr: (n, d) array-like
+    tolerance: float
+    return_intersection: bool
 
-        return arr[uniq_id], uniq_id, inv, neighbors
+    Returns
+    --------
+    unique_arrays: (n, d) np.ndarray
+    unique_ids: (m) np.ndarray
+    inverse: (n) np.ndarray
+    overlapping: list(np.ndarray)
+    """
+    arr = np.asarray(arr)
+    n_points, dim = arr.shape
+    tolerance = float(tolerance)
+    if n_points == 0:
+        empty = np.empty(0, dtype=settings.INT_DTYPE)
+        return arr, empty, empty, []
+
+    # cell size: geometric mean of tolerance and estimated spacing. Cells
+    # are at least tolerance wide, so that neighbors are at most one cell
+    # apart, and keep cell coordinates within int64.
+    lower = arr.min(axis=0)
+    relative = arr - lower
+    extent = float(relative.max())
+    spacing = extent / n_points ** (1 / dim)
+    cell_size = max(
+        (tolerance * spacing) ** 0.5,
+        tolerance * 2,
+        extent * 2.0**-50,
+    )
+    if cell_size == 0:
+        cell_size = 1.0
+    cells = np.floor(relative / cell_size).astype(np.int64)
+
+    # group points by cell. Hash collisions are detected and retried with
+    # other multipliers, before falling back to structured keys
+    for seed in (0, 1, 2, None):
+        keys = _spatial_hash_keys(cells, seed)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(
+            np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        )
+        counts = np.diff(np.append(starts, n_points))
+        first = order[np.repeat(starts, counts)]
+        if seed is None or (cells[order] == cells[first]).all():
+            break
+    unique_keys = sorted_keys[starts]
+
+    # candidates: (point, cell) pairs. All points look into their own cell.
+    # Points near faces look into half of the neighbor cells. Other half is
+    # covered from the other side.
+    cell_of = np.empty(n_points, dtype=np.int64)
+    cell_of[order] = np.repeat(np.arange(len(starts)), counts)
+    points = [np.flatnonzero(counts[cell_of] > 1)]
+    point_cells = [cell_of[points[0]]]
+
+    margin = tolerance * (1 + 1e-6) + extent * 2.0**-44
+    in_cell = relative - cells * cell_size
+    near_lower = in_cell <= margin
+    near_upper = in_cell >= cell_size - margin
+    near_any = np.flatnonzero((near_lower | near_upper).any(axis=1))
+    near_lower = near_lower[near_any]
+    near_upper = near_upper[near_any]
+    offsets = [
+        o for o in itertools.product((-1, 0, 1), repeat=dim) if o > (0,) * dim
+    ]
+    for offset in np.array(offsets).reshape(-1, dim):
+        near = np.all(
+            np.where(
+                offset > 0,
+                near_upper,
+                np.where(offset < 0, near_lower, True),
+            ),
+            axis=1,
+        )
+        near = near_any[near]
+        if len(near) == 0:
+            continue
+        query = _spatial_hash_keys(cells[near] + offset, seed)
+        found = np.searchsorted(unique_keys, query)
+        found[found == len(unique_keys)] = 0
+        exists = unique_keys[found] == query
+        points.append(near[exists])
+        point_cells.append(found[exists])
+    points = np.concatenate(points)
+    point_cells = np.concatenate(point_cells)
+
+    # expand to point pairs
+    sizes = counts[point_cells]
+    i = np.repeat(points, sizes)
+    local = np.arange(len(i)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    j = order[np.repeat(starts[point_cells], sizes) + local]
+
+    # within tolerance, without self. Neighbor cell pairs count each way
+    diff = arr[i] - arr[j]
+    close = np.einsum("ij,ij->i", diff, diff) <= tolerance**2
+    close &= i != j
+    is_neighbor_cell = (cell_of[i] != cell_of[j])[close]
+    i, j = i[close], j[close]
+    i, j = (
+        np.concatenate((i, j[is_neighbor_cell])),
+        np.concatenate((j, i[is_neighbor_cell])),
+    )
 
-    raise ImportError(
-        "gus.utils.arr.close_rows() requires either funi, napf, or "
-        "scipy package."
+    # smallest neighbor id of each point, including itself
+    o_inverse = np.arange(n_points, dtype=settings.INT_DTYPE)
+    np.minimum.at(o_inverse, i, j.astype(settings.INT_DTYPE))
+
+    _, uniq_id, inv = np.unique(
+        o_inverse,
+        return_index=True,
+        return_inverse=True,
     )
 
+    neighbors = []
+    if return_intersection:
+        self_ids = np.arange(n_points)
+        i = np.concatenate((i, self_ids))
+        j = np.concatenate((j, self_ids))
+        pair_order = np.lexsort((j, i))
+        neighbors = np.split(
+            j[pair_order], np.cumsum(np.bincount(i, minlength=n_points))[:-1]
+        )
+
+    return arr[uniq_id], uniq_id, inv, neighbors
+
 
 def bounds(arr):
     """Return bounds.
@@ -247,6 +380,119 @@ def bounds(arr):
     )
 
 
+def _interleave_bits(coordinates, n_bits):
+    """Interleaves bits of integer coordinates into one key. The most
+    significant bit of the key is the most significant bit of the first
+    coordinate.
+
+    Parameters
+    -----------
+    coordinates: (n, d) np.ndarray
+      uint64
+    n_bits: int
+
+    Returns
+    --------
+    keys: (n,) np.ndarray
+      uint64
+    """
+    keys = np.zeros(len(coordinates), dtype=np.uint64)
+    one = np.uint64(1)
+    for bit in range(n_bits - 1, -1, -1):
+        for c in coordinates.T:
+            keys = (keys << one) | ((c >> np.uint64(bit)) & one)
+
+    return keys
+
+
+def _hilbert_transpose(coordinates, n_bits):
+    """Converts integer coordinates to transposed hilbert index, following
+    J. Skilling, "Programming the Hilbert curve", AIP Conf. Proc. 707, 2004.
+    Each coordinate is processed for all points at once.
+
+    Parameters
+    -----------
+    coordinates: (n, d) np.ndarray
+      uint64
+    n_bits: int
+
+    Returns
+    --------
+    transposed: (n, d) np.ndarray
+      uint64. Interleaving its bits gives hilbert index.
+    """
+    x = coordinates.copy()
+    dim = x.shape[1]
+
+    # inverse undo
+    q = 1 << (n_bits - 1)
+    while q > 1:
+        p = np.uint64(q - 1)
+        for i in range(dim):
+            flip = (x[:, i] & np.uint64(q)) != 0
+            swap = np.where(flip, np.uint64(0), (x[:, 0] ^ x[:, i]) & p)
+            x[:, 0] = np.where(flip, x[:, 0] ^ p, x[:, 0] ^ swap)
+            if i != 0:
+                x[:, i] ^= swap
+        q >>= 1
+
+    # gray encode
+    for i in range(1, dim):
+        x[:, i] ^= x[:, i - 1]
+    t = np.zeros(len(x), dtype=np.uint64)
+    q = 1 << (n_bits - 1)
+    while q > 1:
+        t ^= np.where(
+            (x[:, -1] & np.uint64(q)) != 0, np.uint64(q - 1), np.uint64(0)
+        )
+        q >>= 1
+    x ^= t.reshape(-1, 1)
+
+    return x
+
+
+def space_filling_order(arr, curve="hilbert"):
+    """Returns an order that sorts points along a space filling curve.
+    Points are quantized within their bounds, using as many bits per
+    dimension as fit into a 64 bit key. Close points end up close in the
+    order, which improves cache locality of gathers.
+
+    Parameters
+    -----------
+    arr: (n, d) array-like
+    curve: str
+      "hilbert" or "morton". Default is "hilbert".
+
+    Returns
+    --------
+    order: (n,) np.ndarray
+    """
+    arr = np.asarray(arr, dtype=settings.FLOAT_DTYPE)
+    if arr.ndim != 2:
+        raise ValueError("Points should be (n, d) array.")
+
+    n_bits = min(63 // arr.shape[1], 32)
+
+    # quantize
+    lower, upper = bounds(arr)
+    extent = upper - lower
+    extent[extent == 0] = 1.0
+    scale = float((1 << n_bits) - 1)
+    coordinates = ((arr - lower) / extent * scale).astype(np.uint64)
+
+    if curve == "hilbert":
+        coordinates = _hilbert_transpose(coordinates, n_bits)
+    elif curve != "morton":
+        raise ValueError(
+            f"Invalid curve `{curve}`. Valid options are "
+            "{'hilbert', 'morton'}."
+        )
+
+    return np.argsort(
+        _interleave_bits(coordinates, n_bits), kind="stable"
+    ).astype(settings.INT_DTYPE)
+
+
 def bounds_diagonal(arr):
     """Returns diagonal vector of the bounds.
 
@@ -5,20 +5,190 @@ volumes. Named connec because connectivity is too long. Would have been
 even cooler, if it was palindrome.
 """
 
-import collections
+import itertools
 
 import numpy as np
 
-try:
-    import napf
-except ImportError:
-    from gustaf.helpers.raise_if import ModuleImportRaiser
-
-    napf = ModuleImportRaiser("napf")
-
 from gustaf import helpers, settings
 from gustaf.utils import arr
 
+# Reference elements. Each sub-entity is given in local node ids of its
+# parent element. Faces are oriented to point outwards and are grouped by
+# their own element type, as some elements have more than one kind of face.
+_REFERENCE_N_NODES = {
+    "edges": 2,
+    "tri": 3,
+    "quad": 4,
+    "tet": 4,
+    "pyramid": 5,
+    "prism": 6,
+    "hexa": 8,
+}
+_REFERENCE_EDGES = {
+    "edges": [[0, 1]],
+    "tri": [[0, 1], [1, 2], [2, 0]],
+    "quad": [[0, 1], [1, 2], [2, 3], [3, 0]],
+    "tet": [[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]],
+    "pyramid": [
+        [0, 1],
+        [1, 2],
+        [2, 3],
+        [3, 0],
+        [0, 4],
+        [1, 4],
+        [2, 4],
+        [3, 4],
+    ],
+    "prism": [
+        [0, 1],
+        [1, 2],
+        [2, 0],
+        [3, 4],
+        [4, 5],
+        [5, 3],
+        [0, 3],
+        [1, 4],
+        [2, 5],
+    ],
+    "hexa": [
+        [0, 1],
+        [1, 2],
+        [2, 3],
+        [3, 0],
+        [4, 5],
+        [5, 6],
+        [6, 7],
+        [7, 4],
+        [0, 4],
+        [1, 5],
+        [2, 6],
+        [3, 7],
+    ],
+}
+_REFERENCE_FACES = {
+    "tet": {"tri": [[0, 2, 1], [1, 3, 0], [2, 3, 1], [3, 2, 0]]},
+    "pyramid": {
+        "tri": [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]],
+        "quad": [[0, 3, 2, 1]],
+    },
+    "prism": {
+        "tri": [[0, 2, 1], [3, 4, 5]],
+        "quad": [[0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]],
+    },
+    "hexa": {
+        "quad": [
+            [1, 0, 3, 2],
+            [0, 1, 5, 4],
+            [1, 2, 6, 5],
+            [2, 3, 7, 6],
+            [3, 0, 4, 7],
+            [4, 5, 6, 7],
+        ]
+    },
+}
+
+
+def _reference_table(element_type, subelement_type):
+    """Returns local node ids of sub-entities for given reference element.
+
+    Parameters
+    -----------
+    element_type: str
+    subelement_type: str
+
+    Returns
+    --------
+    table: (k, m) np.ndarray
+    """
+    reference_n_nodes(element_type)
+
+    if subelement_type == "edges":
+        table = _REFERENCE_EDGES.get(element_type)
+    else:
+        table = _REFERENCE_FACES.get(element_type, {}).get(subelement_type)
+
+    if table is None:
+        raise ValueError(
+            f"`{element_type}` has no `{subelement_type}` sub-elements."
+        )
+
+    return np.asarray(table, dtype=settings.INT_DTYPE)
+
+
+def reference_n_nodes(element_type):
+    """Returns number of nodes of given reference element.
+
+    Parameters
+    -----------
+    element_type: str
+      One of {"edges", "tri", "quad", "tet", "pyramid", "prism", "hexa"}.
+
+    Returns
+    --------
+    n_nodes: int
+    """
+    if element_type not in _REFERENCE_N_NODES:
+        raise ValueError(
+            f"Unknown element type `{element_type}`. Supported types are "
+            f"{list(_REFERENCE_N_NODES.keys())}."
+        )
+
+    return _REFERENCE_N_NODES[element_type]
+
+
+def reference_subelements(element_type):
+    """Returns local node ids of all sub-elements of given reference
+    element, grouped by sub-element type. Faces point outwards.
+
+    Parameters
+    -----------
+    element_type: str
+      One of {"edges", "tri", "quad", "tet", "pyramid", "prism", "hexa"}.
+
+    Returns
+    --------
+    tables: dict
+      sub-element type as key and (k, m) np.ndarray as value. Edges are
+      under "edges" and faces of volumes under "tri" and/or "quad".
+    """
+    reference_n_nodes(element_type)
+
+    subelement_types = ["edges", *_REFERENCE_FACES.get(element_type, {})]
+
+    return {st: _reference_table(element_type, st) for st in subelement_types}
+
+
+def to_subelements(elements, element_type, subelement_type):
+    """Extracts sub-elements of given elements using local index tables of
+    reference elements. Sub-elements of each element are placed
+    consecutively, in the order of the reference table. This is a single
+    gather and works for any type that has a table entry, including
+    `pyramid` and `prism`.
+
+    Parameters
+    -----------
+    elements: (n, d) np.ndarray
+    element_type: str
+      One of {"edges", "tri", "quad", "tet", "pyramid", "prism", "hexa"}.
+    subelement_type: str
+      One of {"edges", "tri", "quad"}. Volumes can be reduced to edges
+      directly.
+
+    Returns
+    --------
+    subelements: (n * k, m) np.ndarray
+    """
+    table = _reference_table(element_type, subelement_type)
+
+    elements = np.asarray(elements, dtype=settings.INT_DTYPE)
+    if (
+        elements.ndim != 2
+        or elements.shape[1] != _REFERENCE_N_NODES[element_type]
+    ):
+        raise ValueError(f"Given elements are not `{element_type}` elements")
+
+    return elements[:, table].reshape(-1, table.shape[1])
+
 
 def tet_to_tri(volumes):
     """Computes tri faces based on following index scheme.
@@ -53,26 +223,7 @@ def tet_to_tri(volumes):
     --------
     faces: (n * 4, 3) np.ndarray
     """
-    volumes = np.asanyarray(volumes, settings.INT_DTYPE)
-
-    if volumes.ndim != 2 or volumes.shape[1] != 4:
-        raise ValueError("Given volumes are not `tet` volumes")
-
-    fpe = 4  # faces per element
-    faces = (
-        np.ones(((volumes.shape[0] * fpe), 3), dtype=settings.INT_DTYPE) * -1
-    )  # -1 for safety check
-
-    faces[:, 0] = volumes.ravel()
-    faces[::fpe, [1, 2]] = volumes[:, [2, 1]]
-    faces[1::fpe, [1, 2]] = volumes[:, [3, 0]]
-    faces[2::fpe, [1, 2]] = volumes[:, [3, 1]]
-    faces[3::fpe, [1, 2]] = volumes[:, [2, 0]]
-
-    if (faces == -1).any():
-        raise ValueError("Something went wrong while computing faces")
-
-    return faces
+    return to_subelements(volumes, "tet", "tri")
 
 
 def hexa_to_quad(volumes):
@@ -111,24 +262,9 @@ def hexa_to_quad(volumes):
 
     Returns
     --------
-    faces: (n * 8, 4) np.ndarray
+    faces: (n * 6, 4) np.ndarray
     """
-    volumes = np.asanyarray(volumes, settings.INT_DTYPE)
-
-    if volumes.ndim != 2 or volumes.shape[1] != 8:
-        raise ValueError("Given volumes are not `hexa` volumes")
-
-    fpe = 6  # faces per element
-    faces = np.empty(((volumes.shape[0] * fpe), 4), dtype=settings.INT_DTYPE)
-
-    faces[::fpe] = volumes[:, [1, 0, 3, 2]]
-    faces[1::fpe] = volumes[:, [0, 1, 5, 4]]
-    faces[2::fpe] = volumes[:, [1, 2, 6, 5]]
-    faces[3::fpe] = volumes[:, [2, 3, 7, 6]]
-    faces[4::fpe] = volumes[:, [3, 0, 4, 7]]
-    faces[5::fpe] = volumes[:, [4, 5, 6, 7]]
-
-    return faces
+    return to_subelements(volumes, "hexa", "quad")
 
 
 def volumes_to_faces(volumes):
@@ -150,6 +286,35 @@ def volumes_to_faces(volumes):
         return hexa_to_quad(volumes)
 
 
+def volumes_to_edges(volumes):
+    """Computes edges of volumes directly, without going through faces.
+    Hence, each edge appears once per volume.
+
+    .. code-block:: text
+
+        tet  | (0 1) (0 2) (0 3) (1 2) (1 3) (2 3)
+        hexa | (0 1) (1 2) (2 3) (3 0)  - bottom
+             | (4 5) (5 6) (6 7) (7 4)  - top
+             | (0 4) (1 5) (2 6) (3 7)  - vertical
+
+    Parameters
+    -----------
+    volumes: (n, 4) or (m, 8) np.ndarray
+
+    Returns
+    --------
+    edges: (n * 6, 2) or (m * 12, 2) np.ndarray
+    """
+    volumes = np.asanyarray(volumes, settings.INT_DTYPE)
+    if volumes.shape[1] == 4:
+        return to_subelements(volumes, "tet", "edges")
+
+    elif volumes.shape[1] == 8:
+        return to_subelements(volumes, "hexa", "edges")
+
+    raise ValueError("Given volumes are neither `tet` nor `hexa` volumes")
+
+
 def faces_to_edges(faces):
     """Compute edges based on following edge scheme.
 
@@ -186,21 +351,11 @@ def faces_to_edges(faces):
             "The input array for a faces has to be dim of 2"
         )
 
-    num_faces = faces.shape[0]
-    vertices_per_face = faces.shape[1]
-
-    num_edges = int(num_faces * vertices_per_face)
-    edges = np.empty((num_edges, 2), dtype=settings.INT_DTYPE)
+    # polygon with any number of vertices - connect each to the next one
+    local_ids = np.arange(faces.shape[1])
+    table = np.column_stack((local_ids, np.roll(local_ids, -1)))
 
-    edges[:, 0] = faces.ravel()
-
-    for i in range(vertices_per_face):
-        # v_ind : corresponding vertex index for i value
-        v_ind = 0 if i == int(vertices_per_face - 1) else i + 1
-
-        edges[i::vertices_per_face, 1] = faces[:, v_ind]
-
-    return edges
+    return np.asarray(faces, dtype=settings.INT_DTYPE)[:, table].reshape(-1, 2)
 
 
 def range_to_edges(range_, closed=False, continuous=True):
@@ -373,8 +528,133 @@ def make_hexa_volumes(resolutions):
     return volumes
 
 
-def subdivide_edges(edges):
+# children in local node ids.
+# local nodes are ordered: corners, edge mids, face centers, element center
+_SUBDIVISION_CHILDREN = {
+    "edges": [[0, 2], [2, 1]],
+    "tri": [[0, 3, 5], [1, 4, 3], [2, 5, 4], [3, 4, 5]],
+    "quad": [[0, 4, 8, 7], [1, 5, 8, 4], [2, 6, 8, 5], [3, 7, 8, 6]],
+    "tet": [
+        [0, 4, 5, 6],
+        [4, 1, 7, 8],
+        [5, 7, 2, 9],
+        [6, 8, 9, 3],
+        # inner octahedron, split along (0, 2)-(1, 3) mid points
+        [5, 8, 6, 4],
+        [5, 8, 9, 6],
+        [5, 8, 7, 9],
+        [5, 8, 4, 7],
+    ],
+    "hexa": [
+        [0, 8, 20, 11, 16, 21, 26, 24],
+        [8, 1, 9, 20, 21, 17, 22, 26],
+        [20, 9, 2, 10, 26, 22, 18, 23],
+        [11, 20, 10, 3, 24, 26, 23, 19],
+        [16, 21, 26, 24, 4, 12, 25, 15],
+        [21, 17, 22, 26, 12, 5, 13, 25],
+        [26, 22, 18, 23, 25, 13, 6, 14],
+        [24, 26, 23, 19, 15, 25, 14, 7],
+    ],
+}
+
+
+def subdivide(elements, element_type, n_vertices=None):
+    """Subdivides elements uniformly, once. Each edge is split in two.
+    Quads get a new vertex at their center and hexas at their face centers
+    and their center. Children of each element are placed consecutively
+    and each child keeps the orientation of its parent.
+
+    New vertices are appended after existing vertices, in following order:
+    edge mid points, face centers, element centers. Each of them is mean
+    of its parent vertices, returned as `parents`.
+
+    ``Subdivided Tetrahedron``
+
+    .. code-block:: text
+
+        Ref: (node_ind) = mid point of edge
+
+        (4) = (0, 1), (5) = (0, 2), (6) = (0, 3),
+        (7) = (1, 2), (8) = (1, 3), (9) = (2, 3)
+
+        child_ind | node_ind
+        ----------|----------
+        0         | 0 4 5 6
+        1         | 4 1 7 8
+        2         | 5 7 2 9
+        3         | 6 8 9 3
+        4         | 5 8 6 4
+        5         | 5 8 9 6
+        6         | 5 8 7 9
+        7         | 5 8 4 7
+
+    Parameters
+    -----------
+    elements: (n, d) np.ndarray
+    element_type: str
+      One of {"edges", "tri", "quad", "tet", "hexa"}.
+    n_vertices: int
+      (Optional) Number of existing vertices. Default is max index + 1.
+
+    Returns
+    --------
+    parents: list
+      list of (m, k) np.ndarray. Parent vertex ids of new vertices.
+    subdivided: (n * n_children, d) np.ndarray
+    """
+    if element_type not in _SUBDIVISION_CHILDREN:
+        raise ValueError(
+            f"Subdivision of `{element_type}` is not supported. Supported "
+            f"types are {list(_SUBDIVISION_CHILDREN.keys())}."
+        )
+
+    elements = np.asarray(elements, dtype=settings.INT_DTYPE)
+    children = np.asarray(_SUBDIVISION_CHILDREN[element_type])
+    if elements.ndim != 2 or elements.shape[1] != children.shape[1]:
+        raise ValueError(f"Invalid `{element_type}` elements shape.")
+
+    if n_vertices is None:
+        n_vertices = int(elements.max()) + 1 if elements.size != 0 else 0
+
+    n_elements = len(elements)
+    local_nodes = [elements]
+    parents = []
+    offset = n_vertices
+
+    # edge mid points
+    edges = to_subelements(elements, element_type, "edges")
+    unique_edges = sorted_unique(edges)
+    local_nodes.append(unique_edges.inverse.reshape(n_elements, -1) + offset)
+    parents.append(unique_edges.values)
+    offset += len(unique_edges.values)
+
+    # face centers
+    if "quad" in _REFERENCE_FACES.get(element_type, {}):
+        faces = to_subelements(elements, element_type, "quad")
+        unique_faces = sorted_unique(faces)
+        local_nodes.append(
+            unique_faces.inverse.reshape(n_elements, -1) + offset
+        )
+        # keep original orientation
+        parents.append(faces[unique_faces.ids])
+        offset += len(unique_faces.values)
+
+    # element centers
+    if element_type in ("quad", "hexa"):
+        local_nodes.append(
+            np.arange(offset, offset + n_elements).reshape(-1, 1)
+        )
+        parents.append(elements)
+
+    local_nodes = np.hstack(local_nodes).astype(settings.INT_DTYPE)
+
+    return parents, local_nodes[:, children].reshape(-1, children.shape[1])
+
+
+def subdivide_edges(edges, n_vertices=None):
     """Subdivide edges. We assume that mid point is newly added points.
+    Mid points are numbered after existing vertices, following the order of
+    unique edges.
 
     ``Subdivided Edges``
 
@@ -395,6 +675,8 @@ def subdivide_edges(edges):
     Parameters
     -----------
     edges: (n, 2) np.ndarray
+    n_vertices: int
+      (Optional) Number of existing vertices. Default is max index + 1.
 
     Returns
     --------
@@ -403,7 +685,29 @@ def subdivide_edges(edges):
     if edges.ndim != 2 or edges.shape[1] != 2:
         raise ValueError("Invalid edges shape!")
 
-    raise NotImplementedError
+    return subdivide(edges, "edges", n_vertices)[1]
+
+
+def _subdivide_mesh(mesh, element_type, return_dict):
+    """
+    Subdivides mesh once and computes new vertices.
+    """
+    vertices = mesh.const_vertices
+    parents, subdivided = subdivide(
+        mesh.const_elements, element_type, len(vertices)
+    )
+    new_vertices = np.vstack(
+        [vertices, *[vertices[p].mean(axis=1) for p in parents]]
+    )
+
+    if return_dict:
+        return {
+            "vertices": new_vertices,
+            "faces": subdivided,
+        }
+
+    else:
+        return new_vertices, subdivided
 
 
 def subdivide_tri(mesh, return_dict=False):
@@ -450,40 +754,7 @@ def subdivide_tri(mesh, return_dict=False):
     if mesh.faces.shape[1] != 3:
         raise ValueError("Invalid faces shape!")
 
-    # Form new vertices
-    edge_mid_v = mesh.vertices[mesh.unique_edges().values].mean(axis=1)
-    new_vertices = np.vstack((mesh.vertices, edge_mid_v))
-
-    subdivided_faces = np.empty(
-        (mesh.faces.shape[0] * 4, mesh.faces.shape[1]),
-        dtype=settings.INT_DTYPE,
-    )
-
-    mask = np.ones(subdivided_faces.shape[0], dtype=bool)
-    mask[3::4] = False
-
-    # 0th column minus (every 4th row, starting from 3rd row)
-    subdivided_faces[mask, 0] = mesh.faces.ravel()
-
-    # Form ids for new vertices
-    new_vertices_ids = mesh.unique_edges().inverse + int(mesh.faces.max() + 1)
-    # 1st & 2nd columns
-    subdivided_faces[mask, 1] = new_vertices_ids
-    subdivided_faces[mask, 2] = new_vertices_ids.reshape(-1, 3)[
-        :, [2, 0, 1]
-    ].ravel()
-
-    # Every 4th row, starting from 3rd row
-    subdivided_faces[~mask, :] = new_vertices_ids.reshape(-1, 3)
-
-    if return_dict:
-        return {
-            "vertices": new_vertices,
-            "faces": subdivided_faces,
-        }
-
-    else:
-        return new_vertices, subdivided_faces
+    return _subdivide_mesh(mesh, "tri", return_dict)
 
 
 def subdivide_quad(
@@ -509,47 +780,240 @@ def subdivide_quad(
     if mesh.faces.shape[1] != 4:
         raise ValueError("Invalid faces shape!")
 
-    # Form new vertices
-    edge_mid_v = mesh.vertices[mesh.unique_edges().values].mean(axis=1)
-    face_centers = mesh.centers()
-    new_vertices = np.vstack(
-        (
-            mesh.vertices,
-            edge_mid_v,
-            face_centers,
-        )
-    )
+    return _subdivide_mesh(mesh, "quad", return_dict)
+
+
+# unit hexa, used to orient and rotate split tables
+_HEXA_CORNERS = np.array(
+    [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+    ]
+)
+
+# tets of hexa splits, in local node ids of a hexa rotated to have its
+# minimum vertex id at node 0. Key is a bit mask of far faces,
+# (1, 2, 6, 5), (2, 3, 7, 6) and (4, 5, 6, 7), whose diagonal runs through
+# node 6. Remaining masks are rotations of these around the (0, 6) axis.
+_HEXA_SPLITS = {
+    # five tets: four corners and a center tet
+    0: [[1, 0, 2, 5], [3, 0, 2, 7], [4, 0, 5, 7], [6, 2, 5, 7], [0, 2, 5, 7]],
+    # two prisms split along plane (0, 2, 6, 4)
+    4: [[0, 1, 2, 5], [0, 2, 6, 5], [0, 6, 4, 5]]
+    + [[0, 2, 3, 7], [0, 2, 6, 7], [0, 6, 4, 7]],
+    # two prisms split along plane (0, 1, 6, 7)
+    3: [[5, 0, 4, 7], [0, 7, 6, 5], [0, 6, 1, 5]]
+    + [[6, 0, 7, 3], [0, 3, 2, 6], [0, 2, 1, 6]],
+    # six tets around diagonal (0, 6)
+    7: [[0, 1, 2, 6], [0, 2, 3, 6], [0, 3, 7, 6]]
+    + [[0, 7, 4, 6], [0, 4, 5, 6], [0, 5, 1, 6]],
+}
+# far faces start with node 6, so that their diagonal through node 6 is
+# (0, 2) in face local ids.
+_HEXA_FAR_FACES = [[6, 5, 1, 2], [6, 2, 3, 7], [6, 7, 4, 5]]
+# mirrored five tet split. Its center tet is (1, 3, 4, 6).
+_HEXA_MIRRORED_SPLIT = [
+    [0, 1, 3, 4],
+    [2, 1, 3, 6],
+    [5, 1, 4, 6],
+    [7, 3, 4, 6],
+    [1, 3, 4, 6],
+]
+
+
+def _hexa_rotations():
+    """Returns all 24 rotations of a hexa as node permutations. Node `i`
+    moves to `rotations[k][i]`.
 
-    subdivided_faces = np.empty(
-        (mesh.faces.shape[0] * 4, mesh.faces.shape[1]),
-        dtype=settings.INT_DTYPE,
-    )
+    Parameters
+    -----------
+    None
 
-    subdivided_faces[:, 0] = mesh.faces.ravel()
-    subdivided_faces[:, 1] = mesh.unique_edges().inverse + len(mesh.vertices)
-    subdivided_faces[:, 2] = np.repeat(
-        np.arange(len(face_centers)) + (len(mesh.vertices) + len(edge_mid_v)),
-        4,
-        dtype=settings.INT_DTYPE,
-    )
-    subdivided_faces[:, 3] = (
-        subdivided_faces[:, 1].reshape(-1, 4)[:, [3, 0, 1, 2]].ravel()
+    Returns
+    --------
+    rotations: (24, 8) np.ndarray
+    """
+    centered = 2 * _HEXA_CORNERS - 1
+    rotations = []
+    for axes in itertools.permutations(range(3)):
+        for signs in itertools.product((1, -1), repeat=3):
+            matrix = np.zeros((3, 3), dtype=np.int64)
+            matrix[range(3), axes] = signs
+            if round(np.linalg.det(matrix)) != 1:
+                continue
+            rotated = centered @ matrix.T
+            rotations.append(
+                [
+                    np.flatnonzero((centered == r).all(axis=1))[0]
+                    for r in rotated
+                ]
+            )
+
+    return np.array(rotations)
+
+
+def _hexa_split_table(splits):
+    """Orients tets of given splits positively and finds hexa faces of
+    their faces. Splits are padded with -1 to six tets.
+
+    Parameters
+    -----------
+    splits: list
+      list of tets in local node ids.
+
+    Returns
+    --------
+    tets: (n, 6, 4) np.ndarray
+    tet_faces: (n, 6, 4) np.ndarray
+      Local hexa face id of each tet face, following `tet_to_tri()`. -1 for
+      inner faces.
+    """
+    tet_face_table = np.asarray(_REFERENCE_FACES["tet"]["tri"])
+    hexa_faces = np.sort(_REFERENCE_FACES["hexa"]["quad"], axis=1)
+
+    tets = np.full((len(splits), 6, 4), -1, dtype=settings.INT_DTYPE)
+    tet_faces = np.full_like(tets, -1)
+    for i, split in enumerate(splits):
+        oriented = np.array(split)
+        corners = _HEXA_CORNERS[oriented]
+        volumes = np.linalg.det(corners[:, 1:] - corners[:, :1])
+        oriented[volumes < 0] = oriented[volumes < 0][:, [0, 2, 1, 3]]
+        tets[i, : len(oriented)] = oriented
+
+        for j, tet in enumerate(oriented):
+            for k, tri in enumerate(tet[tet_face_table]):
+                on_face = np.isin(hexa_faces, tri).sum(axis=1) == 3
+                if on_face.any():
+                    tet_faces[i, j, k] = np.flatnonzero(on_face)[0]
+
+    return tets, tet_faces
+
+
+def _hexa_to_tet_tables():
+    """Creates split tables of `hexa_to_tet()`.
+
+    Parameters
+    -----------
+    None
+
+    Returns
+    --------
+    tables: dict
+      scheme: (rotations, tets, tet_faces). `rotations` are local node ids
+      that move node `v` to node 0 for each `v`. Tables of "6tet" are
+      indexed by `8 * v + mask` and tables of "5tet" by mirroring.
+    """
+    rotations = _hexa_rotations()
+    # rotations that keep node 0, i.e. around (0, 6) axis
+    around_diagonal = rotations[rotations[:, 0] == 0]
+    diagonals = np.array([[1, 6], [3, 6], [4, 6]])
+
+    canonical = [None] * 8
+    for tets in _HEXA_SPLITS.values():
+        for rotation in around_diagonal:
+            rotated = rotation[np.asarray(tets)]
+            edges = np.sort(to_subelements(rotated, "tet", "edges"), axis=1)
+            mask = 0
+            for bit, diagonal in enumerate(diagonals):
+                if (edges == diagonal).all(axis=1).any():
+                    mask |= 1 << bit
+            canonical[mask] = rotated
+
+    # g[v] gathers local nodes of a hexa, rotated to start at node `v`
+    to_origin = np.array(
+        [np.argsort(rotations[rotations[:, v] == 0][0]) for v in range(8)]
     )
+    splits = [to_origin[v][c] for v in range(8) for c in canonical]
+
+    return {
+        "6tet": (to_origin, *_hexa_split_table(splits)),
+        "5tet": (
+            None,
+            *_hexa_split_table([_HEXA_SPLITS[0], _HEXA_MIRRORED_SPLIT]),
+        ),
+    }
+
+
+_HEXA_TO_TET = _hexa_to_tet_tables()
 
-    if return_dict:
-        return {
-            "vertices": new_vertices,
-            "faces": subdivided_faces,
-        }
 
+def hexa_to_tet(volumes, scheme="6tet", mirror=None):
+    """Splits hexas into tets with a single gather. Tets of each hexa are
+    placed consecutively and keep the orientation of their hexa.
+
+    With "6tet", each quad face is cut along the diagonal through its
+    smallest vertex id. As both neighbors see the same face, the result is
+    conforming for any hexa mesh. Depending on where the diagonals meet, a
+    hexa becomes six tets, or five if its diagonals form a center tet.
+
+    With "5tet", each hexa becomes five tets: four corners and a center
+    tet, (0, 2, 5, 7), or (1, 3, 4, 6) for mirrored hexas. This is
+    conforming if neighbors are mirrored alternately, e.g. in a structured
+    grid.
+
+    Parameters
+    -----------
+    volumes: (n, 8) np.ndarray
+    scheme: str
+      "6tet" or "5tet".
+    mirror: (n,) np.ndarray
+      (Optional) bool. Hexas to split with mirrored "5tet" split.
+
+    Returns
+    --------
+    tets: (m, 4) np.ndarray
+    parents: (m,) np.ndarray
+      Hexa id of each tet.
+    tet_faces: (m, 4) np.ndarray
+      Local hexa face id, following `hexa_to_quad()`, of each tet face,
+      following `tet_to_tri()`. -1 for inner faces.
+    """
+    if scheme not in _HEXA_TO_TET:
+        raise ValueError(
+            f"Unknown scheme `{scheme}`. Supported schemes are "
+            f"{list(_HEXA_TO_TET.keys())}."
+        )
+
+    volumes = np.asarray(volumes, dtype=settings.INT_DTYPE)
+    if volumes.ndim != 2 or volumes.shape[1] != 8:
+        raise ValueError("Given volumes are not hexa volumes.")
+
+    to_origin, tets_table, faces_table = _HEXA_TO_TET[scheme]
+    if scheme == "6tet":
+        min_nodes = np.argmin(volumes, axis=1)
+        rotated = np.take_along_axis(volumes, to_origin[min_nodes], axis=1)
+        far_faces = rotated[:, _HEXA_FAR_FACES]
+        masks = (np.argmin(far_faces, axis=2) % 2 == 0) @ (1 << np.arange(3))
+        splits = min_nodes * 8 + masks
+    elif mirror is None:
+        splits = np.zeros(len(volumes), dtype=settings.INT_DTYPE)
     else:
-        return new_vertices, subdivided_faces
+        splits = np.asarray(mirror, dtype=bool).astype(settings.INT_DTYPE)
+
+    local_tets = tets_table[splits]
+    valid = local_tets[:, :, 0] >= 0
+    tets = np.take_along_axis(
+        volumes[:, None, :], np.where(valid[..., None], local_tets, 0), axis=2
+    )[valid]
+    parents = np.nonzero(valid)[0].astype(settings.INT_DTYPE)
+
+    return tets, parents, faces_table[splits][valid]
 
 
 def sorted_unique(connectivity, sorted_=False):
     """Given connectivity array, finds unique entries, based on its axis=1
     sorted values. Returned value will be sorted.
 
+    Rows are packed into a single int64 key, if `(max - min + 1) ** d` fits.
+    Otherwise, rows are lexsorted column by column. Both ways, unique values
+    are in lexicographic order.
+
     Parameters
     -----------
     connectivity: (n, d) np.ndarray
@@ -560,256 +1024,746 @@ def sorted_unique(connectivity, sorted_=False):
     unique_info: Unique2DIntegers
     """
     s_connec = connectivity if sorted_ else np.sort(connectivity, axis=1)
+    s_connec = arr.make_c_contiguous(np.asarray(s_connec), settings.INT_DTYPE)
 
-    unique_stuff = arr.unique_rows(
-        s_connec,
-        return_index=True,
-        return_inverse=True,
-        return_counts=True,
-        dtype_name=settings.INT_DTYPE,
-    )
+    if s_connec.ndim != 2:
+        raise ValueError("sorted_unique can be only applied for 2D arrays")
+
+    n_rows, n_cols = s_connec.shape
+
+    if n_rows == 0:
+        order = np.empty(0, dtype=np.int64)
+        is_new = np.empty(0, dtype=bool)
+
+    else:
+        min_value = int(s_connec.min())
+        base = int(s_connec.max()) - min_value + 1
+
+        if base**n_cols < np.iinfo(np.int64).max:
+            # packed keys preserve lexicographic order
+            keys = s_connec[:, 0].astype(np.int64)
+            keys -= min_value
+            for i in range(1, n_cols):
+                keys *= base
+                keys += s_connec[:, i]
+                keys -= min_value
+
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            is_new = np.empty(n_rows, dtype=bool)
+            is_new[0] = True
+            np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_new[1:])
+
+        else:
+            # lexsort takes last key as primary key
+            order = np.lexsort(s_connec.T[::-1])
+            sorted_connec = s_connec[order]
+            is_new = np.empty(n_rows, dtype=bool)
+            is_new[0] = True
+            np.any(
+                sorted_connec[1:] != sorted_connec[:-1], axis=1, out=is_new[1:]
+            )
+
+    # stable sort - first occurrence of each entry leads the group
+    starts = np.flatnonzero(is_new)
+    ids = order[starts]
+
+    inverse = np.empty(n_rows, dtype=np.int64)
+    inverse[order] = np.cumsum(is_new) - 1
+
+    counts = np.diff(np.append(starts, n_rows))
 
     return helpers.data.Unique2DIntegers(
-        unique_stuff[0],  # values
-        unique_stuff[1],  # ids
-        unique_stuff[2],  # inverse
-        unique_stuff[3],  # counts
+        s_connec[ids],  # values
+        ids,  # ids
+        inverse,  # inverse
+        counts,  # counts
     )
 
 
-def _sequentialize_directed_edges(edges, start=None, return_edges=False):
+def vertex_to_element(elements, n_vertices=None):
+    """Computes vertex to element adjacency in CSR format. Elements adjacent
+    to i-th vertex are `indices[offsets[i]:offsets[i + 1]]`, in ascending
+    order.
+
+    Parameters
+    -----------
+    elements: (n, d) np.ndarray
+    n_vertices: int
+      (Optional) Default is max index + 1.
+
+    Returns
+    --------
+    adjacency: Adjacency
+      namedtuple with `offsets` and `indices`.
     """
-    Sequentialize directed edges.
+    elements = np.asarray(elements)
+    flat = elements.ravel()
+    if n_vertices is None:
+        n_vertices = int(flat.max()) + 1 if flat.size != 0 else 0
+
+    offsets = np.zeros(n_vertices + 1, dtype=settings.INT_DTYPE)
+    np.cumsum(np.bincount(flat, minlength=n_vertices), out=offsets[1:])
+
+    # stable sort keeps element ids ascending within each vertex
+    indices = np.argsort(flat, kind="stable") // max(elements.shape[-1], 1)
+
+    return helpers.data.Adjacency(
+        offsets, indices.astype(settings.INT_DTYPE, copy=False)
+    )
+
+
+def vertex_to_vertex(edges, n_vertices=None):
+    """Computes vertex to vertex adjacency in CSR format, based on given
+    edges. Given edges are considered undirected and expected to be unique.
+    Neighbors of each vertex are in ascending order.
+
+    Parameters
+    -----------
+    edges: (n, 2) np.ndarray
+    n_vertices: int
+      (Optional) Default is max index + 1.
+
+    Returns
+    --------
+    adjacency: Adjacency
+      namedtuple with `offsets` and `indices`.
     """
-    # we want to have an np array
-    edges = np.asanyarray(edges)
+    edges = np.asarray(edges)
+    if n_vertices is None:
+        n_vertices = int(edges.max()) + 1 if edges.size != 0 else 0
 
-    # Build a lookup_array
-    lookup_array = np.full(edges.max() + 1, -1, dtype=settings.INT_DTYPE)
-    lookup_array[edges[:, 0]] = edges[:, 1]
+    # both directions
+    sources = edges.ravel()
+    targets = edges[:, ::-1].ravel()
 
-    # select starting point - lowest index
-    starting_point = int(edges.min()) if start is None else int(start)
-
-    # initialize a set to keep track of processes vertices
-    next_candidates = set(edges[:, 0])
-    # we want to keep track of single occurrences, as they are line start
-    line_starts = set(np.where(np.bincount(edges.ravel()) == 1)[0])
-    # for this to work, we can't have a line that starts at column 1.
-    # so, we remove those.
-    ls_col1 = set(np.where(np.bincount(edges[:, 1].ravel()) == 1)[0])
-    line_starts.difference_update(ls_col1)
-
-    polygons = []
-    is_polygon = []
-    for _ in range(len(edges)):
-        # Get polygon - start with first two points
-        polygon = [starting_point]
-        polygon.append(lookup_array[polygon[-1]])
-
-        # then keep looking until we come to the start.
-        # if there's only one edges, this will exit right away
-        for _ in range(len(next_candidates)):
-            # sequence closes -> polygon
-            if polygon[0] == polygon[-1]:
-                polygon.pop()
-                is_polygon.append(True)
-                break
+    offsets = np.zeros(n_vertices + 1, dtype=settings.INT_DTYPE)
+    np.cumsum(np.bincount(sources, minlength=n_vertices), out=offsets[1:])
 
-            # sequence leads to unspecified connection -> not polygon
-            if lookup_array[polygon[-1]] < 0:
-                is_polygon.append(False)
-                break
-            polygon.append(lookup_array[polygon[-1]])
+    # sort packed (source, target) keys - much faster than lexsort
+    keys = sources.astype(np.int64) * max(n_vertices, 1) + targets
+    keys.sort()
+    indices = keys % max(n_vertices, 1)
 
-        polygons.append(polygon)
+    return helpers.data.Adjacency(
+        offsets, indices.astype(settings.INT_DTYPE, copy=False)
+    )
 
-        # check if we counted all the edges
-        # if so, exit
-        next_candidates.difference_update(polygons[-1])
-        line_starts.difference_update(polygons[-1])
 
-        if len(next_candidates) == len(line_starts) == 0:
-            break
+def element_neighbors(inverse, counts, n_subelements):
+    """Computes element to element neighbor table from unique sub-element
+    info. Two elements are neighbors if they share a sub-element, for
+    example an edge for faces or a face for volumes. Sub-elements that are
+    not shared by exactly two elements are marked with -1.
 
-        # let's try to find the next starting point
-        starting_point = None
-        if len(line_starts) != 0:
-            starting_point = min(line_starts)
-        else:
-            starting_point = min(next_candidates)
+    Parameters
+    -----------
+    inverse: (n * n_subelements,) np.ndarray
+      Unique sub-element id of each local sub-element.
+    counts: (m,) np.ndarray
+      Number of occurrences of each unique sub-element.
+    n_subelements: int
+      Number of sub-elements per element.
 
-    if not return_edges:
-        return polygons, is_polygon
+    Returns
+    --------
+    neighbors: (n, n_subelements) np.ndarray
+      Neighbor element id of each local sub-element. -1 if there's none.
+    """
+    inverse = np.asarray(inverse).ravel()
+    counts = np.asarray(counts).ravel()
 
-    else:
-        polygon_edges = []
-        for p, is_p in zip(polygons, is_polygon):
-            polygon_edges.append(sequence_to_edges(p, closed=is_p))
+    # group local sub-elements by their unique ids
+    order = np.argsort(inverse, kind="stable")
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    # pair sub-elements that appear exactly twice
+    two = offsets[:-1][counts == 2]
+    first = order[two]
+    second = order[two + 1]
+
+    neighbors = np.full(len(inverse), -1, dtype=settings.INT_DTYPE)
+    neighbors[first] = second // n_subelements
+    neighbors[second] = first // n_subelements
+
+    return neighbors.reshape(-1, n_subelements)
 
-        return polygon_edges, is_polygon
 
+def element_vertex_pairs(elements):
+    """Returns all vertex pairs within each element, i.e., non-zero pattern
+    of a matrix assembled on given elements.
 
-def _sequentialize_edges(edges, start=None, return_edges=False):
+    Parameters
+    -----------
+    elements: (n, d) np.ndarray
+
+    Returns
+    --------
+    pairs: (n * d * (d - 1) / 2, 2) np.ndarray
     """
-    sequentialize undirected edges. No overlaps are allowed, for now.
+    elements = np.asarray(elements, dtype=settings.INT_DTYPE)
+    first, second = np.triu_indices(elements.shape[1], 1)
+
+    return np.column_stack(
+        (elements[:, first].ravel(), elements[:, second].ravel())
+    )
+
+
+def bandwidth(edges, n_vertices=None):
+    """Computes bandwidth and profile of a symmetric matrix with the given
+    off-diagonal non-zero pattern. Profile is the sum of distances from
+    each row's first non-zero entry to the diagonal.
+
+    Parameters
+    -----------
+    edges: (n, 2) np.ndarray
+    n_vertices: int
+      (Optional) Default is max index + 1.
+
+    Returns
+    --------
+    bandwidth: int
+    profile: int
     """
-    edges = np.asanyarray(edges)
+    edges = np.asarray(edges, dtype=settings.INT_DTYPE).reshape(-1, 2)
+    if n_vertices is None:
+        n_vertices = int(edges.max()) + 1 if edges.size != 0 else 0
 
-    # only applicable to closed polygons and open lines
-    # not for arbitrarily connected edges
-    bc = np.bincount(edges.ravel())
-    if not all(bc < 3):
-        raise ValueError(
-            "This function currently supports individual lines/polygons "
-            "search. Given edges include connections with more than 3 edges."
-        )
+    if edges.size == 0:
+        return 0, 0
 
-    # we want to keep track of single occurrences, as they are line start
-    line_starts = set(np.where(bc == 1)[0])
+    lower = edges.min(axis=1)
+    upper = edges.max(axis=1)
 
-    # initialize a set to keep track of processes vertices
-    next_candidates = set(edges.ravel())
+    first_in_row = np.arange(n_vertices, dtype=settings.INT_DTYPE)
+    np.minimum.at(first_in_row, upper, lower)
 
-    # create a look up to each edge column
-    edge_col = collections.namedtuple("a", "b")
-    edge_col.a = edges[:, 0]
-    edge_col.b = edges[:, 1]
+    return (
+        int((upper - lower).max()),
+        int((np.arange(n_vertices) - first_in_row).sum()),
+    )
 
-    # create trees for each edge column
-    tree = collections.namedtuple("a", "b")
-    tree.a = napf.KDT(edge_col.a.reshape(-1, 1))
-    tree.b = napf.KDT(edge_col.b.reshape(-1, 1))
 
-    # radius search size
-    r = 0.1
+def _cuthill_mckee_levels(start, adjacency, degrees, visited):
+    """Breadth first search from start, one level at a time. Nodes of the
+    next level are ordered by their first visited neighbor in the current
+    level and then by degree, which is Cuthill-McKee ordering.
 
-    current_id = np.argmin(edge_col.a) if start is None else start
-    start_value = int(edge_col.a[current_id])
-    other_col = edge_col.b
+    Parameters
+    -----------
+    start: int
+    adjacency: Adjacency
+    degrees: (n,) np.ndarray
+    visited: (n,) np.ndarray
+      bool. Will be modified inplace.
 
-    polygons = []
-    is_polygon = []
-    for _ in range(len(edges)):
-        polygon = [start_value, other_col[current_id]]
+    Returns
+    --------
+    levels: list
+    """
+    offsets, indices = adjacency
+    frontier = np.array([start], dtype=settings.INT_DTYPE)
+    visited[start] = True
+    levels = [frontier]
+
+    while True:
+        # gather neighbors of the whole frontier
+        counts = degrees[frontier]
+        ranks = np.repeat(np.arange(len(frontier)), counts)
+        starts = np.repeat(
+            offsets[frontier] - np.cumsum(counts) + counts, counts
+        )
+        neighbors = indices[starts + np.arange(counts.sum())]
 
-        #        while polygon[0] != polygon[-1]:
-        for _ in range(len(next_candidates)):
-            if polygon[0] == polygon[-1]:
-                break
-            # search for ids
-            a_ids = tree.a.radius_search([[polygon[-1]]], r, True)[0][0]
-            b_ids = tree.b.radius_search([[polygon[-1]]], r, True)[0][0]
-
-            # in total, there should be 2 otherwise, we can end this search
-            # and this is not a polygon
-            hits = len(a_ids) + len(b_ids)
-            if hits != 2:
-                break
+        unvisited = ~visited[neighbors]
+        neighbors = neighbors[unvisited]
+        if len(neighbors) == 0:
+            return levels
 
-            # so, we have 2 hits. we need to get the partner of non-current_id
-            # index
-            found = False
-            for ai in a_ids:
-                if ai != current_id:
-                    found = True
-                    current_id = ai
-                    polygon.append(edge_col.b[current_id])
-                    break
-            if found:
-                continue
+        order = np.lexsort((degrees[neighbors], ranks[unvisited]))
+        neighbors = neighbors[order]
+        _, first = np.unique(neighbors, return_index=True)
+        frontier = neighbors[np.sort(first)]
 
-            for bi in b_ids:
-                if bi != current_id:
-                    found = True
-                    current_id = bi
-                    polygon.append(edge_col.a[current_id])
-                    break
-            if found:
-                continue
+        visited[frontier] = True
+        levels.append(frontier)
+
+
+def reverse_cuthill_mckee(adjacency):
+    """Computes reverse Cuthill-McKee ordering, which reduces bandwidth of
+    the adjacency matrix. Each component starts at a pseudo-peripheral node
+    and is traversed level by level. Isolated nodes are placed at the end.
+
+    Parameters
+    -----------
+    adjacency: Adjacency
+      CSR adjacency, see `vertex_to_vertex()`.
+
+    Returns
+    --------
+    order: (n,) np.ndarray
+      new_ids = order.argsort()
+    """
+    offsets = np.asarray(adjacency.offsets, dtype=settings.INT_DTYPE)
+    indices = np.asarray(adjacency.indices, dtype=settings.INT_DTYPE)
+    adjacency = helpers.data.Adjacency(offsets, indices)
+    degrees = np.diff(offsets)
+
+    visited = degrees == 0
+    ordered = [np.flatnonzero(visited).astype(settings.INT_DTYPE)]
+
+    # start of each component is searched in order of degree
+    candidates = np.argsort(degrees, kind="stable")
+    for candidate in candidates:
+        if visited[candidate]:
+            continue
 
-            raise RuntimeError(
-                "Something went wrong. Please report this issue to "
-                "github.com/tataratat/gustaf/issues]"
+        # pseudo-peripheral node: restart from a minimum degree node of the
+        # last level, as long as the depth grows.
+        start = candidate
+        depth = 0
+        while True:
+            levels = _cuthill_mckee_levels(
+                start, adjacency, degrees, visited.copy()
             )
+            if len(levels) <= depth:
+                break
+            depth = len(levels)
+            last = levels[-1]
+            start = last[np.argmin(degrees[last])]
 
-        # if indices closes itself, it is a polygon.
-        # Otherwise it is an open line
-        if polygon[0] == polygon[-1]:
-            polygon.pop()
-            is_polygon.append(True)
-        else:
-            is_polygon.append(False)
-        polygons.append(polygon)
+        levels = _cuthill_mckee_levels(start, adjacency, degrees, visited)
+        ordered.extend(levels)
 
-        # check if we counted all the edges
-        # if so, exit
-        # let's try to find the next starting point
-        next_candidates.difference_update(polygons[-1])
-        line_starts.difference_update(polygons[-1])
+    return np.concatenate(ordered)[::-1].astype(settings.INT_DTYPE)
 
-        if len(next_candidates) == len(line_starts) == 0:
-            break
 
-        # Assign next starting point
-        # generally first value of (those are min() in a set) line start or
-        # leftover candidates
-        start_value = None
-        if len(line_starts) != 0:
-            start_value = min(line_starts)
-        else:
-            start_value = min(next_candidates)
+def two_coloring(adjacency):
+    """Colors nodes by parity of their breadth first search level. Each
+    component starts at its smallest node id. This is a valid two coloring,
+    if the graph is bipartite, which is the case for structured grids.
 
-        # adjust state values
-        a_ids = tree.a.radius_search([[start_value]], r, True)[0][0]
-        if len(a_ids) != 0:
-            current_id = a_ids[0]
-            other_col = edge_col.b
-            continue
-        b_ids = tree.b.radius_search([[start_value]], r, True)[0][0]
-        if len(b_ids) != 0:
-            current_id = b_ids[0]
-            other_col = edge_col.a
+    Parameters
+    -----------
+    adjacency: Adjacency
+      CSR adjacency, see `vertex_to_vertex()`.
+
+    Returns
+    --------
+    colors: (n,) np.ndarray
+      bool.
+    """
+    offsets = np.asarray(adjacency.offsets, dtype=settings.INT_DTYPE)
+    indices = np.asarray(adjacency.indices, dtype=settings.INT_DTYPE)
+    adjacency = helpers.data.Adjacency(offsets, indices)
+    degrees = np.diff(offsets)
+
+    visited = degrees == 0
+    colors = np.zeros(len(degrees), dtype=bool)
+    for start in np.flatnonzero(~visited):
+        if visited[start]:
             continue
 
-        raise RuntimeError(
-            "Something went wrong. Please report this issue to "
-            "github.com/tataratat/gustaf/issues"
+        levels = _cuthill_mckee_levels(start, adjacency, degrees, visited)
+        for level in levels[1::2]:
+            colors[level] = True
+
+    return colors
+
+
+def connected_components(edges, n_nodes=None):
+    """Labels connected components of a graph, given as edges. Uses
+    array-based union-find: each round hooks roots of both ends of an edge
+    to the smaller one and flattens the trees with pointer jumping, until
+    every edge connects the same root. Components are numbered in order of
+    their smallest node id.
+
+    Parameters
+    -----------
+    edges: (n, 2) np.ndarray
+    n_nodes: int
+      (Optional) Number of nodes. Default is max index + 1.
+
+    Returns
+    --------
+    labels: (n_nodes,) np.ndarray
+    """
+    edges = np.asarray(edges, dtype=settings.INT_DTYPE).reshape(-1, 2)
+    if n_nodes is None:
+        n_nodes = int(edges.max()) + 1 if edges.size != 0 else 0
+
+    parents = np.arange(n_nodes, dtype=settings.INT_DTYPE)
+    tails, heads = edges[:, 0], edges[:, 1]
+
+    while True:
+        tail_roots = parents[tails]
+        head_roots = parents[heads]
+        unresolved = tail_roots != head_roots
+        if not unresolved.any():
+            break
+
+        # once connected, edges stay connected
+        tails, heads = tails[unresolved], heads[unresolved]
+        tail_roots = tail_roots[unresolved]
+        head_roots = head_roots[unresolved]
+
+        # hook larger root to smaller one. This can't create cycles.
+        np.minimum.at(
+            parents,
+            np.maximum(tail_roots, head_roots),
+            np.minimum(tail_roots, head_roots),
         )
 
-    if not return_edges:
-        return polygons, is_polygon
+        # pointer jumping until each node points to its root
+        grand_parents = parents[parents]
+        while not np.array_equal(grand_parents, parents):
+            parents = grand_parents
+            grand_parents = parents[parents]
 
-    else:
-        polygon_edges = []
-        for p, is_p in zip(polygons, is_polygon):
-            polygon_edges.append(sequence_to_edges(p, closed=is_p))
+    # roots are the smallest node of each component
+    return np.unique(parents, return_inverse=True)[1].astype(
+        settings.INT_DTYPE
+    )
 
-        return polygon_edges
 
+def _sequentialize_directed_edges(
+    edges, start=None, return_edges=False, flat=False
+):
+    """
+    Sequentialize directed edges. An edge's successor is the edge leaving
+    its head, given that the head has exactly one incoming and one outgoing
+    edge. Chains and cycles are then ranked with pointer jumping.
+    """
+    # we want to have an np array
+    edges = np.asanyarray(edges)
+    if edges.size == 0:
+        edges = np.empty((0, 2), dtype=settings.INT_DTYPE)
+    elif edges.ndim != 2 or edges.shape[1] != 2:
+        raise ValueError("Edges should have (n, 2) shape.")
+
+    tails = edges[:, 0]
+    heads = edges[:, 1]
+    n_vertices = int(edges.max()) + 1 if edges.size != 0 else 0
+
+    # Build a lookup_array - outgoing edge of each vertex
+    lookup_array = np.full(n_vertices, -1, dtype=np.int64)
+    lookup_array[tails] = np.arange(len(edges))
+
+    # only connect through vertices with one incoming and one outgoing edge
+    through = (np.bincount(tails, minlength=n_vertices) == 1) & (
+        np.bincount(heads, minlength=n_vertices) == 1
+    )
+    successors = np.where(through[heads], lookup_array[heads], -1)
 
-def sequentialize_edges(edges, start=None, return_edges=False, directed=False):
+    # select starting point - lowest index
+    tail_keys = tails.astype(np.int64)
+    if start is not None:
+        tail_keys[tails == start] = -1
+    keys = np.empty(len(edges), dtype=np.int64)
+    keys[np.lexsort((np.arange(len(edges)), tail_keys))] = np.arange(
+        len(edges)
+    )
+
+    order, offsets = _successor_chains(successors, keys)
+
+    return _sequences_output(
+        *_chains_to_sequences(order, offsets, tails, heads),
+        return_edges,
+        flat,
+    )
+
+
+def _pointer_jumping(successors, keys=None):
+    """
+    Pointer jumping (also known as pointer doubling) on a successor array,
+    where each node has at most one successor and at most one predecessor.
+    Each sweep doubles the reach of every node, so `log2(n)` sweeps are
+    enough to cover the longest chain.
+
+    Parameters
+    -----------
+    successors: (n,) np.ndarray
+      Successor of each node. -1 if there's none.
+    keys: (n,) np.ndarray
+      (Optional) Keys to propagate. Min of reachable keys will be returned.
+
+    Returns
+    --------
+    roots: (n,) np.ndarray
+      Last node of the chain. Arbitrary node of the cycle for cycles.
+    distances: (n,) np.ndarray
+      Number of steps to the last node. Only meaningful for open chains.
+    min_keys: (n,) np.ndarray
+      Min of reachable keys. For cycles, min of the cycle. None if keys is
+      None.
+    """
+    n_nodes = len(successors)
+    has_next = successors > -1
+    roots = np.where(has_next, successors, np.arange(n_nodes))
+    distances = has_next.astype(np.int64)
+    min_keys = None if keys is None else np.array(keys, copy=True)
+
+    for _ in range(int(n_nodes).bit_length()):
+        if min_keys is not None:
+            np.minimum(min_keys, min_keys[roots], out=min_keys)
+        distances = distances + distances[roots]
+        roots = roots[roots]
+
+    return roots, distances, min_keys
+
+
+def _successor_chains(successors, keys):
+    """
+    Orders nodes of a successor array into chains. Each node should have at
+    most one successor and at most one predecessor. Cycles are broken at the
+    node with the smallest key. Chains are sorted by the keys of their first
+    node.
+
+    Parameters
+    -----------
+    successors: (n,) np.ndarray
+      -1 if there's no successor.
+    keys: (n,) np.ndarray
+      Unique keys of each node.
+
+    Returns
+    --------
+    order: (n,) np.ndarray
+      Node ids ordered chain by chain.
+    offsets: (m + 1,) np.ndarray
+      Offsets of each chain in `order`.
+    """
+    n_nodes = len(successors)
+    ids = np.arange(n_nodes)
+    has_next = successors > -1
+
+    predecessors = np.full(n_nodes, -1, dtype=np.int64)
+    predecessors[successors[has_next]] = ids[has_next]
+
+    roots, distances, min_keys = _pointer_jumping(successors, keys)
+
+    # break cycles at their min key and rank them separately
+    on_cycle = has_next[roots]
+    if on_cycle.any():
+        cycle_starts = ids[on_cycle & (keys == min_keys)]
+        successors = successors.copy()
+        successors[predecessors[cycle_starts]] = -1
+        predecessors[cycle_starts] = -1
+
+        cycle_nodes = ids[on_cycle]
+        local_ids = np.full(n_nodes, -1, dtype=np.int64)
+        local_ids[cycle_nodes] = np.arange(len(cycle_nodes))
+        local_successors = successors[cycle_nodes]
+        local_successors[local_successors > -1] = local_ids[
+            local_successors[local_successors > -1]
+        ]
+        c_roots, c_distances, _ = _pointer_jumping(local_successors)
+        roots[cycle_nodes] = cycle_nodes[c_roots]
+        distances[cycle_nodes] = c_distances
+
+    # first nodes of each chain, sorted by their keys
+    firsts = ids[predecessors < 0]
+    firsts = firsts[np.argsort(keys[firsts], kind="stable")]
+    lengths = distances[firsts] + 1
+    offsets = np.zeros(len(firsts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    # place each node using its distance to the last node
+    chain_of_root = np.empty(n_nodes, dtype=np.int64)
+    chain_of_root[roots[firsts]] = np.arange(len(firsts))
+    chains = chain_of_root[roots]
+    order = np.empty(n_nodes, dtype=np.int64)
+    order[offsets[chains + 1] - 1 - distances] = ids
+
+    return order, offsets
+
+
+def _chains_to_sequences(order, offsets, tails, heads):
+    """
+    Given ordered chains of (tail -> head) connections, returns vertex
+    sequences. A chain that ends where it starts is a polygon and its last
+    vertex is not repeated.
+
+    Parameters
+    -----------
+    order: (n,) np.ndarray
+    offsets: (m + 1,) np.ndarray
+    tails: (n,) np.ndarray
+    heads: (n,) np.ndarray
+
+    Returns
+    --------
+    sequences: (p,) np.ndarray
+      Vertex ids of all sequences in one array.
+    sequence_offsets: (m + 1,) np.ndarray
+    is_polygon: (m,) np.ndarray
+    """
+    firsts = order[offsets[:-1]]
+    lasts = order[offsets[1:] - 1]
+    is_polygon = tails[firsts] == heads[lasts]
+
+    # open lines need one more vertex at the end
+    extra = (~is_polygon).astype(np.int64)
+    sequence_offsets = offsets.copy()
+    np.cumsum(extra, out=sequence_offsets[1:])
+    sequence_offsets[1:] += offsets[1:]
+
+    lengths = np.diff(offsets)
+    shift = np.repeat(sequence_offsets[:-1] - offsets[:-1], lengths)
+
+    sequences = np.empty(sequence_offsets[-1], dtype=tails.dtype)
+    sequences[np.arange(len(order)) + shift] = tails[order]
+    sequences[sequence_offsets[1:][~is_polygon] - 1] = heads[
+        lasts[~is_polygon]
+    ]
+
+    return sequences, sequence_offsets, is_polygon
+
+
+def _sequences_output(sequences, offsets, is_polygon, return_edges, flat):
+    """
+    Prepares sequentialize_edges' output. Splits flat sequences into list of
+    sequences unless flat is True. Sequences are turned into edges iff
+    return_edges is True.
+    """
+    if flat:
+        if return_edges:
+            # each polygon is closed by one more edge
+            lengths = np.diff(offsets)
+            n_edges = lengths - 1 + is_polygon
+            edge_offsets = np.zeros_like(offsets)
+            np.cumsum(n_edges, out=edge_offsets[1:])
+
+            starts = np.repeat(offsets[:-1], n_edges)
+            local = np.arange(edge_offsets[-1]) - np.repeat(
+                edge_offsets[:-1], n_edges
+            )
+            sequence_edges = np.empty(
+                (edge_offsets[-1], 2), dtype=sequences.dtype
+            )
+            sequence_edges[:, 0] = sequences[starts + local]
+            sequence_edges[:, 1] = sequences[
+                starts + (local + 1) % np.repeat(lengths, n_edges)
+            ]
+
+            return sequence_edges, edge_offsets, is_polygon
+
+        return sequences, offsets, is_polygon
+
+    sequences = [
+        sequences[o0:o1].tolist() for o0, o1 in zip(offsets[:-1], offsets[1:])
+    ]
+    is_polygon = is_polygon.tolist()
+
+    if return_edges:
+        sequences = [
+            sequence_to_edges(s, closed=is_p)
+            for s, is_p in zip(sequences, is_polygon)
+        ]
+
+    return sequences, is_polygon
+
+
+def _sequentialize_edges(edges, start=None, return_edges=False, flat=False):
+    """
+    Sequentialize undirected edges. Each edge is split into two directed
+    half-edges. A half-edge's successor is the other half-edge leaving its
+    head, given that the head is shared by exactly two edges. Vertices
+    shared by more than two edges (junctions) terminate chains. Chains are
+    then ranked with pointer jumping and the orientation starting at the
+    smaller vertex id is kept.
+    """
+    edges = np.asanyarray(edges)
+    if edges.size == 0:
+        edges = np.empty((0, 2), dtype=settings.INT_DTYPE)
+    elif edges.ndim != 2 or edges.shape[1] != 2:
+        raise ValueError("Edges should have (n, 2) shape.")
+
+    # half-edge `h` goes from flat_edges[h] to flat_edges[h ^ 1]
+    flat_edges = edges.ravel()
+    n_half = flat_edges.size
+
+    # vertex to half-edge adjacency, CSR
+    degree = np.bincount(flat_edges)
+    adjacency = np.argsort(flat_edges, kind="stable")
+    adjacency_offsets = np.zeros(len(degree) + 1, dtype=np.int64)
+    np.cumsum(degree, out=adjacency_offsets[1:])
+
+    # pair half-edges at the vertices with two connections
+    partner = np.full(n_half, -1, dtype=np.int64)
+    two = adjacency_offsets[:-1][degree == 2]
+    partner[adjacency[two]] = adjacency[two + 1]
+    partner[adjacency[two + 1]] = adjacency[two]
+
+    half_edges = np.arange(n_half)
+    successors = partner[half_edges ^ 1]
+
+    # unique keys: smaller vertex id first, then column 0 first.
+    tail_keys = flat_edges.astype(np.int64)
+    if start is not None:
+        tail_keys[flat_edges == start] = -1
+    keys = np.empty(n_half, dtype=np.int64)
+    keys[np.lexsort((half_edges >> 1, half_edges & 1, tail_keys))] = half_edges
+
+    # each chain appears twice - once per orientation
+    order, offsets = _successor_chains(successors, keys)
+    firsts = order[offsets[:-1]]
+    n_chains = len(firsts)
+    chains = np.empty(n_half, dtype=np.int64)
+    chains[order] = np.repeat(np.arange(n_chains), np.diff(offsets))
+
+    # keep orientation with the smaller first key
+    twins = chains[order[offsets[1:] - 1] ^ 1]
+    keep = keys[firsts] < keys[firsts[twins]]
+
+    lengths = np.diff(offsets)[keep]
+    order = order[np.repeat(keep, np.diff(offsets))]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    return _sequences_output(
+        *_chains_to_sequences(
+            order, offsets, flat_edges, flat_edges[half_edges ^ 1]
+        ),
+        return_edges,
+        flat,
+    )
+
+
+def sequentialize_edges(
+    edges, start=None, return_edges=False, directed=False, flat=False
+):
     """
     Organize edge connectivities to describe polygon or a line.
     This supports edges that describes separated/individual polygons and lines.
-    In other words, it doesn't support edges of overlapping vertices.
+    For undirected edges, vertices shared by more than two edges (junctions)
+    split the connected edges into separate lines.
 
     Parameters
     -----------
     edges: (n, 2) list-like
     start: int
-      (Optional) Specify starting point. It will take minimum index otherwise.
+      (Optional) Specify starting vertex. It will take minimum index
+      otherwise. For undirected edges, it applies to polygons and line ends.
     return_edges: bool
       (Optional) Default is False. If set True, returns sequences as edges.
     directed: bool
       (Optional) Default is False. Set True, if given edges are directed.
       It should return the result faster.
+    flat: bool
+      (Optional) Default is False. If set True, returns all sequences in one
+      array with offsets instead of list of lists.
 
     Returns
     --------
-    sequences: list
+    sequences: list or (m,) np.ndarray
       list of vertex ids. Or edges iff return_edges is True.
-    is_polygon: list
+      If flat is True, one array of all vertex ids, or (m, 2) edges.
+    offsets: (k + 1,) np.ndarray
+      Only if flat is True. `sequences[offsets[i]:offsets[i + 1]]` is i-th
+      sequence.
+    is_polygon: list or (k,) np.ndarray
       Tells if the sequence is a polygon or a line.
 
     Examples
@@ -823,6 +1777,6 @@ def sequentialize_edges(edges, start=None, return_edges=False, directed=False):
     ... )
     """
     if directed:
-        return _sequentialize_directed_edges(edges, start, return_edges)
+        return _sequentialize_directed_edges(edges, start, return_edges, flat)
     else:
-        return _sequentialize_edges(edges, start, return_edges)
+        return _sequentialize_edges(edges, start, return_edges, flat)
@@ -0,0 +1,179 @@
+"""gustaf/gustaf/utils/stats.py.
+
+Statistics of computed data: hits, misses, invalidations, compute time and
+result bytes of functions decorated with `ComputedData.depends_on`.
+Recording is enabled with `settings.COMPUTED_STATS` or within `report()`.
+"""
+
+import copy
+from contextlib import contextmanager
+
+from gustaf import settings
+from gustaf.helpers import data
+from gustaf.utils import log
+
+
+def collect(mesh=None):
+    """Returns a copy of recorded statistics.
+
+    Parameters
+    -----------
+    mesh: Vertices
+      (Optional) If given, statistics of this mesh. Otherwise, global
+      statistics of all meshes.
+
+    Returns
+    --------
+    stats: dict
+      Counters per function, i.e., hits, misses, invalidations,
+      invalidated_by (counts per modified dependee), loads (from shared
+      topology or disk cache), time (inclusive compute or load time in
+      seconds) and nbytes (sum of result bytes).
+    """
+    stats = data.COMPUTED_STATS if mesh is None else mesh._computed._stats
+
+    return copy.deepcopy(stats)
+
+
+def reset(mesh=None):
+    """Clears recorded statistics.
+
+    Parameters
+    -----------
+    mesh: Vertices
+      (Optional) If given, clears statistics of this mesh only. Otherwise,
+      clears global statistics.
+
+    Returns
+    --------
+    None
+    """
+    if mesh is None:
+        data.COMPUTED_STATS.clear()
+    else:
+        mesh._computed._stats.clear()
+
+
+def difference(after, before):
+    """Returns statistics recorded between two `collect()` calls. Functions
+    without calls in between are skipped.
+
+    Parameters
+    -----------
+    after: dict
+    before: dict
+
+    Returns
+    --------
+    stats: dict
+    """
+    diff = {}
+    for key, stats in after.items():
+        previous = before.get(key, data._new_stats())
+        counters = {
+            name: value - previous[name]
+            for name, value in stats.items()
+            if name != "invalidated_by"
+        }
+        by = {
+            dependee: count - previous["invalidated_by"].get(dependee, 0)
+            for dependee, count in stats["invalidated_by"].items()
+        }
+        counters["invalidated_by"] = {d: c for d, c in by.items() if c}
+
+        counts = ("hits", "misses", "loads", "invalidations")
+        if any(counters[c] for c in counts):
+            diff[key] = counters
+
+    return diff
+
+
+def summary(stats):
+    """Formats statistics as a table, sorted by compute time.
+
+    Parameters
+    -----------
+    stats: dict
+
+    Returns
+    --------
+    summary: str
+    """
+    header = (
+        "names",
+        "hits",
+        "misses",
+        "loads",
+        "invalid",
+        "time",
+        "bytes",
+        "by",
+    )
+    rows = [header]
+    for key, s in sorted(
+        stats.items(), key=lambda item: item[1]["time"], reverse=True
+    ):
+        rows.append(
+            (
+                key,
+                str(s["hits"]),
+                str(s["misses"]),
+                str(s["loads"]),
+                str(s["invalidations"]),
+                f"{s['time']:.6f}",
+                str(s["nbytes"]),
+                ", ".join(f"{d}: {c}" for d, c in s["invalidated_by"].items()),
+            )
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = ["\n+++ computed data - stats +++"]
+    for row in rows:
+        cells = [row[0].ljust(widths[0])]
+        cells.extend(c.rjust(w) for c, w in zip(row[1:-1], widths[1:-1]))
+        cells.append(row[-1])
+        lines.append(" | ".join(cells).rstrip())
+
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def report(mesh=None, print_=True, log_=False):
+    """Context manager that records statistics within its block and reports
+    them on exit.
+
+    Parameters
+    -----------
+    mesh: Vertices
+      (Optional) If given, reports statistics of this mesh only.
+    print_: bool
+      Prints the summary. Default is True.
+    log_: bool
+      Logs the summary with info level. Default is False.
+
+    Yields
+    -------
+    stats: dict
+      Empty until exit. Then filled with statistics of the block.
+
+    Examples
+    ---------
+    >>> with gus.utils.stats.report():
+    ...     pipeline(mesh)
+    """
+    enabled = settings.COMPUTED_STATS
+    settings.COMPUTED_STATS = True
+    before = collect(mesh)
+    stats = {}
+
+    try:
+        yield stats
+    finally:
+        settings.COMPUTED_STATS = enabled
+        stats.update(difference(collect(mesh), before))
+
+        message = summary(stats)
+        if log_:
+            log.info(message)
+        if print_:
+            print(message)  # noqa: T201
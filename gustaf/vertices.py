@@ -4,6 +4,7 @@ Vertices. Base of all "Mesh" geometries.
 """
 
 import copy
+from contextlib import contextmanager
 
 import numpy as np
 
@@ -158,7 +159,7 @@ class Vertices(GustafBase):
 
         # we try not to make copy.
         self._vertices = helpers.data.make_tracked_array(
-            vs, settings.FLOAT_DTYPE, copy=False
+            vs, settings.FLOAT_DTYPE, copy=False, owner=(self, "_vertices")
         )
 
         # shape check
@@ -207,6 +208,23 @@ class Vertices(GustafBase):
         self._logd("returning vertex_data")
         return self._vertex_data
 
+    @property
+    def computed_data(self):
+        """
+        Returns computed data manager. Holds values of computed functions,
+        e.g. `unique_vertices()`, and its memory budget, pinned and
+        evict-first keys.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        computed_data: ComputedMeshData
+        """
+        return self._computed
+
     @property
     def show_options(self):
         """
@@ -240,7 +258,7 @@ class Vertices(GustafBase):
         """
         return "vertices"
 
-    @helpers.data.ComputedMeshData.depends_on(["vertices"])
+    @helpers.data.ComputedMeshData.depends_on(["vertices"], persistent=True)
     def unique_vertices(self, tolerance=None, **kwargs):
         """Returns a namedtuple that holds unique vertices info. Unique here
         means "close-enough-within-tolerance".
@@ -322,7 +340,8 @@ class Vertices(GustafBase):
     def update_vertices(self, mask, inverse=None):
         """Update vertices with a mask. In other words, keeps only masked
         vertices. Adapted from `github.com/mikedh/trimesh`. Updates
-        connectivity accordingly too.
+        connectivity accordingly too. Unless inverse is given, computed data
+        is remapped, where possible. See `Edges._remap_computed()`.
 
         Parameters
         -----------
@@ -353,6 +372,13 @@ class Vertices(GustafBase):
             else:
                 inverse = None
 
+        # computed data can be remapped, if inverse is derived from mask
+        computed = None
+        if check_neg and inverse is not None:
+            computed = self._computed.valid_items()
+            n_vertices = len(vertices)
+            n_elements = len(self.const_elements)
+
         # re-index elements from inverse
         # TODO: Here could be a good place to preserve BCs.
         elements = None
@@ -392,6 +418,15 @@ class Vertices(GustafBase):
 
         update_vertex_data(self, mask, v_data)
 
+        if computed is not None:
+            self._remap_computed(
+                computed,
+                np.flatnonzero(elem_mask),
+                n_elements,
+                np.arange(n_vertices)[mask],
+                n_vertices,
+            )
+
         return self
 
     def select_vertices(self, ranges):
@@ -447,6 +482,78 @@ class Vertices(GustafBase):
             inverse=unique_vs.inverse,
         )
 
+    def reorder(self, method="rcm"):
+        """Renumbers vertices and elements to improve cache locality. Vertex
+        data and BC element ids are permuted accordingly. Computed data is
+        refreshed, as vertices and elements are newly set.
+
+        ``Methods``
+
+        - rcm: reverse Cuthill-McKee on vertex pairs of elements. Reduces
+          bandwidth of assembled matrices. Requires elements.
+        - hilbert / morton: sorts vertices along a space filling curve.
+
+        Elements are sorted by their smallest new vertex id.
+
+        Parameters
+        -----------
+        method: str
+          "rcm", "hilbert" or "morton". Default is "rcm".
+
+        Returns
+        --------
+        vertex_order: (n,) np.ndarray
+          new_vertices = old_vertices[vertex_order]
+        element_order: (m,) np.ndarray
+          new_elements = renumbered old_elements[element_order]. None for
+          Vertices.
+        """
+        has_elem = self.kind != "vertex"
+        if method == "rcm":
+            if not has_elem:
+                raise ValueError("`rcm` requires elements.")
+            pairs = utils.connec.element_vertex_pairs(self.const_elements)
+            unique_pairs = utils.connec.sorted_unique(np.sort(pairs, axis=1))
+            vertex_order = utils.connec.reverse_cuthill_mckee(
+                utils.connec.vertex_to_vertex(
+                    unique_pairs.values, len(self.vertices)
+                )
+            )
+        else:
+            vertex_order = utils.arr.space_filling_order(
+                self.const_vertices, curve=method
+            )
+
+        vertex_data = self.vertex_data._saved.copy()
+        element_order = None
+        if has_elem:
+            inverse = np.empty_like(vertex_order)
+            inverse[vertex_order] = np.arange(len(vertex_order))
+            elements = inverse[self.const_elements]
+            element_order = np.argsort(
+                elements.min(axis=1), kind="stable"
+            ).astype(settings.INT_DTYPE)
+
+            # BC holds sub-element ids: element_id * n_sub + local_id
+            if len(getattr(self, "BC", {})) != 0:
+                boundary = self.__boundary_class__.__qualname__.lower()
+                n_sub = len(self._get_attr(boundary)) // len(elements)
+                element_inverse = np.empty_like(element_order)
+                element_inverse[element_order] = np.arange(len(element_order))
+                for key, bc_ids in self.BC.items():
+                    ids = np.asarray(bc_ids)
+                    self.BC[key] = (
+                        element_inverse[ids // n_sub] * n_sub + ids % n_sub
+                    )
+
+            self.elements = elements[element_order]
+
+        self.vertices = self.const_vertices[vertex_order]
+        for key, values in vertex_data.items():
+            self.vertex_data[key] = values[vertex_order]
+
+        return vertex_order, element_order
+
     def showable(self, **kwargs):
         """Returns showable object, meaning object of visualization backend.
 
@@ -475,30 +582,131 @@ class Vertices(GustafBase):
         """
         return show.show(self, **kwargs)
 
-    def copy(self):
-        """Returns deepcopy of self.
+    def copy(self, deep=False):
+        """Returns copy of self. By default, tracked arrays, i.e. vertices,
+        elements and vertex_data, and computed data are shared with the
+        copy, until one side changes an array inplace. Self keeps its
+        arrays: before its first inplace change, the copy gets a private
+        copy of that array. The copy makes a private copy on its first
+        inplace change. Writes that bypass TrackedArray, for example ufuncs
+        with `out=` or writes through `np.asarray()`, are not detected and
+        are visible to the copy. Use `deep=True` for such cases.
 
         Parameters
         -----------
-        None
+        deep: bool
+          Default is False. If True, copies all arrays immediately.
 
         Returns
         --------
         self_copy: type(self)
         """
-        # all attributes are deepcopy-able
-        copied = copy.deepcopy(self)
+
+        def copy_array(array, owner):
+            if not deep:
+                return helpers.data.share_tracked_array(array, owner)
+
+            copied_array = helpers.data.make_tracked_array(
+                array, array.dtype, copy=True, owner=owner
+            )
+            copied_array._modified = array.modified
+            return copied_array
+
+        copied = copy.copy(self)
+        const_slots = []
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot.startswith("__") or not hasattr(self, slot):
+                    continue
+
+                value = getattr(self, slot)
+                if slot.startswith("_const_"):
+                    const_slots.append(slot)
+                elif isinstance(value, helpers.data.TrackedArray):
+                    setattr(copied, slot, copy_array(value, (copied, slot)))
+                elif isinstance(value, helpers.data.VertexData):
+                    vertex_data = helpers.data.VertexData(copied)
+                    for key, array in value.items():
+                        vertex_data._saved[key] = copy_array(
+                            array, (vertex_data, key)
+                        )
+                    copied._vertex_data = vertex_data
+                elif isinstance(value, helpers.data.ComputedData):
+                    computed = type(value)(copied)
+                    computed._saved = (
+                        copy.deepcopy(value._saved)
+                        if deep
+                        else dict(value._saved)
+                    )
+                    computed._memo = {
+                        key: copy.deepcopy(memo) if deep else memo.copy()
+                        for key, memo in value._memo.items()
+                    }
+                    computed._lru = value._lru.copy()
+                    computed._bytes_limit = value._bytes_limit
+                    computed._pinned = value._pinned.copy()
+                    computed._cheap = value._cheap.copy()
+                    copied._computed = computed
+                else:
+                    # show options, BC, ...
+                    setattr(copied, slot, copy.deepcopy(value))
+
+        # non-writeable views of new arrays
+        for slot in const_slots:
+            setattr(copied, slot, getattr(copied, slot[6:]).view())
 
         # update helpee. otherwise keeps reference to self
         copied._show_options._helpee = copied
-        copied._vertex_data._helpee = copied
-        copied._computed._helpee = copied
 
         return copied
 
+    @contextmanager
+    def edit(self):
+        """Context manager for batched inplace changes. Yields plain
+        np.ndarray views of vertices and elements, that skip modification
+        tracking of TrackedArray. Arrays are marked modified once on exit.
+        Arrays that are shared with copies, see `copy()`, are made private
+        on enter.
+
+        Parameters
+        -----------
+        None
+
+        Yields
+        -------
+        arrays: EditArrays
+          namedtuple with `vertices` and `elements`. elements is None for
+          Vertices.
+
+        Examples
+        ---------
+        >>> with mesh.edit() as arrays:
+        ...     for _ in range(10):
+        ...         arrays.vertices[ids] += step
+        """
+        names = (
+            ("vertices",)
+            if self.kind == "vertex"
+            else ("vertices", "elements")
+        )
+        views = []
+        for name in names:
+            # detach shared arrays
+            tracked = getattr(self, name)._copy_on_write()
+            views.append(np.asarray(tracked))
+
+        try:
+            yield helpers.data.EditArrays(*views, *[None] * (2 - len(names)))
+        finally:
+            for name in names:
+                getattr(self, name).modified = True
+
     @classmethod
     def concat(cls, *instances):
-        """Sequentially put them together to make one object.
+        """Sequentially put them together to make one object. Buffers are
+        sized first and then filled, without copying instances. Unreferenced
+        vertices are skipped. vertex_data is concatenated for keys that all
+        instances have and BC ids are offset by their element offsets.
 
         Parameters
         -----------
@@ -509,11 +717,6 @@ class Vertices(GustafBase):
         --------
         one_instance: type(cls)
         """
-
-        def is_concatable(inst):
-            """Return true, if it is same as type(cls)"""
-            return bool(isinstance(inst, cls))
-
         # If only one instance is given and it is iterable, adjust
         # so that we will just iterate that.
         if (
@@ -522,45 +725,115 @@ class Vertices(GustafBase):
             and hasattr(instances[0], "__iter__")
         ):
             instances = instances[0]
-
-        vertices = []
-        has_elem = cls.kind != "vertex"
-        if has_elem:
-            elements = []
+        instances = list(instances)
 
         # check if everything is "concatable".
         for ins in instances:
-            if not is_concatable(ins):
+            if not isinstance(ins, cls):
                 raise TypeError(
                     "Can't concat. One of the instances is not "
                     f"`{cls.__name__}`."
                 )
 
-            tmp_ins = ins.copy()
+        # first pass: size buffers. Unreferenced vertices are skipped.
+        has_elem = cls.kind != "vertex"
+        vertices_list = [ins.const_vertices for ins in instances]
+        elements_list = [
+            ins.const_elements if has_elem else None for ins in instances
+        ]
+        masks = []
+        for v, e in zip(vertices_list, elements_list):
+            mask = None
+            if e is not None:
+                mask = np.zeros(len(v), dtype=bool)
+                mask[e] = True
+                if mask.all():
+                    mask = None
+            masks.append(mask)
+
+        n_vertices = np.array(
+            [
+                len(v) if m is None else m.sum()
+                for v, m in zip(vertices_list, masks)
+            ],
+            dtype=settings.INT_DTYPE,
+        )
+        v_offsets = np.concatenate(([0], np.cumsum(n_vertices)))
+        vertices = np.empty(
+            (v_offsets[-1], vertices_list[0].shape[1]),
+            dtype=settings.FLOAT_DTYPE,
+        )
+
+        # only keys that every instance has
+        data_keys = set(instances[0].vertex_data.keys())
+        for ins in instances[1:]:
+            data_keys &= set(ins.vertex_data.keys())
+        vertex_data = {}
+        for key in data_keys:
+            values = instances[0].vertex_data[key]
+            vertex_data[key] = np.empty(
+                (v_offsets[-1], *values.shape[1:]), dtype=values.dtype
+            )
 
-            # make sure each element index starts from 0 & end at len(vertices)
-            if has_elem:
-                tmp_ins.remove_unreferenced_vertices()
+        if has_elem:
+            e_offsets = np.concatenate(
+                ([0], np.cumsum([len(e) for e in elements_list]))
+            )
+            elements = np.empty(
+                (e_offsets[-1], elements_list[0].shape[1]),
+                dtype=settings.INT_DTYPE,
+            )
 
-            vertices.append(tmp_ins.vertices)
+        # second pass: fill
+        for i, (ins, mask) in enumerate(zip(instances, masks)):
+            v_range = slice(v_offsets[i], v_offsets[i + 1])
+            select = slice(None) if mask is None else mask
 
-            if has_elem:
-                if len(elements) == 0:
-                    elements.append(tmp_ins.elements)
-                    e_offset = elements[-1].max() + 1
+            vertices[v_range] = vertices_list[i][select]
+            for key, values in vertex_data.items():
+                values[v_range] = ins.vertex_data[key][select]
 
-                else:
-                    elements.append(tmp_ins.elements + e_offset)
-                    e_offset = elements[-1].max() + 1
+            if not has_elem:
+                continue
 
-        if has_elem:
-            return cls(
-                vertices=np.vstack(vertices),
-                elements=np.vstack(elements),
-            )
+            e_range = slice(e_offsets[i], e_offsets[i + 1])
+            if mask is None:
+                np.add(elements_list[i], v_offsets[i], out=elements[e_range])
+            else:
+                new_ids = np.cumsum(mask, dtype=settings.INT_DTYPE) - 1
+                np.add(
+                    new_ids[elements_list[i]],
+                    v_offsets[i],
+                    out=elements[e_range],
+                )
 
+        if not has_elem:
+            one_instance = cls(vertices=vertices)
         else:
-            return Vertices(vertices=np.vstack(vertices))
+            one_instance = cls(vertices=vertices, elements=elements)
+
+        for key, values in vertex_data.items():
+            one_instance.vertex_data[key] = values
+
+        # BC holds sub-element ids: element_id * n_sub + local_id
+        with_bc = [
+            i for i, ins in enumerate(instances) if len(getattr(ins, "BC", {}))
+        ]
+        if len(with_bc) != 0:
+            ins = instances[with_bc[0]]
+            boundary = cls.__boundary_class__.__qualname__.lower()
+            n_sub = len(ins._get_attr(boundary)) // len(ins.const_elements)
+            bc = {}
+            for i in with_bc:
+                for key, bc_ids in instances[i].BC.items():
+                    bc.setdefault(key, []).append(
+                        np.asarray(bc_ids) + e_offsets[i] * n_sub
+                    )
+            one_instance.BC = {
+                key: np.concatenate(ids) for key, ids in bc.items()
+            }
+
+        return one_instance
 
     def __add__(self, to_add):
         """Concat in form of +.
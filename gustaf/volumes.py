@@ -114,7 +114,7 @@ class Volumes(Faces):
         elif elements is not None:
             self.volumes = elements
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], evict_first=True)
     def faces(self):
         """Faces here aren't main property. So this needs to be computed.
 
@@ -126,14 +126,27 @@ class Volumes(Faces):
         --------
         faces: (n, 3) or (n, 4) np.ndarray
         """
-        whatami = self.whatami
-        faces = None
-        if whatami.startswith("tet"):
-            faces = utils.connec.tet_to_tri(self.volumes)
-        elif whatami.startswith("hexa"):
-            faces = utils.connec.hexa_to_quad(self.volumes)
+        return utils.connec.to_subelements(
+            self.volumes,
+            self.whatami,
+            "tri" if self.whatami.startswith("tet") else "quad",
+        )
+
+    @helpers.data.ComputedMeshData.depends_on(["elements"], evict_first=True)
+    def edges(self):
+        """Edges of volumes, extracted directly from volumes. Each edge
+        appears once per volume, i.e., 6 for tet and 12 for hexa.
+
+        Parameters
+        -----------
+        None
 
-        return faces
+        Returns
+        --------
+        edges: (n, 2) np.ndarray
+        """
+        self._logd("computing edges")
+        return utils.connec.to_subelements(self.volumes, self.whatami, "edges")
 
     @classmethod
     def whatareyou(cls, volume_obj):
@@ -193,6 +206,7 @@ class Volumes(Faces):
             vols,
             settings.INT_DTYPE,
             copy=False,
+            owner=(self, "_volumes"),
         )
         if vols is not None:
             utils.arr.is_one_of_shapes(
@@ -218,7 +232,7 @@ class Volumes(Faces):
         """
         return self._const_volumes
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], evict_first=True)
     def sorted_volumes(self):
         """Sort volumes along axis=1.
 
@@ -234,7 +248,7 @@ class Volumes(Faces):
 
         return np.sort(volumes, axis=1)
 
-    @helpers.data.ComputedMeshData.depends_on(["elements"])
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
     def unique_volumes(self):
         """Returns a namedtuple of unique volumes info. Similar to
         unique_edges.
@@ -259,6 +273,29 @@ class Volumes(Faces):
 
         return unique_info
 
+    @helpers.data.ComputedMeshData.depends_on(["elements"], persistent=True)
+    def element_neighbors(self):
+        """Returns neighbor volumes of each volume, based on shared faces.
+        Column order follows face order of `faces()`. Faces that aren't
+        shared by exactly two volumes, e.g. surfaces, are marked with -1.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        neighbors: (n_volumes, n_faces_per_volume) np.ndarray
+        """
+        self._logd("computing element_neighbors")
+        unique_info = self.unique_faces()
+
+        return utils.connec.element_neighbors(
+            unique_info.inverse,
+            unique_info.counts,
+            len(unique_info.inverse) // len(self.volumes),
+        )
+
     def update_volumes(self, *args, **kwargs):
         """Alias to update_elements."""
         self.update_elements(*args, **kwargs)
@@ -45,3 +45,37 @@ def test_concat(grid, request):
         assert (
             np.tile(grid.elements, (n_grids, 1)) - concated.elements
         ).sum() == 0
+
+
+def test_concat_data_and_bc(faces_quad):
+    """vertex_data of common keys and BC are concatenated."""
+    n_vertices = len(faces_quad.vertices)
+    n_faces = len(faces_quad.faces)
+
+    first = faces_quad.copy()
+    first.vertex_data["x"] = first.vertices[:, 0]
+    first.vertex_data["only_first"] = first.vertices[:, 1]
+    first.BC = {"a": np.array([0, 1])}
+
+    # second one has an unreferenced vertex, which is skipped
+    second = type(faces_quad)(
+        np.vstack((faces_quad.vertices, [[9.0, 9.0, 9.0]])),
+        faces_quad.faces,
+    )
+    second.vertex_data["x"] = second.vertices[:, 0]
+    second.BC = {"a": np.array([2]), "b": np.array([3])}
+
+    concated = type(faces_quad).concat(first, second)
+    assert len(concated.vertices) == 2 * n_vertices
+    assert set(concated.vertex_data.keys()) == {"x"}
+    assert np.allclose(
+        concated.vertex_data["x"].ravel(), concated.vertices[:, 0]
+    )
+
+    # quads have 4 edges each
+    assert concated.BC["a"].tolist() == [0, 1, 4 * n_faces + 2]
+    assert concated.BC["b"].tolist() == [4 * n_faces + 3]
+
+    # inputs are untouched
+    assert len(second.vertices) == n_vertices + 1
+    assert len(first.BC["a"]) == 2
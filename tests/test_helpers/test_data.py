@@ -1,4 +1,5 @@
 import sys
+from collections import OrderedDict
 
 import numpy as np
 import pytest
@@ -210,6 +211,9 @@ def test_ComputedData(grid, request):
         "faces",
         "sorted_volumes",
         "unique_volumes",
+        "vertex_element_adjacency",
+        "vertex_vertex_adjacency",
+        "element_neighbors",
     )
 
     # for both
@@ -254,6 +258,166 @@ def test_ComputedData(grid, request):
             assert value is not func()
 
 
+def test_ComputedData_arguments(faces_tri, monkeypatch):
+    faces = faces_tri
+
+    # default arguments - given or not - share the saved value
+    default = faces.unique_vertices()
+    assert default is faces.unique_vertices(None)
+    assert default is faces.unique_vertices(tolerance=None)
+
+    # other arguments are memoized separately
+    loose = faces.unique_vertices(tolerance=1e-3)
+    assert loose is faces.unique_vertices(1e-3)
+    assert loose is faces.unique_vertices(tolerance=np.float64(1e-3))
+    assert loose is not default
+    assert default is faces.unique_vertices()
+
+    # escape hatch
+    assert loose is not faces.unique_vertices(tolerance=1e-3, recompute=True)
+    assert default is not faces.unique_vertices(recompute=True)
+
+    # least recently used ones are dropped
+    monkeypatch.setattr(gustaf.settings, "COMPUTED_LRU_SIZE", 2)
+    first = faces.unique_vertices(tolerance=1e-1)
+    faces.unique_vertices(tolerance=1e-2)
+    assert first is faces.unique_vertices(tolerance=1e-1)
+    faces.unique_vertices(tolerance=1e-4)
+    assert first is faces.unique_vertices(tolerance=1e-1)
+    assert len(faces._computed._memo["unique_vertices"]) == 2
+
+    # modification clears all of them
+    normals = faces.vertex_normals(angle_weighting=True)
+    faces.vertices[0] += 1
+    assert first is not faces.unique_vertices(tolerance=1e-1)
+    assert normals is not faces.vertex_normals(angle_weighting=True)
+
+
+def test_ComputedData_budget(volumes_hexa, monkeypatch):
+    volumes = volumes_hexa
+    computed = volumes.computed_data
+
+    def saved():
+        return {k for k, v in computed.items() if v is not None}
+
+    unique_faces = volumes.unique_faces()
+    neighbors = volumes.element_neighbors()
+    assert computed.nbytes() > 0
+
+    # global budget - cheap values go first
+    monkeypatch.setattr(
+        gustaf.settings, "COMPUTED_BYTES_LIMIT", computed.nbytes() - 1
+    )
+    computed._evict()
+    assert computed.nbytes() <= gustaf.settings.COMPUTED_BYTES_LIMIT
+    assert "sorted_faces" not in saved()
+    assert unique_faces is volumes.unique_faces()
+
+    # per-object budget, with pinned value
+    computed.pin("element_neighbors")
+    computed.bytes_limit = neighbors.nbytes
+    assert saved() == {"element_neighbors"}
+    assert neighbors is volumes.element_neighbors()
+
+    # least recently used goes
+    computed.unpin("element_neighbors")
+    computed.bytes_limit = float("inf")
+    volumes.bounds()
+    volumes.element_neighbors()
+    computed.bytes_limit = computed.nbytes() - 1
+    assert saved() == {"element_neighbors"}
+
+    # unless others are marked evict-first
+    computed.bytes_limit = float("inf")
+    bounds = volumes.bounds()
+    computed.evict_first("element_neighbors")
+    computed.bytes_limit = computed.nbytes() - 1
+    assert saved() == {"bounds"}
+
+    # copies keep settings
+    assert volumes.copy().computed_data.bytes_limit == computed.bytes_limit
+    assert bounds is volumes.bounds()
+
+
+def test_ComputedData_disk_cache(volumes_tet, tmp_path, monkeypatch):
+    monkeypatch.setattr(gustaf.settings, "COMPUTED_CACHE_DIR", str(tmp_path))
+
+    # computed and saved
+    unique_faces = volumes_tet.unique_faces()
+    single_faces = volumes_tet.single_faces()
+    unique_vertices = volumes_tet.unique_vertices(tolerance=1e-3)
+    assert len(list(tmp_path.iterdir())) == 3
+
+    # other objects with same content load memory-mapped entries
+    same = gustaf.Volumes(
+        volumes_tet.vertices.copy(), volumes_tet.volumes.copy()
+    )
+    with gustaf.utils.stats.report(same, print_=False) as stats:
+        loaded = same.unique_faces()
+        same.single_faces()
+        same.unique_vertices(tolerance=1e-3)
+    assert all(s["loads"] == 1 for s in stats.values())
+    assert all(s["misses"] == 0 for s in stats.values())
+    assert isinstance(loaded.values, np.memmap)
+    for v, r in zip(loaded, unique_faces):
+        assert np.array_equal(v, r)
+    assert np.array_equal(same.single_faces(), single_faces)
+    assert np.array_equal(
+        same.unique_vertices(tolerance=1e-3).inverse, unique_vertices.inverse
+    )
+
+    # other content or arguments miss
+    same.vertices[0] += 1.0
+    with gustaf.utils.stats.report(same, print_=False) as stats:
+        same.unique_vertices(tolerance=1e-3)
+        same.unique_vertices(tolerance=1e-4)
+        same.unique_faces()
+    assert stats["unique_vertices"]["misses"] == 2
+    assert stats["unique_faces"]["hits"] == 1
+    assert len(list(tmp_path.iterdir())) == 5
+
+
+def test_ComputedData_disk_cache_per_class(vertices_3d, tmp_path, monkeypatch):
+    monkeypatch.setattr(gustaf.settings, "COMPUTED_CACHE_DIR", str(tmp_path))
+    connectivity = np.arange(8)
+
+    # same connectivity, read as one hexa and as two quads
+    hexa = gustaf.Mixed(vertices_3d, connectivity, cell_types=[6])
+    quads = gustaf.Mixed(vertices_3d, connectivity, cell_types=[2, 2])
+    assert len(hexa.unique_edges().values) == 12
+    assert len(quads.unique_edges().values) == 8
+
+    # functions of the same name are persistent per class
+    resolve = gustaf.helpers.data.ComputedMeshData._resolve
+    assert "unique_edges" in resolve(gustaf.Faces).persistent
+    assert "unique_edges" not in resolve(gustaf.Mixed).persistent
+
+
+def test_ComputedData_shared_topology(volumes_hexa, monkeypatch):
+    monkeypatch.setattr(gustaf.settings, "COMPUTED_SHARED_TOPOLOGY", True)
+    monkeypatch.setattr(gustaf.helpers.data, "SHARED_TOPOLOGY", OrderedDict())
+
+    unique_faces = volumes_hexa.unique_faces()
+    centers = volumes_hexa.centers()
+
+    # deformed frame - topology is shared, geometry isn't
+    frame = gustaf.Volumes(volumes_hexa.vertices * 2, volumes_hexa.volumes)
+    assert frame.unique_faces() is unique_faces
+    assert not unique_faces.values.flags.writeable
+    assert frame.centers() is not centers
+    assert np.allclose(frame.centers(), centers * 2)
+
+    # other elements or recompute don't share
+    frame.elements = frame.elements[:, [1, 2, 3, 0, 5, 6, 7, 4]]
+    assert frame.unique_faces() is not unique_faces
+    assert volumes_hexa.unique_faces(recompute=True) is not unique_faces
+
+    # bounded
+    monkeypatch.setattr(gustaf.settings, "COMPUTED_SHARED_TOPOLOGY_SIZE", 1)
+    volumes_hexa.single_faces()
+    assert len(gustaf.helpers.data.SHARED_TOPOLOGY) == 1
+
+
 @pytest.mark.parametrize(
     "grid", ("edges", "faces_tri", "faces_quad", "volumes_tet", "volumes_hexa")
 )
@@ -300,3 +464,141 @@ def test_VertexData(grid, request):
     with pytest.raises(ValueError):
         grid.vertex_data["norm"] = grid.vertex_data.as_scalar(key)
         grid.vertex_data.as_arrow("norm")
+
+
+@pytest.mark.parametrize("deep", (False, True))
+def test_copy_writes_to_original(faces_quad, deep):
+    faces = faces_quad
+    vertices = faces.vertices
+    reference = np.array(faces.vertices)
+    copied = faces.copy(deep=deep)
+
+    # (a) inplace change of a column view
+    column = faces.vertices[:, 0]
+    column *= 0
+    assert np.allclose(faces.vertices[:, 0], 0)
+
+    # (b) consecutive writes through a held reference
+    vertices[0, 0] = 100
+    vertices[1, 0] = 200
+    assert faces.vertices is vertices
+    assert np.allclose(faces.vertices[:2, 0], [100, 200])
+
+    # (c) assignment to a view
+    view = faces.vertices[:, 1]
+    view[:] = 7
+    assert np.allclose(faces.vertices[:, 1], 7)
+
+    # (d) ufunc output
+    np.multiply(reference, 2, out=faces.vertices)
+    assert np.allclose(faces.vertices, reference * 2)
+    assert faces.vertices is vertices
+
+    # copy stays untouched. (d) is not detected, but a) - c) detached it
+    assert np.allclose(copied.vertices, reference)
+    assert not np.shares_memory(copied.vertices, faces.vertices)
+
+
+def test_copy_keeps_readonly_arrays():
+    box = gustaf.create.faces.box(resolutions=[3, 3])
+    vertices = box.vertices
+    assert not vertices.flags.writeable
+
+    copied = box.copy()
+    with pytest.raises(ValueError):
+        box.vertices[0] = 1
+    with pytest.raises(ValueError), box.edit() as arrays:
+        arrays.vertices[0] = 1
+    assert box.vertices is vertices
+
+    # private copy of copy is writeable
+    copied.vertices[0] = 1
+    assert np.allclose(copied.vertices[0], 1)
+    assert not np.allclose(box.vertices[0], 1)
+
+
+@pytest.mark.parametrize("grid", ("edges", "faces_quad", "volumes_hexa"))
+def test_copy_on_write(grid, request):
+    grid = request.getfixturevalue(grid)
+    grid.vertex_data["x"] = np.array(grid.vertices[:, 0])
+    centers = grid.centers()
+
+    # deep copy doesn't share
+    copied = grid.copy(deep=True)
+    assert not np.shares_memory(copied.vertices, grid.vertices)
+    assert not np.shares_memory(copied.elements, grid.elements)
+    copied.vertices[1] = 5
+    assert np.allclose(copied.const_vertices[1], 5)
+
+    # shares arrays and computed data
+    copied = grid.copy()
+    assert np.shares_memory(copied.vertices, grid.vertices)
+    assert np.shares_memory(copied.elements, grid.elements)
+    assert np.shares_memory(copied.vertex_data["x"], grid.vertex_data["x"])
+    assert copied.centers() is centers
+
+    # first write of copy makes a private copy
+    copied.vertices[0] = 10
+    assert not np.shares_memory(copied.vertices, grid.vertices)
+    assert np.allclose(copied.const_vertices[0], 10)
+    assert not np.allclose(grid.vertices[0], 10)
+    assert copied.centers() is not centers
+    assert grid.centers() is centers
+
+    # views of shared copies can be modified inplace by assignment
+    copied.elements[:, 0] += 0
+    assert not np.shares_memory(copied.elements, grid.elements)
+    with pytest.raises(ValueError):
+        copied.vertex_data["x"][:, 0][0] = 1
+
+    # first write of original detaches copy and keeps its buffer
+    x = grid.vertex_data["x"]
+    x[0] = -1
+    assert grid.vertex_data["x"] is x
+    assert copied.vertex_data["x"][0] != -1
+    grid.vertices[:, 0] += 1
+    assert np.allclose(grid.const_vertices[1:, 0], copied.vertices[1:, 0] + 1)
+
+    # copies of shared copies share the original's buffer
+    copied = grid.copy()
+    twice = copied.copy()
+    assert np.shares_memory(twice.vertices, grid.vertices)
+    grid.vertices[0] = 3
+    assert not np.allclose(copied.vertices[0], 3)
+    assert not np.allclose(twice.vertices[0], 3)
+
+    # garbage collected copies are not kept track of
+    vertices = grid.vertices
+    for _ in range(10):
+        grid.copy()
+    grid.copy()
+    assert len(vertices._copies) == 1
+
+
+def test_edit(faces_quad):
+    faces = faces_quad
+    centers = faces.centers()
+    shared = faces.copy()
+
+    with faces.edit() as arrays:
+        assert type(arrays.vertices) is np.ndarray
+        assert type(arrays.elements) is np.ndarray
+        arrays.vertices[0] += 1.0
+        arrays.elements[0] = arrays.elements[0, ::-1]
+
+        # untracked while editing
+        assert not faces.vertices.modified
+        assert not faces.elements.modified
+
+    # marked once on exit
+    assert faces.vertices.modified
+    assert faces.elements.modified
+    assert centers is not faces.centers()
+
+    # shared arrays of copy stay untouched
+    assert np.allclose(shared.vertices[0] + 1.0, faces.vertices[0])
+    assert not np.array_equal(shared.elements[0], faces.elements[0])
+
+    vertices = gustaf.Vertices(faces.vertices)
+    with vertices.edit() as arrays:
+        assert arrays.elements is None
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import gustaf as gus
+from gustaf.io import mixd
+
+all_kinds = ("tri", "quad", "tet", "hexa")
+
+
+def box(kind):
+    """structured mesh of given element type, with 3 elements per
+    dimension."""
+    if kind in ("tri", "quad"):
+        mesh = gus.create.faces.box(resolutions=[4, 4])
+        return gus.create.faces.to_simplex(mesh) if kind == "tri" else mesh
+
+    mesh = gus.create.volumes.box(resolutions=[4, 4, 4])
+    return gus.create.volumes.to_simplex(mesh) if kind == "tet" else mesh
+
+
+def unmerged(mesh):
+    """same mesh, but each element has its own vertices."""
+    return type(mesh)(
+        mesh.vertices[mesh.elements.ravel()],
+        np.arange(mesh.elements.size).reshape(mesh.elements.shape),
+    )
+
+
+def read_ints(fname):
+    return np.fromfile(fname, dtype=">i")
+
+
+@pytest.mark.parametrize("kind", all_kinds)
+def test_dual(kind):
+    mesh = box(kind)
+    mrng = mixd.make_mrng(mesh)
+
+    topological = mixd._topological_dual(mesh, mrng.copy())
+    geometric = mixd._geometric_dual(mesh, mrng.copy())
+    assert np.array_equal(topological, geometric)
+
+    # inner sub-elements point to their neighbor, which points back
+    assert (topological < 0).any()
+    neighbors = -topological.reshape(len(mesh.elements), -1) - 1
+    for element, element_neighbors in enumerate(neighbors):
+        for neighbor in element_neighbors[element_neighbors > -1]:
+            assert element in neighbors[neighbor]
+
+
+@pytest.mark.parametrize("kind", all_kinds)
+def test_export_dual(kind, tmp_path):
+    mesh = box(kind)
+    mixd.export(str(tmp_path / "conforming.xns"), mesh, dual=True)
+    mixd.export(
+        str(tmp_path / "geometric.xns"), mesh, dual=True, conforming=False
+    )
+
+    # mrng is written before dual is filled
+    mrng = read_ints(tmp_path / "conforming.mrng")
+    assert np.array_equal(mrng, mixd.make_mrng(mesh))
+
+    dual = read_ints(tmp_path / "conforming.dual")
+    assert np.array_equal(dual, read_ints(tmp_path / "geometric.dual"))
+    assert np.array_equal(dual, mixd._geometric_dual(mesh, mrng.copy()))
+
+    # unmerged vertices: only geometric dual finds neighbors
+    separated = unmerged(mesh)
+    mixd.export(str(tmp_path / "separated.xns"), separated, dual=True)
+    assert not read_ints(tmp_path / "separated.dual").any()
+
+    mixd.export(
+        str(tmp_path / "separated.xns"),
+        separated,
+        dual=True,
+        conforming=False,
+    )
+    assert np.array_equal(read_ints(tmp_path / "separated.dual"), dual)
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+import gustaf as gus
+
+
+@pytest.fixture
+def hybrid():
+    """unit hexa with a pyramid on top and a prism next to it."""
+    vertices = [
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, 0.0, 1.0],
+        [1.0, 0.0, 1.0],
+        [1.0, 1.0, 1.0],
+        [0.0, 1.0, 1.0],
+        [0.5, 0.5, 2.0],
+        [2.0, 0.0, 0.0],
+        [2.0, 0.0, 1.0],
+    ]
+    return gus.Mixed.from_blocks(
+        vertices,
+        {
+            "hexa": [[0, 1, 2, 3, 4, 5, 6, 7]],
+            "pyramid": [[4, 5, 6, 7, 8]],
+            "prism": [[1, 9, 2, 5, 10, 6]],
+        },
+    )
+
+
+def test_mixed_layout(hybrid):
+    assert len(hybrid.cell_types) == 3
+    assert hybrid.offsets.tolist() == [0, 8, 13, 19]
+    assert np.allclose(
+        hybrid.centers(),
+        [[0.5, 0.5, 0.5], [0.5, 0.5, 1.2], [4 / 3, 1 / 3, 0.5]],
+    )
+
+    # vertices are shared, not copied per block
+    blocks = hybrid.blocks()
+    assert set(blocks.keys()) == {"hexa", "pyramid", "prism"}
+    for ids, elements in blocks.values():
+        assert len(ids) == len(elements) == 1
+
+
+def test_mixed_topology(hybrid):
+    # 12 + 8 + 9 edges, 4 of them are shared twice
+    assert len(hybrid.edges()) == 29
+    assert len(hybrid.unique_edges().values) == 21
+
+    unique_faces = hybrid.unique_faces()
+    assert len(unique_faces["quad"].values) == 8
+    assert len(unique_faces["tri"].values) == 6
+
+    # closed surface, oriented outwards: volume from divergence theorem
+    volume = 0.0
+    for face_type, ids in hybrid.single_faces().items():
+        faces = hybrid.faces()[face_type][ids]
+        triangles = (
+            [[0, 1, 2]] if face_type == "tri" else [[0, 1, 2], [0, 2, 3]]
+        )
+        for tri in triangles:
+            v = hybrid.vertices[faces[:, tri]]
+            volume += np.einsum(
+                "ij,ij->i", v[:, 0], np.cross(v[:, 1], v[:, 2])
+            ).sum()
+    assert np.isclose(volume / 6, 1 + 1 / 3 + 1 / 2)
+
+
+def test_mixed_updates(hybrid):
+    # modify cells -> computed data is refreshed
+    n_unique = len(hybrid.unique_edges().values)
+    hybrid.update_elements([0, 2])
+    assert len(hybrid.vertices) == 10
+    assert len(hybrid.unique_edges().values) < n_unique
+    assert hybrid.offsets.tolist() == [0, 8, 14]
+
+    # removing a vertex removes cells that reference it
+    hybrid.remove_vertices([9])
+    assert len(hybrid.cell_types) == 1
+    assert len(hybrid.vertices) == 9
+
+    # concat and round trip through meshes
+    two = hybrid + hybrid
+    assert len(two.vertices) == 18
+    assert len(two.cell_types) == 2
+    meshes = two.to_meshes()
+    assert len(meshes) == 1
+    assert isinstance(meshes[0], gus.Volumes)
+    assert len(gus.Mixed.from_meshes(meshes).cell_types) == 2
+
+
+def test_mixed_concat_vertex_data(hybrid):
+    other = hybrid.copy()
+    hybrid.vertex_data["x"] = hybrid.vertices[:, 0]
+    hybrid.vertex_data["only"] = hybrid.vertices[:, 1]
+    other.vertex_data["x"] = other.vertices[:, 0] + 10
+
+    two = gus.Mixed.concat(hybrid, other)
+    assert set(two.vertex_data.keys()) == {"x"}
+    assert np.allclose(
+        two.vertex_data["x"].ravel(),
+        np.concatenate((hybrid.vertices[:, 0], other.vertices[:, 0] + 10)),
+    )
+
+
+@pytest.mark.parametrize("method", ("rcm", "hilbert", "morton"))
+def test_mixed_reorder(hybrid, method, np_rng):
+    """reorder should keep geometry of each cell and vertex_data"""
+    hybrid.vertex_data["coordinates"] = hybrid.vertices
+    hybrid.update_vertices(np_rng.permutation(len(hybrid.vertices)))
+
+    vertices = hybrid.vertices.copy()
+    blocks = {
+        ct: (ids, elements.copy())
+        for ct, (ids, elements) in hybrid.blocks().items()
+    }
+    cell_types = hybrid.cell_types.copy()
+
+    vertex_order, cell_order = hybrid.reorder(method)
+
+    assert np.allclose(hybrid.vertices, vertices[vertex_order])
+    assert np.allclose(hybrid.vertex_data["coordinates"], hybrid.vertices)
+    assert np.array_equal(hybrid.cell_types, cell_types[cell_order])
+
+    # each cell keeps its vertices
+    for ct, (ids, elements) in hybrid.blocks().items():
+        old_ids, old_elements = blocks[ct]
+        old = dict(zip(old_ids, vertices[old_elements]))
+        for i, element in zip(ids, elements):
+            assert np.allclose(hybrid.vertices[element], old[cell_order[i]])
+
+
+def test_mixed_dependees():
+    # same connectivity, read as one hexa or two quads
+    mixed = gus.Mixed(np.eye(8, 3), np.arange(8), cell_types=[6])
+    assert len(mixed.unique_edges().values) == 12
+
+    # reading elements doesn't change modification flags
+    mixed.cell_types = [2, 2]
+    mixed.elements  # noqa: B018
+    assert mixed.cell_types.modified
+    assert not mixed.elements.modified
+
+    # offsets and cell_types are dependees
+    mixed.offsets = [0, 4, 8]
+    assert len(mixed.unique_edges().values) == 8
+    assert not mixed.offsets.modified
+    assert not mixed.cell_types.modified
+
+
+@pytest.mark.skipif(gus.mixed.has_vtk, reason="vtk is installed")
+def test_mixed_show_without_vtk(hybrid):
+    with pytest.raises(ImportError, match="vtk"):
+        hybrid.show_options._initialize_showable()
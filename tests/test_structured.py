@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import gustaf as gus
+
+
+@pytest.mark.parametrize(
+    "bounds, resolutions",
+    (
+        ([[0.0, 0.0], [1.0, 2.0]], [4, 3]),
+        ([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]], [4, 3, 5]),
+    ),
+)
+def test_structured_grid(bounds, resolutions, np_rng):
+    """structured grid should match box"""
+    grid = gus.StructuredGrid(bounds, resolutions)
+    is_volume = len(resolutions) == 3
+    create = gus.create.volumes if is_volume else gus.create.faces
+    box = create.box(bounds, resolutions)
+
+    # nothing is materialized yet
+    assert grid._vertices is None
+    assert grid._elements is None
+    assert np.allclose(grid.centers(), box.centers())
+    ids = np_rng.integers(0, len(box.elements), 10)
+    assert np.array_equal(grid.elements_of(ids), box.elements[ids])
+    assert np.allclose(grid.centers(ids), box.centers()[ids])
+    assert grid._elements is None
+
+    if is_volume:
+        single = grid.single_faces()
+        expected = box.single_faces()
+    else:
+        single = grid.single_edges()
+        expected = box.single_edges()
+    assert np.array_equal(single, np.sort(expected))
+
+    # locate random points
+    points = np_rng.random((50, len(resolutions))) * box.bounds()[1]
+    element_ids = grid.locate(points)
+    element_vertices = box.vertices[box.elements[element_ids]]
+    assert (points >= element_vertices.min(axis=1)).all()
+    assert (points <= element_vertices.max(axis=1)).all()
+    assert grid.locate(-np.ones((1, len(resolutions))))[0] == -1
+
+    # materialized
+    assert np.allclose(grid.vertices, box.vertices)
+    assert np.array_equal(grid.elements, box.elements)
+    assert type(grid.to_mesh()) is type(box)
+
+
+def test_structured_grid_coordinates():
+    grid = gus.StructuredGrid(coordinates=[[0.0, 0.1, 1.0], [0.0, 2.0]])
+    assert grid.n_vertices == 6
+    assert grid.n_elements == 2
+    assert np.allclose(grid.centers(), [[0.05, 1.0], [0.55, 1.0]])
+    assert grid.locate([[0.5, 1.0], [0.05, 0.0]]).tolist() == [1, 0]
+
+    with pytest.raises(ValueError):
+        gus.StructuredGrid(coordinates=[[0.0, 1.0, 0.5], [0.0, 1.0]])
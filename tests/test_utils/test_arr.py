@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import gustaf as gus
+
+
+@pytest.mark.parametrize("dim", (1, 2, 3))
+@pytest.mark.parametrize("tolerance", (0.0, 1e-10, 1e-2))
+def test_close_rows_spatial_hash(dim, tolerance, np_rng, monkeypatch):
+    spatial = pytest.importorskip("scipy.spatial")
+
+    # random points, close points, duplicates and lattice on cell faces
+    points = np_rng.random((300, dim))
+    points = np.vstack(
+        (
+            points,
+            points[:100] + tolerance * 0.3,
+            points[:50],
+            np.stack(
+                np.meshgrid(*[np.linspace(0, 1, 5)] * dim), axis=-1
+            ).reshape(-1, dim),
+        )
+    )
+
+    # reference - radius search
+    neighbors = spatial.cKDTree(points).query_ball_point(
+        points, tolerance, return_sorted=True
+    )
+    _, ids, inverse = np.unique(
+        [n[0] for n in neighbors], return_index=True, return_inverse=True
+    )
+
+    monkeypatch.setattr(gus.utils.arr, "has_funi", False)
+    monkeypatch.setattr(gus.utils.arr, "has_napf", False)
+    values, h_ids, h_inverse, h_neighbors = gus.utils.arr.close_rows(
+        points, tolerance, return_intersection=True
+    )
+
+    assert np.array_equal(ids, h_ids)
+    assert np.array_equal(inverse, h_inverse)
+    assert np.array_equal(values, points[ids])
+    for n, h_n in zip(neighbors, h_neighbors):
+        assert np.array_equal(n, h_n)
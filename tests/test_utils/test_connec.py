@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import gustaf as gus
 
@@ -371,6 +372,82 @@ def test_faces_to_edges():
     assert (gus.utils.connec.faces_to_edges(query) == expected).all()
 
 
+def test_volumes_to_edges():
+    query = randint(0, 1000, (100, 8))
+    edges = gus.utils.connec.volumes_to_edges(query)
+
+    # one edge per hexa edge, no duplicates from faces
+    assert edges.shape == (100 * 12, 2)
+    assert (
+        edges[:12] == query[0][gus.utils.connec._REFERENCE_EDGES["hexa"]]
+    ).all()
+
+    # same unique edges as going through faces
+    unique_direct = np.unique(np.sort(edges, axis=1), axis=0)
+    faces = gus.utils.connec.hexa_to_quad(query)
+    unique_faces = np.unique(
+        np.sort(gus.utils.connec.faces_to_edges(faces), axis=1), axis=0
+    )
+    assert (unique_direct == unique_faces).all()
+
+
+@pytest.mark.parametrize(
+    "element_type, vertices",
+    [
+        ("tet", [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]]),
+        (
+            "pyramid",
+            [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 1]],
+        ),
+        (
+            "prism",
+            [
+                [0, 0, 0],
+                [1, 0, 0],
+                [0, 1, 0],
+                [0, 0, 1],
+                [1, 0, 1],
+                [0, 1, 1],
+            ],
+        ),
+        (
+            "hexa",
+            gus.create.vertices.raster(
+                [[0, 0, 0], [1, 1, 1]], [2, 2, 2]
+            ).vertices[[0, 1, 3, 2, 4, 5, 7, 6]],
+        ),
+    ],
+)
+def test_to_subelements_orientation(element_type, vertices):
+    """Faces of reference elements should point outwards and edges should
+    be unique."""
+    vertices = np.asarray(vertices, dtype="float64")
+    element = np.arange(len(vertices)).reshape(1, -1)
+    center = vertices.mean(axis=0)
+
+    n_faces = 0
+    for face_type in ("tri", "quad"):
+        if face_type not in gus.utils.connec._REFERENCE_FACES[element_type]:
+            continue
+        faces = gus.utils.connec.to_subelements(
+            element, element_type, face_type
+        )
+        n_faces += len(faces)
+        for f in faces:
+            v = vertices[f]
+            normal = np.cross(v[1] - v[0], v[2] - v[0])
+            assert np.dot(normal, v.mean(axis=0) - center) > 0
+
+    edges = gus.utils.connec.to_subelements(element, element_type, "edges")
+    assert len(np.unique(np.sort(edges, axis=1), axis=0)) == len(edges)
+
+    # euler characteristic of a closed surface
+    assert len(vertices) - len(edges) + n_faces == 2
+
+    with pytest.raises(ValueError):
+        gus.utils.connec.to_subelements(element[:, :-1], element_type, "edges")
+
+
 def test_make_quad_faces():
     """
     checks against reference value. Feel free to extend!
@@ -392,3 +469,243 @@ def test_make_hexa_volumes():
     assert (
         gus.utils.connec.make_hexa_volumes([5, 7, 3]) == hexa_volume_5_7_3()
     ).all()
+
+
+def test_sequentialize_edges_junctions():
+    # star shaped junction at 1 and a loop that starts and ends at 3
+    edges = [[0, 1], [1, 2], [1, 3], [3, 4], [4, 5], [5, 3], [7, 8], [8, 7]]
+    seq, is_p = gus.utils.connec.sequentialize_edges(edges, directed=False)
+    assert seq == [[0, 1], [1, 2], [1, 3], [3, 4, 5], [7, 8]]
+    assert is_p == [False, False, False, True, True]
+
+    # return edges
+    seq_edges, is_p = gus.utils.connec.sequentialize_edges(
+        edges, return_edges=True, directed=False
+    )
+    for s, s_edges, ip in zip(seq, seq_edges, is_p):
+        assert (
+            gus.utils.connec.sequence_to_edges(s, closed=ip) == s_edges
+        ).all()
+
+    # specified start
+    seq, is_p = gus.utils.connec.sequentialize_edges(
+        one_polygon(), start=3, directed=False
+    )
+    assert is_p[0]
+    assert seq[0] == [3, 4, 5, 0, 1, 2]
+
+
+def test_sequentialize_edges_flat():
+    edges = [[0, 1], [1, 2], [2, 0], [5, 6], [6, 7], [3, 4]]
+    for directed in (True, False):
+        seq, offsets, is_p = gus.utils.connec.sequentialize_edges(
+            edges, directed=directed, flat=True
+        )
+        assert (seq == [0, 1, 2, 3, 4, 5, 6, 7]).all()
+        assert (offsets == [0, 3, 5, 8]).all()
+        assert (is_p == [True, False, False]).all()
+
+        # flat edges should match list of edges
+        seq_edges, edge_offsets, _ = gus.utils.connec.sequentialize_edges(
+            edges, directed=directed, flat=True, return_edges=True
+        )
+        ref, _ = gus.utils.connec.sequentialize_edges(
+            edges, directed=directed, return_edges=True
+        )
+        assert (seq_edges == np.vstack(ref)).all()
+        assert (edge_offsets == [0, 3, 4, 6]).all()
+
+        # empty input
+        seq, is_p = gus.utils.connec.sequentialize_edges([], directed=directed)
+        assert seq == is_p == []
+
+
+def test_vertex_to_element():
+    elements = randint(0, 50, (100, 4))
+    adjacency = gus.utils.connec.vertex_to_element(elements)
+    assert len(adjacency.offsets) == elements.max() + 2
+
+    for i in range(elements.max() + 1):
+        ref = np.where(elements == i)[0]
+        assert (
+            adjacency.indices[adjacency.offsets[i] : adjacency.offsets[i + 1]]
+            == ref
+        ).all()
+
+
+def test_vertex_to_vertex():
+    edges = gus.utils.connec.faces_to_edges(np.asarray(quad_face_3_4()))
+    unique_edges = gus.utils.connec.sorted_unique(edges).values
+    adjacency = gus.utils.connec.vertex_to_vertex(unique_edges)
+
+    for i in range(edges.max() + 1):
+        ref = np.unique(unique_edges[(unique_edges == i).any(axis=1)].ravel())
+        ref = ref[ref != i]
+        assert (
+            adjacency.indices[adjacency.offsets[i] : adjacency.offsets[i + 1]]
+            == ref
+        ).all()
+
+
+@pytest.mark.parametrize(
+    "bounds, n_cols, packed",
+    (
+        ((0, 10), 2, True),
+        ((-5, 1000), 4, True),
+        ((-(2**31), 2**31 - 1), 2, False),
+        ((-(2**20), 2**20), 8, False),
+    ),
+)
+@pytest.mark.parametrize("sorted_", (False, True))
+def test_sorted_unique(bounds, n_cols, packed, sorted_, np_rng):
+    low, high = bounds
+
+    # all rows of a small pool and duplicates, with bounds included
+    pool = np_rng.integers(low, high, (30, n_cols))
+    pool[0, 0] = low
+    pool[1, -1] = high - 1
+    rows = np.append(np.arange(len(pool)), np_rng.integers(0, len(pool), 170))
+    connectivity = pool[np_rng.permutation(rows)]
+    if sorted_:
+        connectivity = np.sort(connectivity, axis=1)
+
+    # make sure both, packed keys and lexsort are tested
+    base = int(connectivity.max()) - int(connectivity.min()) + 1
+    assert (base**n_cols < np.iinfo(np.int64).max) == packed
+
+    unique = gus.utils.connec.sorted_unique(connectivity, sorted_=sorted_)
+    values, ids, inverse, counts = np.unique(
+        np.sort(connectivity, axis=1),
+        axis=0,
+        return_index=True,
+        return_inverse=True,
+        return_counts=True,
+    )
+
+    assert np.array_equal(unique.values, values)
+    assert np.array_equal(unique.ids, ids)
+    assert np.array_equal(unique.inverse, inverse.ravel())
+    assert np.array_equal(unique.counts, counts)
+
+
+def test_element_neighbors():
+    # structured hexa - neighbors can be derived from the grid index
+    res = [4, 8, 2]
+    hexa = np.asarray(hexa_volume_4_8_2())
+    faces = gus.utils.connec.hexa_to_quad(hexa)
+    unique_info = gus.utils.connec.sorted_unique(faces)
+    neighbors = gus.utils.connec.element_neighbors(
+        unique_info.inverse, unique_info.counts, 6
+    )
+    assert neighbors.shape == (len(hexa), 6)
+
+    n_e = [r - 1 for r in res]
+    ids = np.arange(len(hexa)).reshape(n_e[::-1])
+    # face ordering follows hexa_to_quad: -z, -y, +x, +y, -x, +z
+    shifts = [(0, 0, -1), (0, -1, 0), (1, 0, 0), (0, 1, 0), (-1, 0, 0)]
+    shifts.append((0, 0, 1))
+    for x, y, z in np.ndindex(*n_e):
+        elem = ids[z, y, x]
+        for j, (dx, dy, dz) in enumerate(shifts):
+            nx, ny, nz = x + dx, y + dy, z + dz
+            inside = 0 <= nx < n_e[0] and 0 <= ny < n_e[1] and 0 <= nz < n_e[2]
+            ref = ids[nz, ny, nx] if inside else -1
+            assert neighbors[elem, j] == ref
+
+
+def test_connected_components():
+    # 0-1-6, 2-3-4, 5, 7 isolated
+    edges = [[0, 1], [2, 3], [3, 4], [6, 1]]
+    labels = gus.utils.connec.connected_components(edges, 8)
+    assert labels.tolist() == [0, 0, 1, 1, 1, 2, 0, 3]
+
+    # shuffled path is one component
+    path = np.arange(1000)
+    shuffle(path)
+    labels = gus.utils.connec.connected_components(
+        np.column_stack((path[:-1], path[1:]))
+    )
+    assert (labels == 0).all()
+
+
+def test_reverse_cuthill_mckee():
+    # shuffled path: rcm recovers bandwidth of 1
+    n = 100
+    path = np.arange(n)
+    shuffle(path)
+    edges = np.column_stack((path[:-1], path[1:]))
+    assert gus.utils.connec.bandwidth(edges)[0] > 1
+
+    adjacency = gus.utils.connec.vertex_to_vertex(edges, n + 2)
+    order = gus.utils.connec.reverse_cuthill_mckee(adjacency)
+    assert np.array_equal(np.sort(order), np.arange(n + 2))
+    # isolated vertices at the end
+    assert set(order[-2:]) == {n, n + 1}
+
+    new_ids = np.argsort(order)
+    assert gus.utils.connec.bandwidth(new_ids[edges]) == (1, n - 1)
+
+
+@pytest.mark.parametrize("scheme", ("6tet", "5tet"))
+def test_hexa_to_tet(scheme):
+    # every split of unit hexa, for all possible orders of vertex ids
+    corners = np.array(
+        [
+            [0, 0, 0],
+            [1, 0, 0],
+            [1, 1, 0],
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 0, 1],
+            [1, 1, 1],
+            [0, 1, 1],
+        ]
+    )
+    hexas = np.array(
+        [np.random.default_rng(i).permutation(8) for i in range(500)]
+    )
+    mirror = np.arange(len(hexas)) % 2 == 1
+    tets, parents, tet_faces = gus.utils.connec.hexa_to_tet(
+        hexas, scheme=scheme, mirror=mirror
+    )
+
+    # positive volumes that fill each hexa
+    coordinates = np.empty((8, 3))
+    for hexa_id, hexa in enumerate(hexas):
+        coordinates[hexa] = corners
+        v = coordinates[tets[parents == hexa_id]]
+        volumes = np.linalg.det(v[:, 1:] - v[:, :1]) / 6
+        assert (volumes > 0).all()
+        assert np.isclose(volumes.sum(), 1)
+
+    # each hexa face is covered by two tet faces
+    counts = np.bincount(
+        (parents.reshape(-1, 1) * 6 + tet_faces)[tet_faces >= 0]
+    )
+    assert (counts == 2).all()
+    assert len(counts) == len(hexas) * 6
+
+
+def test_two_coloring():
+    # 4 x 3 grid of quads
+    neighbors = gus.create.faces.box(resolutions=[5, 4]).element_neighbors()
+    is_neighbor = neighbors >= 0
+    offsets = np.concatenate(([0], np.cumsum(is_neighbor.sum(axis=1))))
+    colors = gus.utils.connec.two_coloring(
+        gus.helpers.data.Adjacency(offsets, neighbors[is_neighbor])
+    )
+    rows, cols = np.divmod(np.arange(12), 4)
+    assert np.array_equal(colors, (rows + cols) % 2 == 1)
+
+
+def test_reference_subelements():
+    assert gus.utils.connec.reference_n_nodes("pyramid") == 5
+    tables = gus.utils.connec.reference_subelements("prism")
+    assert set(tables.keys()) == {"edges", "tri", "quad"}
+    assert tables["edges"].shape == (9, 2)
+    assert tables["tri"].shape == (2, 3)
+    assert tables["quad"].shape == (3, 4)
+    assert set(gus.utils.connec.reference_subelements("tri")) == {"edges"}
+
+    with pytest.raises(ValueError):
+        gus.utils.connec.reference_subelements("polygon")
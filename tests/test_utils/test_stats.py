@@ -0,0 +1,39 @@
+import gustaf as gus
+
+
+def test_stats_report(volumes_hexa, capsys):
+    volumes = volumes_hexa
+    gus.utils.stats.reset()
+
+    # disabled by default
+    volumes.unique_faces()
+    assert gus.utils.stats.collect() == {}
+
+    with gus.utils.stats.report() as stats:
+        volumes.centers()
+        volumes.centers()
+        volumes.unique_faces()
+        volumes.elements[0] = volumes.elements[0]
+        volumes.unique_faces()
+
+    assert not gus.settings.COMPUTED_STATS
+    assert "Volumes.unique_faces" in capsys.readouterr().out
+
+    centers = stats["Volumes.centers"]
+    assert (centers["hits"], centers["misses"]) == (1, 1)
+    assert centers["nbytes"] == volumes.centers().nbytes
+    assert centers["time"] > 0
+
+    # an innocent assignment invalidates
+    unique_faces = stats["Volumes.unique_faces"]
+    assert (unique_faces["hits"], unique_faces["misses"]) == (1, 1)
+    assert unique_faces["invalidations"] == 1
+    assert unique_faces["invalidated_by"] == {"elements": 1}
+
+    # per object and global
+    assert "centers" in gus.utils.stats.collect(volumes)
+    assert gus.utils.stats.collect()["Volumes.centers"]["misses"] == 1
+    gus.utils.stats.reset(volumes)
+    assert gus.utils.stats.collect(volumes) == {}
+    gus.utils.stats.reset()
+    assert gus.utils.stats.collect() == {}
@@ -246,3 +246,276 @@ def test_update_elements(grid, np_rng, request):
         test_grid.vertices[leftover_vertex_ids],
         grid.vertices[leftover_vertex_ids_ref],
     )
+
+
+@pytest.mark.parametrize("grid", update_elements_params)
+def test_remap_computed(grid, np_rng, request, monkeypatch):
+    """remapped computed data should match fresh computations"""
+    grid = request.getfixturevalue(grid)
+
+    # count remaps
+    remaps = []
+    remap_computed = type(grid)._remap_computed
+
+    def counted_remap(self, *args):
+        remaps.append(args)
+        return remap_computed(self, *args)
+
+    monkeypatch.setattr(type(grid), "_remap_computed", counted_remap)
+
+    keys = ["centers", "sorted_edges", "unique_edges"]
+    if grid.kind == "volume":
+        keys.extend(("faces", "sorted_faces", "unique_faces"))
+    elif grid.kind == "face":
+        keys.append("edges")
+
+    # keep 3 elements or remove a vertex
+    element_mask = np.sort(np_rng.choice(len(grid.elements), 3, replace=False))
+    vertex_mask = np.ones(len(grid.vertices), dtype=bool)
+    vertex_mask[grid.elements[0, 0]] = False
+
+    for update, mask in (
+        ("update_elements", element_mask),
+        ("update_vertices", vertex_mask),
+    ):
+        test_grid = grid.copy()
+        for key in keys:
+            getattr(test_grid, key)()
+        remaps.clear()
+        getattr(test_grid, update)(mask)
+        assert len(remaps) == 1
+
+        # remapped, instead of being cleared
+        assert set(keys).issubset(test_grid._computed._saved.keys())
+
+        fresh = type(test_grid)(test_grid.vertices, test_grid.elements)
+        for key in keys:
+            value = getattr(test_grid, key)()
+            ref = getattr(fresh, key)()
+            if key.startswith("unique"):
+                for v, r in zip(value, ref):
+                    assert np.array_equal(v, r)
+            else:
+                assert np.allclose(value, ref)
+
+
+@pytest.mark.parametrize("grid", all_grids[1:])
+def test_subdivide(grid, request):
+    """subdivide should conform and interpolate vertex_data"""
+    grid = request.getfixturevalue(grid)
+    grid.vertex_data["coordinates"] = grid.vertices
+
+    n_children = {"edges": 2, "tri": 4, "quad": 4, "tet": 8, "hexa": 8}
+    n_c = n_children[grid.whatami]
+
+    levels = 2
+    subdivided = grid.subdivide(levels=levels)
+    assert len(subdivided.elements) == len(grid.elements) * n_c**levels
+
+    # no duplicating vertices
+    assert len(subdivided.unique_vertices().ids) == len(subdivided.vertices)
+
+    # linear data is exact at new vertices
+    assert np.allclose(
+        subdivided.vertex_data["coordinates"], subdivided.vertices
+    )
+
+    # same centroid and orientation for volumes
+    assert np.allclose(
+        subdivided.centers().mean(axis=0), grid.centers().mean(axis=0)
+    )
+    if grid.kind == "volume":
+        # surface of closed cube is split as well
+        assert len(subdivided.single_faces()) == (
+            len(grid.single_faces()) * 4**levels
+        )
+        ref = subdivided.vertices[subdivided.volumes]
+        if grid.whatami == "tet":
+            signed = np.einsum(
+                "ij,ij->i",
+                np.cross(ref[:, 1] - ref[:, 0], ref[:, 2] - ref[:, 0]),
+                ref[:, 3] - ref[:, 0],
+            )
+            orig = grid.vertices[grid.volumes]
+            orig_signed = np.einsum(
+                "ij,ij->i",
+                np.cross(orig[:, 1] - orig[:, 0], orig[:, 2] - orig[:, 0]),
+                orig[:, 3] - orig[:, 0],
+            )
+            assert np.allclose(
+                np.repeat(np.sign(orig_signed), n_c**levels), np.sign(signed)
+            )
+
+
+@pytest.mark.parametrize("grid", all_grids[1:])
+def test_split(grid, request):
+    """two copies, touching at one vertex, should split into two"""
+    grid = request.getfixturevalue(grid)
+    grid.vertex_data["coordinates"] = grid.vertices
+
+    shifted = grid.copy()
+    shifted.vertices = shifted.vertices + shifted.bounds_diagonal()
+    shifted.vertex_data["coordinates"] = shifted.vertices
+    combined = type(grid).concat(grid, shifted).merge_vertices()
+    combined.vertex_data["coordinates"] = combined.vertices
+
+    n_elements = len(grid.elements)
+    expected = np.repeat([0, 1], n_elements)
+
+    # they share a vertex
+    assert (combined.connected_components() == 0).all()
+    if grid.kind == "edge":
+        return
+
+    assert (combined.connected_components(via="subelements") == expected).all()
+
+    components = combined.split(via="subelements")
+    assert len(components) == 2
+    for component, original in zip(components, (grid, shifted)):
+        assert len(component.vertices) == len(original.vertices)
+        assert np.allclose(component.centers(), original.centers())
+        assert np.allclose(
+            component.vertex_data["coordinates"], component.vertices
+        )
+
+
+@pytest.mark.parametrize("method", ("rcm", "hilbert", "morton"))
+@pytest.mark.parametrize("grid", (*all_grids, "volumes_hexa333"))
+def test_reorder(grid, method, np_rng, request):
+    """reorder should keep geometry, vertex_data and BC"""
+    grid = request.getfixturevalue(grid)
+    grid.vertex_data["coordinates"] = grid.vertices
+    grid.update_vertices(np_rng.permutation(len(grid.vertices)))
+
+    if grid.kind == "vertex":
+        if method == "rcm":
+            with pytest.raises(ValueError):
+                grid.reorder(method)
+            return
+        original = grid.vertices.copy()
+        vertex_order, element_order = grid.reorder(method)
+        assert element_order is None
+        assert np.allclose(grid.vertices, original[vertex_order])
+        return
+
+    has_bc = grid.kind != "edge"
+    if has_bc:
+        boundary = grid.__boundary_class__.__qualname__.lower()
+        grid.BC = {"b": np.array([0, 3])}
+        bc_before = grid.vertices[grid._get_attr(boundary)[grid.BC["b"]]]
+
+    original_vertices = grid.vertices.copy()
+    original_elements = grid.elements.copy()
+    bandwidth_before = grid.bandwidth()
+
+    vertex_order, element_order = grid.reorder(method)
+
+    # geometry stays the same
+    assert np.allclose(grid.vertices, original_vertices[vertex_order])
+    assert np.allclose(
+        grid.vertices[grid.elements],
+        original_vertices[original_elements[element_order]],
+    )
+    assert np.allclose(grid.vertex_data["coordinates"], grid.vertices)
+
+    if has_bc:
+        bc_after = grid.vertices[grid._get_attr(boundary)[grid.BC["b"]]]
+        assert np.allclose(bc_before, bc_after)
+
+    # randomly numbered 3x3x3 grid has bandwidth close to 26
+    if method == "rcm" and len(grid.vertices) == 27:
+        assert grid.bandwidth()[0] < bandwidth_before[0]
+
+
+@pytest.mark.parametrize(
+    "scheme, alternate, n_tets",
+    (("6tet", False, None), ("5tet", True, 5), ("6tet", True, None)),
+)
+def test_hexa_to_simplex(scheme, alternate, n_tets, np_rng):
+    hexa = gus.create.volumes.box(resolutions=[4, 5, 3])
+
+    # shuffle vertex ids, so that face diagonals vary
+    order = np_rng.permutation(len(hexa.vertices))
+    hexa = gus.Volumes(hexa.vertices[order], np.argsort(order)[hexa.volumes])
+    hexa.BC = {"half": hexa.single_faces()[::2]}
+
+    tet = gus.create.volumes.to_simplex(hexa, scheme, alternate)
+    assert tet.whatami == "tet"
+    if n_tets is not None:
+        assert len(tet.volumes) == n_tets * len(hexa.volumes)
+
+    v = tet.vertices[tet.volumes]
+    volumes = np.linalg.det(v[:, 1:] - v[:, :1]) / 6
+    assert (volumes > 0).all()
+    assert np.isclose(volumes.sum(), 1)
+
+    # conforming: only boundary quads are single, each as two triangles
+    assert tet.unique_faces().counts.max() == 2
+    assert len(tet.single_faces()) == 2 * len(hexa.single_faces())
+
+    # BC maps to boundary triangles on the same planes
+    assert len(tet.BC["half"]) == 2 * len(hexa.BC["half"])
+    assert np.isin(tet.BC["half"], tet.single_faces()).all()
+    assert np.array_equal(
+        np.unique(tet.faces()[tet.BC["half"]]),
+        np.unique(hexa.faces()[hexa.BC["half"]]),
+    )
+
+
+@pytest.mark.parametrize("scheme", (None, "6tet"))
+def test_normals(scheme):
+    volumes = gus.create.volumes.box(resolutions=[3, 4, 5])
+    if scheme is not None:
+        volumes = gus.create.volumes.to_simplex(volumes, scheme)
+    surface = volumes.to_faces(unique=False)
+    surface.faces = surface.faces[volumes.single_faces()]
+    n_vertices = len(surface.vertices)
+
+    # outwards
+    face_normals = surface.face_normals()
+    assert np.allclose(np.linalg.norm(face_normals, axis=1), 1)
+    assert (
+        np.einsum("ij,ij->i", face_normals, surface.centers() - 0.5) > 0
+    ).all()
+
+    # cached and faces are not modified
+    vertex_normals = surface.vertex_normals()
+    assert surface.vertex_normals() is vertex_normals
+    assert len(surface.vertices) == n_vertices
+
+    # unreferenced vertex (center) is zero, others are unit
+    referenced = surface.referenced_vertices()
+    assert not referenced.all()
+    assert np.allclose(vertex_normals[~referenced], 0)
+    assert np.allclose(np.linalg.norm(vertex_normals[referenced], axis=1), 1)
+
+    # each corner has three perpendicular faces of 90 degrees
+    corner = surface.vertex_normals(angle_weighting=True)[0]
+    assert np.allclose(corner, -np.ones(3) / np.sqrt(3))
+
+    # recomputed after vertex update
+    surface.vertices = surface.vertices * [1, 1, -1]
+    assert not np.allclose(surface.vertex_normals()[0], vertex_normals[0])
+
+
+@pytest.mark.parametrize("merge", (False, True))
+def test_dashed(merge):
+    # L shape with lengths 3 and 1, and a zero length edge
+    edges = gus.Edges(
+        [[0.0, 0.0], [3.0, 0.0], [3.0, 1.0]], [[0, 1], [1, 2], [2, 2]]
+    )
+    dashed = edges.dashed(spacing=1.0, merge=merge)
+
+    # (3 // 1.5 + 1) + (1 // 1.5 + 1) + 1 dashes
+    assert len(dashed.edges) == 3 + 1 + 1
+    lengths = np.linalg.norm(
+        np.diff(dashed.vertices[dashed.edges], axis=1), axis=(1, 2)
+    )
+    assert np.allclose(lengths, [3 * 2 / 8] * 3 + [1, 0])
+
+    if merge:
+        # 3 original vertices and inner points of the first edge
+        assert len(dashed.vertices) == 3 + 4
+        assert dashed.edges[2, 1] == dashed.edges[3, 0]
+    else:
+        assert len(dashed.vertices) == 2 * len(dashed.edges)